@@ -0,0 +1,33 @@
+"""
+Gunicorn configuration for serving the Job Search API.
+
+Runs several uvicorn workers so CPU-bound work (embeddings, NER extraction)
+is spread across cores. Usage:
+
+    gunicorn -c gunicorn_conf.py app:app
+"""
+
+import os
+import sys
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# The embedding and NER models load lazily inside each worker, after the fork,
+# so every worker holds its own copy. One worker per core keeps that memory and
+# the model compute proportional to the machine; override with WEB_CONCURRENCY
+workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app once in the master so workers share its modules copy-on-write
+# (not the models, see above); MongoDB connections are still opened per worker
+# by the FastAPI lifespan
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Split the cores between workers so torch does not oversubscribe them"""
+    threads = os.environ.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // workers)))
+    # torch reads OMP_NUM_THREADS on import; if preloading already imported it, set it directly
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(int(threads))
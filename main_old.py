@@ -6,7 +6,7 @@ import json
 from config import REDIS_URL, APP_MODE, AppMode
 from embedding_service import embedding_service, EmbeddingServiceError
 from mongodb_service import mongodb_service, MongoDBServiceError
-from tasks import crawl_and_index
+from src.job_search.scraping.tasks import crawl_and_index
 import re
 import logging
 from datetime import datetime
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Backend connectivity probe run inside the frontend container.
+
+Copied into the container by test_frontend_debug.py and executed there, so
+the probe is a real file instead of a Python source string passed to `-c`.
+"""
+
+import sys
+import requests
+
+def main(backend_url: str = 'http://backend:8000') -> None:
+    """Post a small search to the backend and report the result"""
+    try:
+        # Test backend connection
+        response = requests.post(
+            f'{backend_url}/search/',
+            json={'query': 'python developer', 'max_results': 3},
+            headers={'Content-Type': 'application/json'},
+            timeout=10
+        )
+        
+        print(f'Status: {response.status_code}')
+        if response.status_code == 200:
+            data = response.json()
+            print(f'Jobs: {len(data.get("jobs", []))}')
+            print('Frontend can reach backend!')
+        else:
+            print(f'Error: {response.text}')
+            
+    except Exception as e:
+        print(f'Error: {e}')
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -9,6 +9,7 @@ environment setup for testing different application modes.
 import os
 import sys
 import subprocess
+import importlib.util
 from pathlib import Path
 
 def run_command(cmd, description):
@@ -68,6 +69,10 @@ def run_unit_tests(mode=None, verbose=False):
     """Run unit tests"""
     cmd = "python -m pytest"
     
+    # Spread test files across CPU cores; loadfile keeps each file on one worker
+    if importlib.util.find_spec("xdist") is not None:
+        cmd += " -n auto --dist loadfile"
+    
     if verbose:
         cmd += " -v -s"
     
@@ -3,7 +3,7 @@ Pydantic models for API request/response validation.
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional
 from datetime import datetime
 
 # Search API Models
@@ -148,6 +148,18 @@ class UpdateJobStatusRequest(BaseModel):
     )
     notes: Optional[str] = Field(default="", description="Optional notes about the status change")
 
+class BulkJobOperation(BaseModel):
+    """One save, update or remove step inside a bulk request"""
+    action: Literal["save", "update", "remove"] = Field(description="Operation to apply")
+    job_id: str = Field(description="Job the operation applies to")
+    job_data: Optional[Dict[str, Any]] = Field(default=None, description="Complete job data (save only)")
+    status: Optional[str] = Field(default=None, description="New status (update only)")
+    notes: Optional[str] = Field(default=None, description="Optional notes (update only)")
+
+class BulkJobsRequest(BaseModel):
+    """Batch of saved-job operations applied in order in one request"""
+    ops: List[BulkJobOperation] = Field(min_length=1, description="Operations in the order to apply them")
+
 class SavedJob(BaseModel):
     """Model for a saved job"""
     job_id: str = Field(description="Unique identifier of the saved job")
@@ -162,8 +174,8 @@ class SavedJob(BaseModel):
 class SavedJobsResponse(BaseModel):
     """Response containing user's saved jobs"""
     user_id: str = Field(description="User identifier")
-    total_saved: int = Field(description="Total number of saved jobs")
-    jobs: List[SavedJob] = Field(description="List of saved jobs")
+    total_saved: int = Field(description="Total number of saved jobs matching the filter")
+    jobs: List[SavedJob] = Field(description="Requested page of saved jobs")
     statistics: Dict[str, Any] = Field(description="Job application statistics")
 
 class UserStatsResponse(BaseModel):
@@ -2,16 +2,17 @@
 Health check endpoints.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+from starlette.concurrency import run_in_threadpool
 from ..models import HealthResponse
 from ...core.config import settings
-from ...db.mongodb import mongodb_service
+from ...db.mongodb import mongodb_service, MongoDBServiceError
 from ...ml.embeddings import embedding_service
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 @router.get("/", response_model=HealthResponse)
-def health_check():
+async def health_check():
     """
     Comprehensive health check endpoint.
     
@@ -28,7 +29,8 @@ def health_check():
     
     # Check embedding service
     if embedding_service:
-        embedding_health = embedding_service.health_check()
+        # The embedding check runs a model or HTTP call; keep it off the event loop
+        embedding_health = await run_in_threadpool(embedding_service.health_check)
         health_status["components"]["embedding_service"] = embedding_health
         
         if embedding_health["status"] in ["unhealthy", "degraded"]:
@@ -36,7 +38,7 @@ def health_check():
     
     # Check MongoDB
     if mongodb_service:
-        mongodb_health = mongodb_service.health_check()
+        mongodb_health = await mongodb_service.health_check()
         health_status["components"]["mongodb"] = mongodb_health
         
         if mongodb_health["status"] != "healthy":
@@ -63,4 +65,26 @@ def embedding_health():
     if not embedding_service:
         return {"status": "unhealthy", "message": "Embedding service not initialized"}
     
-    return embedding_service.health_check()
\ No newline at end of file
+    return embedding_service.health_check()
+
+@router.get("/mongodb/indexes")
+async def mongodb_index_health():
+    """
+    Check that the users collection has every index the user endpoints rely on.
+    
+    Returns:
+        - Index status: healthy when nothing is missing
+        - Key specs of any missing indexes
+    """
+    if not mongodb_service or not mongodb_service.connected:
+        raise HTTPException(status_code=503, detail="MongoDB service not initialized")
+    
+    try:
+        missing = await mongodb_service.missing_indexes()
+    except MongoDBServiceError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return {
+        "status": "healthy" if not missing else "degraded",
+        "missing": missing
+    }
@@ -2,18 +2,23 @@
 User tracking endpoints.
 """
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
 from ..models import (
-    SaveJobRequest, UpdateJobStatusRequest, SavedJobsResponse, 
-    UserStatsResponse
+    SaveJobRequest, UpdateJobStatusRequest, SavedJob, SavedJobsResponse, 
+    UserStatsResponse, BulkJobsRequest
+)
+from ...db.mongodb import (
+    mongodb_service, MongoDBServiceError, JobAlreadySavedError,
+    SavedJobNotFoundError, InvalidJobOperationError
 )
-from ...db.mongodb import mongodb_service, MongoDBServiceError
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 @router.post("/{user_id}/saved-jobs", status_code=201)
-def save_job_for_user(user_id: str, request: SaveJobRequest):
+async def save_job_for_user(user_id: str, request: SaveJobRequest):
     """
     💾 **Save a Job for User Tracking**
     
@@ -26,11 +31,11 @@ def save_job_for_user(user_id: str, request: SaveJobRequest):
     - 🔍 **Job Data Storage** - Full job details preserved for offline viewing
     - ⏰ **Timestamp Tracking** - Know when you saved each job
     """
-    if not mongodb_service:
+    if not mongodb_service or not mongodb_service.connected:
         raise HTTPException(status_code=503, detail="User tracking service unavailable")
     
     try:
-        success = mongodb_service.save_job(user_id, request.job_id, request.job_data)
+        success = await mongodb_service.save_job(user_id, request.job_id, request.job_data)
         if success:
             return {
                 "message": f"Job {request.job_id} saved successfully for user {user_id}",
@@ -40,50 +45,107 @@ def save_job_for_user(user_id: str, request: SaveJobRequest):
         else:
             raise HTTPException(status_code=500, detail="Failed to save job")
             
+    except JobAlreadySavedError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except MongoDBServiceError as e:
-        if "already saved" in str(e):
-            raise HTTPException(status_code=409, detail=str(e))
-        else:
-            raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{user_id}/saved-jobs", response_model=SavedJobsResponse)
-def get_saved_jobs_for_user(user_id: str, status: Optional[str] = None):
+async def get_saved_jobs_for_user(
+    user_id: str,
+    status: Optional[str] = None,
+    skip: int = Query(default=0, ge=0, description="Saved jobs to skip, most recent first"),
+    limit: Optional[int] = Query(default=None, ge=1, description="Maximum saved jobs to return (all when omitted)")
+):
     """
     📋 **Get User's Saved Jobs**
     
     Retrieve all jobs that a user has saved, with optional filtering by application status.
     This endpoint provides a complete view of the user's job application pipeline.
+    Use `skip` and `limit` to page through long lists; `total_saved` always
+    counts every job matching the filter. Each job carries only the `job_data`
+    fields shown in job cards; fetch a single saved job for the full posting.
     """
-    if not mongodb_service:
+    if not mongodb_service or not mongodb_service.connected:
         raise HTTPException(status_code=503, detail="User tracking service unavailable")
     
     try:
-        saved_jobs = mongodb_service.get_saved_jobs(user_id, status)
-        stats = mongodb_service.get_job_stats(user_id)
-        
-        return SavedJobsResponse(
-            user_id=user_id,
-            total_saved=len(saved_jobs),
-            jobs=saved_jobs,
-            statistics=stats
-        )
+        stats = await mongodb_service.get_job_stats(user_id)
+        # Run the aggregation and read its first batch before any bytes are sent,
+        # so a failing query still becomes a 500 instead of a truncated 200 body
+        jobs = mongodb_service.iter_saved_jobs(user_id, status, skip=skip, limit=limit)
+        first_job = await anext(jobs, None)
+    except MongoDBServiceError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    total = stats["by_status"].get(status, 0) if status else stats["total"]
+    envelope = orjson.dumps({"user_id": user_id, "total_saved": total, "statistics": stats})
+    
+    async def stream_saved_jobs():
+        # Reopen the envelope object and stream jobs into it as the cursor yields them
+        yield envelope[:-1] + b',"jobs":['
+        if first_job is not None:
+            yield orjson.dumps(first_job)
+            async for job in jobs:
+                yield b',' + orjson.dumps(job)
+        yield b']}'
+    
+    return StreamingResponse(stream_saved_jobs(), media_type="application/json")
+
+@router.get("/{user_id}/saved-jobs/count")
+async def count_saved_jobs_for_user(user_id: str, status: Optional[str] = None):
+    """
+    🔢 **Count User's Saved Jobs**
+    
+    Return only the number of saved jobs, optionally for one status, without
+    transferring the job documents themselves.
+    """
+    if not mongodb_service or not mongodb_service.connected:
+        raise HTTPException(status_code=503, detail="User tracking service unavailable")
+    
+    try:
+        return {
+            "user_id": user_id,
+            "status": status,
+            "count": await mongodb_service.count_saved_jobs(user_id, status)
+        }
         
     except MongoDBServiceError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/{user_id}/saved-jobs/{job_id}", response_model=SavedJob)
+async def get_saved_job_for_user(user_id: str, job_id: str):
+    """
+    🔎 **Get One Saved Job**
+    
+    Retrieve a single saved job including its complete `job_data`.
+    """
+    if not mongodb_service or not mongodb_service.connected:
+        raise HTTPException(status_code=503, detail="User tracking service unavailable")
+    
+    try:
+        job = await mongodb_service.get_saved_job(user_id, job_id)
+    except MongoDBServiceError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found in saved jobs for user {user_id}")
+    # Saved jobs are written by MongoDBService, so skip re-validating the full job_data
+    return SavedJob.model_construct(**job)
+
 @router.put("/{user_id}/saved-jobs/{job_id}")
-def update_job_status_for_user(user_id: str, job_id: str, request: UpdateJobStatusRequest):
+async def update_job_status_for_user(user_id: str, job_id: str, request: UpdateJobStatusRequest):
     """
     ✏️ **Update Job Application Status**
     
     Update the status of a saved job as you progress through the application process.
     This endpoint is crucial for tracking your job search journey and staying organized.
     """
-    if not mongodb_service:
+    if not mongodb_service or not mongodb_service.connected:
         raise HTTPException(status_code=503, detail="User tracking service unavailable")
     
     try:
-        success = mongodb_service.update_job_status(
+        success = await mongodb_service.update_job_status(
             user_id, 
             job_id, 
             request.status, 
@@ -101,27 +163,26 @@ def update_job_status_for_user(user_id: str, job_id: str, request: UpdateJobStat
         else:
             raise HTTPException(status_code=500, detail="Failed to update job status")
             
+    except SavedJobNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidJobOperationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except MongoDBServiceError as e:
-        if "not found" in str(e):
-            raise HTTPException(status_code=404, detail=str(e))
-        elif "Invalid status" in str(e):
-            raise HTTPException(status_code=400, detail=str(e))
-        else:
-            raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/{user_id}/saved-jobs/{job_id}")
-def remove_saved_job_for_user(user_id: str, job_id: str):
+async def remove_saved_job_for_user(user_id: str, job_id: str):
     """
     🗑️ **Remove Saved Job**
     
     Remove a job from your saved jobs list. This is useful for cleaning up your 
     job tracker when positions are no longer relevant.
     """
-    if not mongodb_service:
+    if not mongodb_service or not mongodb_service.connected:
         raise HTTPException(status_code=503, detail="User tracking service unavailable")
     
     try:
-        success = mongodb_service.remove_saved_job(user_id, job_id)
+        success = await mongodb_service.remove_saved_job(user_id, job_id)
         
         if success:
             return {
@@ -135,19 +196,47 @@ def remove_saved_job_for_user(user_id: str, job_id: str):
     except MongoDBServiceError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/{user_id}/saved-jobs/bulk")
+async def bulk_update_saved_jobs_for_user(user_id: str, request: BulkJobsRequest):
+    """
+    📦 **Apply Several Saved-Job Changes at Once**
+    
+    Save, update and remove jobs in one request instead of one HTTP round trip
+    per change. Operations are applied in the order given.
+    """
+    if not mongodb_service or not mongodb_service.connected:
+        raise HTTPException(status_code=503, detail="User tracking service unavailable")
+    
+    try:
+        result = await mongodb_service.bulk_update_jobs(
+            user_id,
+            [op.model_dump() for op in request.ops]
+        )
+        
+        return {
+            "message": f"Applied {result['operations']} operations for user {user_id}",
+            "user_id": user_id,
+            **result
+        }
+        
+    except InvalidJobOperationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except MongoDBServiceError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/{user_id}/stats", response_model=UserStatsResponse)
-def get_user_job_stats(user_id: str):
+async def get_user_job_stats(user_id: str):
     """
     📊 **Get Job Search Statistics**
     
     Get comprehensive statistics about your job search progress. Perfect for 
     tracking your application pipeline and identifying areas for improvement.
     """
-    if not mongodb_service:
+    if not mongodb_service or not mongodb_service.connected:
         raise HTTPException(status_code=503, detail="User tracking service unavailable")
     
     try:
-        stats = mongodb_service.get_job_stats(user_id)
+        stats = await mongodb_service.get_job_stats(user_id)
         
         return UserStatsResponse(
             user_id=user_id,
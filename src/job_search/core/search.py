@@ -26,9 +26,9 @@ class SearchService:
         # Import ML components only if needed
         if settings.APP_MODE in [AppMode.FULL_ML, AppMode.CLOUD_ML]:
             try:
-                from ..ml.indexing import get_embedding, index as pinecone_index
+                from ..ml.indexing import get_embedding, get_pinecone_index
                 from ..ml.reranking import rerank_search_results
-                self.pinecone_index = pinecone_index
+                self.pinecone_index = get_pinecone_index()
                 self.rerank_search_results = rerank_search_results
             except ImportError as e:
                 logger.error(f"Failed to import ML components: {e}")
@@ -5,88 +5,158 @@ This module handles all MongoDB operations including:
 - User job tracking (saved jobs, application status)
 - Database connection management
 - Data validation and schema enforcement
+
+All operations are coroutines on a single pymongo AsyncMongoClient, which is
+opened and closed by the FastAPI lifespan (see main.py).
 """
 
+import asyncio
 import logging
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from pymongo import MongoClient
+import time
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
+from pymongo import AsyncMongoClient, ReturnDocument, UpdateOne
 from pymongo.errors import ConnectionFailure, DuplicateKeyError, PyMongoError
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Indexes on the users collection, as (keys, options). Saved jobs are embedded
+# in the user document, so every lookup starts with an equality match on user_id
+USER_INDEXES = [
+    ([("user_id", 1)], {"unique": True}),
+    ([("user_id", 1), ("saved_jobs.job_id", 1)], {}),
+    ([("saved_jobs.status", 1)], {}),
+    ([("saved_jobs.saved_at", 1)], {}),
+]
+
+# Saved-job fields returned by list views. job_data can hold a whole scraped
+# posting, so lists only carry what job cards show; get_saved_job returns it all
+SAVED_JOB_LIST_PROJECTION = {
+    "job_id": 1,
+    "saved_at": 1,
+    "status": 1,
+    "notes": 1,
+    "application_date": 1,
+    "interview_dates": 1,
+    "updated_at": 1,
+    "job_data.text": 1,
+    "job_data.score": 1,
+    "job_data.vector_score": 1,
+    "job_data.cross_score": 1,
+    "job_data.source": 1,
+}
+
+# Seconds a health_check result is reused; probes often arrive in bursts
+HEALTH_CHECK_TTL = 2.0
+
+VALID_STATUSES = ["saved", "applied", "interviewing", "offered", "rejected", "withdrawn"]
+
 class MongoDBServiceError(Exception):
     """Custom exception for MongoDB service errors"""
     pass
 
+class JobAlreadySavedError(MongoDBServiceError):
+    """Raised when saving a job the user has already saved"""
+    pass
+
+class SavedJobNotFoundError(MongoDBServiceError):
+    """Raised when a job is not in the user's saved jobs"""
+    pass
+
+class InvalidJobOperationError(MongoDBServiceError):
+    """Raised for an unknown job status or bulk action"""
+    pass
+
 class MongoDBService:
     """Service class for MongoDB operations"""
     
     def __init__(self):
+        if not settings.MONGODB_CONNECTION_STRING:
+            raise MongoDBServiceError("MongoDB connection string not configured")
+        
         self.client = None
         self.db = None
-        self._connect()
+        self._health = None
+        self._health_checked_at = 0.0
+        self._health_lock = asyncio.Lock()
     
-    def _connect(self):
-        """Establish MongoDB connection"""
-        if not settings.MONGODB_CONNECTION_STRING:
-            raise MongoDBServiceError("MongoDB connection string not configured")
+    @property
+    def connected(self) -> bool:
+        """Whether connect() has succeeded and the client is still open"""
+        return self.db is not None
+    
+    async def connect(self):
+        """Establish MongoDB connection
         
+        The async client is tied to the event loop it first runs on, so it is
+        created here, inside the running application, rather than at import.
+        """
+        self.client = AsyncMongoClient(settings.MONGODB_CONNECTION_STRING, serverSelectionTimeoutMS=5000)
         try:
-            self.client = MongoClient(settings.MONGODB_CONNECTION_STRING, serverSelectionTimeoutMS=5000)
             # Test the connection
-            self.client.admin.command('ping')
+            await self.client.admin.command('ping')
             self.db = self.client[settings.MONGODB_DATABASE_NAME]
             
             # Create indexes for better performance
-            self._create_indexes()
+            await self._create_indexes()
             
             logger.info(f"Successfully connected to MongoDB database: {settings.MONGODB_DATABASE_NAME}")
             
         except ConnectionFailure as e:
+            await self.close_connection()
             logger.error(f"Failed to connect to MongoDB: {e}")
             raise MongoDBServiceError(f"MongoDB connection failed: {e}")
         except Exception as e:
+            await self.close_connection()
             logger.error(f"Unexpected error connecting to MongoDB: {e}")
             raise MongoDBServiceError(f"MongoDB initialization error: {e}")
     
-    def _create_indexes(self):
-        """Create database indexes for optimal performance"""
-        try:
-            # Index on user_id for fast user queries
-            self.db.users.create_index("user_id", unique=True)
-            
-            # Compound index on user_id and job_id for saved jobs
-            self.db.users.create_index([("user_id", 1), ("saved_jobs.job_id", 1)])
-            
-            # Index on saved job status for filtering
-            self.db.users.create_index("saved_jobs.status")
-            
-            # Index on saved date for sorting
-            self.db.users.create_index("saved_jobs.saved_at")
-            
+    async def _create_indexes(self):
+        """Create database indexes for optimal performance
+        
+        Missing lookup indexes only slow queries down, but the unique user_id
+        index is what stops save_job from inserting a duplicate user document,
+        so failing to create a unique index aborts the connection.
+        """
+        failed = False
+        for keys, options in USER_INDEXES:
+            try:
+                await self.db.users.create_index(keys, **options)
+            except Exception as e:
+                if options.get("unique"):
+                    raise MongoDBServiceError(f"Failed to create unique index {keys}: {e}")
+                logger.warning(f"Failed to create MongoDB index {keys}: {e}")
+                failed = True
+        
+        if not failed:
             logger.info("MongoDB indexes created successfully")
-            
-        except Exception as e:
-            logger.warning(f"Failed to create MongoDB indexes: {e}")
     
-    def health_check(self) -> Dict[str, Any]:
-        """Check MongoDB connection health"""
+    async def health_check(self) -> Dict[str, Any]:
+        """Check MongoDB connection health, reusing a result younger than HEALTH_CHECK_TTL"""
+        async with self._health_lock:
+            # Concurrent callers wait here and share the one probe in flight
+            if self._health is None or time.monotonic() - self._health_checked_at >= HEALTH_CHECK_TTL:
+                self._health = await self._probe_health()
+                self._health_checked_at = time.monotonic()
+            return self._health
+    
+    async def _probe_health(self) -> Dict[str, Any]:
+        """Ping MongoDB and collect database stats"""
         try:
             if not self.client:
                 return {"status": "unhealthy", "error": "No connection"}
             
             # Ping the server
-            self.client.admin.command('ping')
+            await self.client.admin.command('ping')
             
             # Get database stats
-            stats = self.db.command("dbstats")
+            stats = await self.db.command("dbstats")
             
             return {
                 "status": "healthy",
                 "database": settings.MONGODB_DATABASE_NAME,
-                "collections": len(self.db.list_collection_names()),
+                "collections": len(await self.db.list_collection_names()),
                 "storage_size": stats.get("storageSize", 0),
                 "data_size": stats.get("dataSize", 0)
             }
@@ -97,15 +167,35 @@ class MongoDBService:
                 "error": str(e)
             }
     
-    def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+    async def missing_indexes(self) -> List[List[List[Any]]]:
+        """Return the key specs from USER_INDEXES that the users collection lacks
+        
+        An index on the right keys without the required unique option counts
+        as missing, since it does not enforce what the service relies on.
+        """
+        try:
+            existing = {
+                (tuple(index["key"].items()), bool(index.get("unique")))
+                async for index in await self.db.users.list_indexes()
+            }
+            return [
+                [list(key) for key in keys]
+                for keys, options in USER_INDEXES
+                if (tuple(keys), bool(options.get("unique"))) not in existing
+            ]
+        except PyMongoError as e:
+            logger.error(f"Error listing MongoDB indexes: {e}")
+            raise MongoDBServiceError(f"Failed to list indexes: {e}")
+    
+    async def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user document by user_id"""
         try:
-            return self.db.users.find_one({"user_id": user_id})
+            return await self.db.users.find_one({"user_id": user_id})
         except PyMongoError as e:
             logger.error(f"Error fetching user {user_id}: {e}")
             raise MongoDBServiceError(f"Failed to fetch user: {e}")
     
-    def create_user_if_not_exists(self, user_id: str) -> Dict[str, Any]:
+    async def create_user_if_not_exists(self, user_id: str) -> Dict[str, Any]:
         """Create user document if it doesn't exist"""
         try:
             user_doc = {
@@ -119,64 +209,136 @@ class MongoDBService:
             }
             
             # Use upsert to create only if doesn't exist
-            result = self.db.users.update_one(
+            result = await self.db.users.update_one(
                 {"user_id": user_id},
                 {"$setOnInsert": user_doc},
                 upsert=True
             )
             
             # Return the user document
-            return self.get_user(user_id)
+            return await self.get_user(user_id)
             
         except DuplicateKeyError:
             # User already exists, return existing
-            return self.get_user(user_id)
+            return await self.get_user(user_id)
         except PyMongoError as e:
             logger.error(f"Error creating user {user_id}: {e}")
             raise MongoDBServiceError(f"Failed to create user: {e}")
     
-    def save_job(self, user_id: str, job_id: str, job_data: Dict[str, Any]) -> bool:
-        """Save a job for a user"""
+    def _new_saved_job(self, job_id: str, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the embedded document for a newly saved job"""
+        now = datetime.utcnow()
+        return {
+            "job_id": job_id,
+            "saved_at": now,
+            "status": "saved",
+            "notes": "",
+            "job_data": job_data,
+            "application_date": None,
+            "interview_dates": [],
+            "updated_at": now
+        }
+    
+    async def save_job(self, user_id: str, job_id: str, job_data: Dict[str, Any]) -> bool:
+        """Save a job for a user
+        
+        One upsert both creates a missing user and pushes the job, guarded by
+        a filter that only matches while the job is not saved yet. When it is,
+        the upsert tries to insert a second document for the user and the
+        unique user_id index rejects it.
+        """
+        saved_job = self._new_saved_job(job_id, job_data)
+        
         try:
-            # Ensure user exists
-            self.create_user_if_not_exists(user_id)
-            
-            saved_job = {
-                "job_id": job_id,
-                "saved_at": datetime.utcnow(),
-                "status": "saved",
-                "notes": "",
-                "job_data": job_data,
-                "application_date": None,
-                "interview_dates": [],
-                "updated_at": datetime.utcnow()
-            }
-            
-            # Check if job is already saved
-            existing = self.db.users.find_one({
-                "user_id": user_id,
-                "saved_jobs.job_id": job_id
-            })
-            
-            if existing:
-                raise MongoDBServiceError(f"Job {job_id} is already saved for user {user_id}")
-            
-            # Add the job to user's saved jobs
-            result = self.db.users.update_one(
-                {"user_id": user_id},
-                {"$push": {"saved_jobs": saved_job}}
-            )
-            
-            return result.modified_count > 0
+            # A duplicate key can also mean a concurrent request created the
+            # user first; the second attempt then matches the new document
+            for _ in range(2):
+                try:
+                    await self.db.users.update_one(
+                        {"user_id": user_id, "saved_jobs.job_id": {"$ne": job_id}},
+                        {
+                            "$setOnInsert": {
+                                "created_at": saved_job["saved_at"],
+                                "profile": {
+                                    "preferences": {},
+                                    "search_history": []
+                                }
+                            },
+                            "$push": {"saved_jobs": saved_job}
+                        },
+                        upsert=True
+                    )
+                    return True
+                except DuplicateKeyError:
+                    continue
+            
+            raise JobAlreadySavedError(f"Job {job_id} is already saved for user {user_id}")
             
         except PyMongoError as e:
             logger.error(f"Error saving job {job_id} for user {user_id}: {e}")
             raise MongoDBServiceError(f"Failed to save job: {e}")
     
-    def get_saved_jobs(self, user_id: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def bulk_save_jobs(self, user_id: str, jobs: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Save many jobs for a user in one round trip
+        
+        A pipeline update creates the user if needed and appends every job
+        whose job_id is not saved yet. Jobs that are already saved are skipped
+        instead of failing the batch.
+        
+        Args:
+            user_id: User to save the jobs for
+            jobs: (job_id, job_data) pairs; later duplicates of a job_id are ignored
+            
+        Returns:
+            IDs of the jobs that were newly saved, in input order
+        """
+        new_jobs = {}
+        for job_id, job_data in jobs:
+            if job_id not in new_jobs:
+                new_jobs[job_id] = self._new_saved_job(job_id, job_data)
+        if not new_jobs:
+            return []
+        
+        saved_job_ids = {"$ifNull": ["$saved_jobs.job_id", []]}
+        update = [{"$set": {
+            "created_at": {"$ifNull": ["$created_at", datetime.utcnow()]},
+            "profile": {"$ifNull": ["$profile", {"$literal": {"preferences": {}, "search_history": []}}]},
+            "saved_jobs": {"$concatArrays": [
+                {"$ifNull": ["$saved_jobs", []]},
+                {"$filter": {
+                    "input": {"$literal": list(new_jobs.values())},
+                    "cond": {"$not": [{"$in": ["$$this.job_id", saved_job_ids]}]}
+                }}
+            ]}
+        }}]
+        
+        try:
+            # As in save_job, a duplicate key means a concurrent request created the user first
+            for attempt in range(2):
+                try:
+                    before = await self.db.users.find_one_and_update(
+                        {"user_id": user_id},
+                        update,
+                        projection={"_id": 0, "saved_jobs.job_id": 1},
+                        upsert=True,
+                        return_document=ReturnDocument.BEFORE
+                    )
+                    break
+                except DuplicateKeyError:
+                    if attempt:
+                        raise
+            
+            already_saved = {job["job_id"] for job in (before or {}).get("saved_jobs", [])}
+            return [job_id for job_id in new_jobs if job_id not in already_saved]
+            
+        except PyMongoError as e:
+            logger.error(f"Error bulk saving {len(new_jobs)} jobs for user {user_id}: {e}")
+            raise MongoDBServiceError(f"Failed to save jobs: {e}")
+    
+    async def get_saved_jobs(self, user_id: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all saved jobs for a user, optionally filtered by status"""
         try:
-            user = self.get_user(user_id)
+            user = await self.get_user(user_id)
             if not user:
                 return []
             
@@ -195,25 +357,115 @@ class MongoDBService:
             logger.error(f"Error fetching saved jobs for user {user_id}: {e}")
             raise MongoDBServiceError(f"Failed to fetch saved jobs: {e}")
     
-    def update_job_status(self, user_id: str, job_id: str, status: str, notes: str = None) -> bool:
-        """Update the status of a saved job"""
+    def _saved_jobs_pipeline(self, user_id: str, facets: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Aggregation that runs each facet over one user's saved jobs as separate documents"""
+        return [
+            {"$match": {"user_id": user_id}},
+            {"$unwind": "$saved_jobs"},
+            {"$replaceRoot": {"newRoot": "$saved_jobs"}},
+            {"$facet": facets}
+        ]
+    
+    def _stats_facets(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Facets computing the per-status and recent-activity counts"""
+        # A job counts as recent while (now - updated_at).days <= 7
+        recent_cutoff = datetime.utcnow() - timedelta(days=8)
+        return {
+            "by_status": [
+                {"$group": {"_id": {"$ifNull": ["$status", "unknown"]}, "count": {"$sum": 1}}}
+            ],
+            "recent_activity": [
+                {"$match": {"updated_at": {"$gt": recent_cutoff}}},
+                {"$count": "count"}
+            ]
+        }
+    
+    def _stats_from_facets(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Reshape the stats facets into the get_job_stats dictionary"""
+        by_status = {group["_id"]: group["count"] for group in result.get("by_status", [])}
+        recent = result.get("recent_activity", [])
+        return {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "recent_activity": recent[0]["count"] if recent else 0
+        }
+    
+    def _saved_jobs_page_stages(
+        self, status: Optional[str], skip: int, limit: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Stages selecting one page of saved jobs, most recent first, trimmed for list views"""
+        stages = [{"$match": {"status": status}}] if status else []
+        stages.append({"$sort": {"saved_at": -1}})
+        if skip:
+            stages.append({"$skip": skip})
+        if limit is not None:
+            stages.append({"$limit": limit})
+        stages.append({"$project": SAVED_JOB_LIST_PROJECTION})
+        return stages
+    
+    async def iter_saved_jobs(
+        self, user_id: str, status: Optional[str] = None, skip: int = 0, limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a page of a user's saved jobs one document at a time
+        
+        Documents come straight off the aggregation cursor, so callers can
+        stream them without holding the whole page in memory.
+        """
+        try:
+            cursor = await self.db.users.aggregate([
+                {"$match": {"user_id": user_id}},
+                {"$unwind": "$saved_jobs"},
+                {"$replaceRoot": {"newRoot": "$saved_jobs"}},
+                *self._saved_jobs_page_stages(status, skip, limit)
+            ])
+            async for job in cursor:
+                yield job
+                
+        except PyMongoError as e:
+            logger.error(f"Error fetching saved jobs for user {user_id}: {e}")
+            raise MongoDBServiceError(f"Failed to fetch saved jobs: {e}")
+    
+    async def get_saved_job(self, user_id: str, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get one saved job with its complete job_data"""
         try:
-            valid_statuses = ["saved", "applied", "interviewing", "offered", "rejected", "withdrawn"]
-            if status not in valid_statuses:
-                raise MongoDBServiceError(f"Invalid status: {status}. Must be one of {valid_statuses}")
+            user = await self.db.users.find_one(
+                {"user_id": user_id, "saved_jobs.job_id": job_id},
+                {"_id": 0, "saved_jobs.$": 1}
+            )
+            return user["saved_jobs"][0] if user else None
             
-            update_data = {
-                "saved_jobs.$.status": status,
-                "saved_jobs.$.updated_at": datetime.utcnow()
-            }
+        except PyMongoError as e:
+            logger.error(f"Error fetching job {job_id} for user {user_id}: {e}")
+            raise MongoDBServiceError(f"Failed to fetch saved job: {e}")
+    
+    async def count_saved_jobs(self, user_id: str, status: Optional[str] = None) -> int:
+        """Count a user's saved jobs server-side without fetching the job documents"""
+        try:
+            saved_jobs = {"$ifNull": ["$saved_jobs", []]}
+            if status:
+                saved_jobs = {"$filter": {
+                    "input": saved_jobs,
+                    "cond": {"$eq": ["$$this.status", status]}
+                }}
+            
+            cursor = await self.db.users.aggregate([
+                {"$match": {"user_id": user_id}},
+                {"$project": {"_id": 0, "count": {"$size": saved_jobs}}}
+            ])
+            result = await cursor.to_list()
             
-            if notes is not None:
-                update_data["saved_jobs.$.notes"] = notes
+            return result[0]["count"] if result else 0
             
-            if status == "applied":
-                update_data["saved_jobs.$.application_date"] = datetime.utcnow()
+        except PyMongoError as e:
+            logger.error(f"Error counting saved jobs for user {user_id}: {e}")
+            raise MongoDBServiceError(f"Failed to count saved jobs: {e}")
+    
+    async def update_job_status(self, user_id: str, job_id: str, status: str, notes: str = None) -> bool:
+        """Update the status of a saved job"""
+        try:
+            update_data = self._status_update(status, notes)
             
-            result = self.db.users.update_one(
+            result = await self.db.users.update_one(
                 {
                     "user_id": user_id,
                     "saved_jobs.job_id": job_id
@@ -222,7 +474,7 @@ class MongoDBService:
             )
             
             if result.matched_count == 0:
-                raise MongoDBServiceError(f"Job {job_id} not found for user {user_id}")
+                raise SavedJobNotFoundError(f"Job {job_id} not found for user {user_id}")
             
             return result.modified_count > 0
             
@@ -230,10 +482,28 @@ class MongoDBService:
             logger.error(f"Error updating job {job_id} status for user {user_id}: {e}")
             raise MongoDBServiceError(f"Failed to update job status: {e}")
     
-    def remove_saved_job(self, user_id: str, job_id: str) -> bool:
+    def _status_update(self, status: str, notes: Optional[str]) -> Dict[str, Any]:
+        """Build the positional $set document for a saved job status change"""
+        if status not in VALID_STATUSES:
+            raise InvalidJobOperationError(f"Invalid status: {status}. Must be one of {VALID_STATUSES}")
+        
+        update_data = {
+            "saved_jobs.$.status": status,
+            "saved_jobs.$.updated_at": datetime.utcnow()
+        }
+        
+        if notes is not None:
+            update_data["saved_jobs.$.notes"] = notes
+        
+        if status == "applied":
+            update_data["saved_jobs.$.application_date"] = datetime.utcnow()
+        
+        return update_data
+    
+    async def remove_saved_job(self, user_id: str, job_id: str) -> bool:
         """Remove a saved job from user's list"""
         try:
-            result = self.db.users.update_one(
+            result = await self.db.users.update_one(
                 {"user_id": user_id},
                 {"$pull": {"saved_jobs": {"job_id": job_id}}}
             )
@@ -244,42 +514,76 @@ class MongoDBService:
             logger.error(f"Error removing job {job_id} for user {user_id}: {e}")
             raise MongoDBServiceError(f"Failed to remove saved job: {e}")
     
-    def get_job_stats(self, user_id: str) -> Dict[str, Any]:
-        """Get statistics about user's saved jobs"""
+    async def bulk_update_jobs(self, user_id: str, ops: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Apply save/update/remove operations for one user in a single round trip
+        
+        The operations are sent as one ordered bulk_write, so they run in
+        request order and stop at the first server error. Saving a job that
+        is already saved, or updating/removing one that is not, leaves the
+        document unchanged and shows up as a lower modified count.
+        """
         try:
-            user = self.get_user(user_id)
-            if not user:
-                return {"total": 0, "by_status": {}, "recent_activity": 0}
-            
-            saved_jobs = user.get("saved_jobs", [])
-            total = len(saved_jobs)
-            
-            # Count by status
-            status_counts = {}
-            for job in saved_jobs:
-                status = job.get("status", "unknown")
-                status_counts[status] = status_counts.get(status, 0) + 1
+            writes = []
+            if any(op["action"] == "save" for op in ops):
+                await self.create_user_if_not_exists(user_id)
+            
+            for op in ops:
+                job_id = op["job_id"]
+                if op["action"] == "save":
+                    writes.append(UpdateOne(
+                        {"user_id": user_id, "saved_jobs.job_id": {"$ne": job_id}},
+                        {"$push": {"saved_jobs": self._new_saved_job(job_id, op.get("job_data") or {})}}
+                    ))
+                elif op["action"] == "update":
+                    writes.append(UpdateOne(
+                        {"user_id": user_id, "saved_jobs.job_id": job_id},
+                        {"$set": self._status_update(op.get("status"), op.get("notes"))}
+                    ))
+                elif op["action"] == "remove":
+                    writes.append(UpdateOne(
+                        {"user_id": user_id},
+                        {"$pull": {"saved_jobs": {"job_id": job_id}}}
+                    ))
+                else:
+                    raise InvalidJobOperationError(f"Invalid action: {op['action']}")
+            
+            result = await self.db.users.bulk_write(writes, ordered=True)
             
             return {
-                "total": total,
-                "by_status": status_counts,
-                "recent_activity": len([j for j in saved_jobs if 
-                    (datetime.utcnow() - j.get("updated_at", datetime.min)).days <= 7])
+                "operations": len(writes),
+                "matched": result.matched_count,
+                "modified": result.modified_count
             }
             
+        except PyMongoError as e:
+            logger.error(f"Error applying bulk job operations for user {user_id}: {e}")
+            raise MongoDBServiceError(f"Failed to apply bulk operations: {e}")
+    
+    async def get_job_stats(self, user_id: str) -> Dict[str, Any]:
+        """Get statistics about user's saved jobs, computed inside MongoDB"""
+        try:
+            cursor = await self.db.users.aggregate(
+                self._saved_jobs_pipeline(user_id, self._stats_facets())
+            )
+            result = await cursor.to_list()
+            
+            return self._stats_from_facets(result[0] if result else {})
+            
         except PyMongoError as e:
             logger.error(f"Error getting job stats for user {user_id}: {e}")
             raise MongoDBServiceError(f"Failed to get job statistics: {e}")
     
-    def close_connection(self):
+    async def close_connection(self):
         """Close MongoDB connection"""
         if self.client:
-            self.client.close()
+            await self.client.close()
+            self.client = None
+            self.db = None
             logger.info("MongoDB connection closed")
 
-# Global instance
+# Global instance; the FastAPI lifespan connects and closes it
 try:
     mongodb_service = MongoDBService()
 except Exception as e:
     logger.warning(f"MongoDB service initialization failed: {e}")
-    mongodb_service = None
\ No newline at end of file
+    mongodb_service = None
@@ -5,10 +5,12 @@ This is the new, clean main application file that assembles all components.
 """
 
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from .core.config import settings
 from .core.logging_config import setup_logging, get_logger
 from .api.routes import health, search, users
+from .db.mongodb import mongodb_service, MongoDBServiceError
 
 # Setup structured logging
 setup_logging()
@@ -62,6 +64,26 @@ def get_app_description():
     
     return base_desc + mode_descriptions.get(settings.APP_MODE.value, "")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared async clients on startup and close them on shutdown"""
+    logger.info("🚀 Job Search API starting up")
+    logger.info(f"📊 Mode: {settings.APP_MODE.value}")
+    logger.info(f"🔗 Docs available at: /docs")
+    
+    # One AsyncMongoClient for the whole app, created on the serving event loop
+    if mongodb_service:
+        try:
+            await mongodb_service.connect()
+        except MongoDBServiceError as e:
+            logger.warning(f"⚠️ User tracking unavailable: {e}")
+    
+    yield
+    
+    logger.info("🛑 Job Search API shutting down")
+    if mongodb_service:
+        await mongodb_service.close_connection()
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application"""
     
@@ -72,7 +94,8 @@ def create_app() -> FastAPI:
         description=get_app_description(),
         version="2.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        lifespan=lifespan
     )
     
     # Include routers
@@ -81,17 +104,6 @@ def create_app() -> FastAPI:
     app.include_router(search.router)
     app.include_router(users.router)
     
-    # Add startup event
-    @app.on_event("startup")
-    async def startup_event():
-        logger.info("🚀 Job Search API starting up")
-        logger.info(f"📊 Mode: {settings.APP_MODE.value}")
-        logger.info(f"🔗 Docs available at: /docs")
-        
-    @app.on_event("shutdown") 
-    async def shutdown_event():
-        logger.info("🛑 Job Search API shutting down")
-    
     # Root endpoint
     @app.get("/")
     def read_root():
@@ -1,12 +1,18 @@
 import requests
 import numpy as np
 from typing import List, Optional, Dict, Any
-from sentence_transformers import SentenceTransformer
 import logging
 from ..core.config import settings, AppMode
 
 logger = logging.getLogger(__name__)
 
+# Only full-ml mode (and cloud-ml's local fallback) needs the local model, so
+# cloud-ml deployments can run without sentence-transformers and torch
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
 class EmbeddingServiceError(Exception):
     """Custom exception for embedding service errors"""
     pass
@@ -23,44 +29,31 @@ class EmbeddingService:
         self._local_model = None
         self._hf_api_status = None
         
-    def _get_local_model(self) -> SentenceTransformer:
+    def _get_local_model(self) -> "SentenceTransformer":
         """Lazy load local sentence transformer model"""
         if self._local_model is None:
             if self.mode == AppMode.LIGHTWEIGHT:
                 raise EmbeddingServiceError("Local embeddings not available in lightweight mode")
+            if SentenceTransformer is None:
+                raise EmbeddingServiceError("sentence-transformers is not installed")
             
             logger.info("Loading local sentence transformer model...")
             self._local_model = SentenceTransformer('all-MiniLM-L6-v2')
             logger.info("Local model loaded successfully")
         return self._local_model
     
-    def _get_hf_embedding(self, text: str) -> List[float]:
-        """Get embedding from Hugging Face Inference API"""
+    def _post_hf_inference(self, inputs: Any) -> Any:
+        """POST inputs to the Hugging Face Inference API and return the decoded JSON"""
         if not settings.HF_INFERENCE_API or not settings.HF_TOKEN:
             raise HuggingFaceInferenceError("HuggingFace credentials not configured")
         
         headers = {"Authorization": f"Bearer {settings.HF_TOKEN}"}
-        payload = {"inputs": text}
+        payload = {"inputs": inputs}
         
         try:
             response = requests.post(settings.HF_INFERENCE_API, headers=headers, json=payload, timeout=30)
             response.raise_for_status()
-            
-            result = response.json()
-            
-            # Handle different response formats
-            if isinstance(result, list) and isinstance(result[0], list):
-                embedding = result[0]
-            elif isinstance(result, list) and isinstance(result[0], (int, float)):
-                embedding = result
-            else:
-                raise HuggingFaceInferenceError(f"Unexpected API response format: {type(result)}")
-            
-            if len(embedding) != settings.HF_MODEL_DIMENSION:
-                raise HuggingFaceInferenceError(f"Expected {settings.HF_MODEL_DIMENSION} dimensions, got {len(embedding)}")
-            
-            self._hf_api_status = "healthy"
-            return embedding
+            return response.json()
             
         except requests.exceptions.Timeout:
             self._hf_api_status = "timeout"
@@ -75,12 +68,58 @@ class EmbeddingService:
             self._hf_api_status = "unknown_error"
             raise HuggingFaceInferenceError(f"HuggingFace API error: {str(e)}")
     
+    def _check_hf_dimension(self, embedding: List[float]) -> None:
+        """Raise if an HF embedding does not have the configured dimension"""
+        if len(embedding) != settings.HF_MODEL_DIMENSION:
+            self._hf_api_status = "unknown_error"
+            raise HuggingFaceInferenceError(f"Expected {settings.HF_MODEL_DIMENSION} dimensions, got {len(embedding)}")
+    
+    def _get_hf_embedding(self, text: str) -> List[float]:
+        """Get embedding from Hugging Face Inference API"""
+        result = self._post_hf_inference(text)
+        
+        # Handle different response formats
+        if isinstance(result, list) and result and isinstance(result[0], list):
+            embedding = result[0]
+        elif isinstance(result, list) and result and isinstance(result[0], (int, float)):
+            embedding = result
+        else:
+            self._hf_api_status = "unknown_error"
+            raise HuggingFaceInferenceError(f"Unexpected API response format: {type(result)}")
+        
+        self._check_hf_dimension(embedding)
+        self._hf_api_status = "healthy"
+        return embedding
+    
+    def _get_hf_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for several texts from one Hugging Face Inference API request"""
+        result = self._post_hf_inference(texts)
+        
+        if not (isinstance(result, list) and len(result) == len(texts)
+                and all(isinstance(embedding, list) for embedding in result)):
+            self._hf_api_status = "unknown_error"
+            raise HuggingFaceInferenceError(
+                f"Unexpected API response format for {len(texts)} inputs: {type(result)}"
+            )
+        
+        for embedding in result:
+            self._check_hf_dimension(embedding)
+        
+        self._hf_api_status = "healthy"
+        return result
+    
     def _get_local_embedding(self, text: str) -> List[float]:
         """Get embedding from local model"""
         model = self._get_local_model()
         embedding = model.encode(text, normalize_embeddings=True)
         return embedding.tolist()
     
+    def _get_local_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        """Get embeddings for several texts from the local model in one batched encode call"""
+        model = self._get_local_model()
+        embeddings = model.encode(texts, batch_size=batch_size, normalize_embeddings=True, convert_to_numpy=True)
+        return embeddings.tolist()
+    
     def get_embedding(self, text: str, fallback: bool = False) -> List[float]:
         """
         Get text embedding based on current mode
@@ -127,13 +166,25 @@ class EmbeddingService:
         if self.mode == AppMode.LIGHTWEIGHT:
             raise EmbeddingServiceError("Embeddings not supported in lightweight mode")
         
-        # For now, process individually. Could be optimized for batch processing
-        embeddings = []
-        for text in texts:
-            embedding = self.get_embedding(text, fallback=fallback)
-            embeddings.append(embedding)
+        if any(not text or not text.strip() for text in texts):
+            raise EmbeddingServiceError("Empty text provided")
+        texts = [text.strip() for text in texts]
+        
+        if self.mode == AppMode.FULL_ML:
+            # One tokenizer pass and forward per batch instead of one per text
+            return self._get_local_embeddings(texts)
+        
+        if self.mode == AppMode.CLOUD_ML:
+            # The Inference API accepts a list of inputs, so the batch is one request
+            try:
+                return self._get_hf_embeddings(texts)
+            except HuggingFaceInferenceError as e:
+                if fallback:
+                    logger.warning(f"HF batch inference failed, falling back to local: {e}")
+                    return self._get_local_embeddings(texts)
+                raise
         
-        return embeddings
+        raise EmbeddingServiceError(f"Unknown mode: {self.mode}")
     
     def health_check(self) -> Dict[str, Any]:
         """Check health of embedding service"""
@@ -1,8 +1,9 @@
 import numpy as np
+from functools import lru_cache
 from pinecone import Pinecone
 from ..core.config import settings, AppMode
 from .embeddings import embedding_service, EmbeddingServiceError
-from .ner import extract_job_metadata
+from .ner import extract_job_metadata_batch
 from .text_processing import process_job_text, TextChunk
 from ..core.logging_config import get_logger
 
@@ -14,6 +15,9 @@ PINECONE_API_KEY = settings.PINECONE_API_KEY
 PINECONE_INDEX_NAME = settings.PINECONE_INDEX_NAME
 HF_MODEL_DIMENSION = settings.HF_MODEL_DIMENSION
 
+# Threads available to async (async_req=True) Pinecone requests
+PINECONE_POOL_THREADS = 4
+
 def get_embedding(text: str) -> list[float]:
     """
     Generates a vector embedding for the given text using the configured embedding service.
@@ -38,10 +42,35 @@ def get_embedding(text: str) -> list[float]:
         logger.error(f"Embedding generation failed for text: {text[:100]}... Error: {e}")
         raise
 
+def get_embeddings_batch(texts: list[str]) -> list[list[float]]:
+    """
+    Generates vector embeddings for several texts with one embedding service call.
+    
+    Args:
+        texts: Texts to embed
+        
+    Returns:
+        One embedding per text, in input order
+        
+    Raises:
+        EmbeddingServiceError: If embedding generation fails
+    """
+    if APP_MODE == AppMode.LIGHTWEIGHT:
+        raise EmbeddingServiceError("Embeddings not supported in lightweight mode")
+    
+    try:
+        # Use fallback for cloud-ml mode to maintain availability during indexing
+        fallback = (APP_MODE == AppMode.CLOUD_ML)
+        return embedding_service.get_embeddings_batch(texts, fallback=fallback)
+    except EmbeddingServiceError as e:
+        logger.error(f"Batch embedding generation failed for {len(texts)} texts. Error: {e}")
+        raise
+
 
 # --- Pinecone Initialization (New Object-Oriented Way) ---
+@lru_cache(maxsize=1)
 def get_pinecone_index():
-    """Initializes and returns a Pinecone index object."""
+    """Initializes and returns a Pinecone index object, cached after the first call."""
     if not PINECONE_API_KEY:
         raise ValueError("PINECONE_API_KEY is not set in the environment.")
 
@@ -66,15 +95,97 @@ def get_pinecone_index():
         logger.info(f"✅ Index '{settings.PINECONE_INDEX_NAME}' created successfully.")
 
     # 4. Return a handle to the specific index
-    return pc.Index(PINECONE_INDEX_NAME)
-
-# This line executes when the module is imported, initializing the index.
-index = get_pinecone_index()
-logger.info(f"✅ Successfully connected to Pinecone index '{settings.PINECONE_INDEX_NAME}'.")
+    index = pc.Index(PINECONE_INDEX_NAME, pool_threads=PINECONE_POOL_THREADS)
+    logger.info(f"✅ Successfully connected to Pinecone index '{settings.PINECONE_INDEX_NAME}'.")
+    return index
 # --- End Pinecone Initialization ---
 
 
-def embed_and_index(jobs: list[dict], batch_size: int = 16, chunking_strategy: str = 'hybrid'):
+def _upsert_async(vectors: list[dict]):
+    """
+    Starts a Pinecone upsert without waiting for the response.
+    
+    Args:
+        vectors: Vectors to upsert
+        
+    Returns:
+        Async result whose get() waits for the upsert, or None if the client
+        does not support async requests and the upsert already completed
+    """
+    index = get_pinecone_index()
+    try:
+        return index.upsert(vectors=vectors, async_req=True)
+    except TypeError:
+        # Client without async_req support: upsert synchronously
+        index.upsert(vectors=vectors)
+        return None
+
+
+def _chunk_vector(chunk: TextChunk, embedding: list[float], chunking_strategy: str) -> dict:
+    """
+    Builds the Pinecone vector (ID, values and metadata) for an embedded chunk.
+    
+    Args:
+        chunk: Processed text chunk with NER metadata attached
+        embedding: Embedding of the chunk text
+        chunking_strategy: Strategy the chunk was produced with
+        
+    Returns:
+        Vector dictionary ready for index.upsert
+    """
+    meta = chunk.ner_metadata or {}
+    
+    # Create comprehensive metadata for the chunk
+    chunk_metadata = {
+        # Original job information
+        "text": chunk.text,
+        "title": chunk.original_title,
+        "company": chunk.original_company,
+        "location": chunk.original_location,
+        "url": chunk.original_url,
+        "source": chunk.original_source,
+        
+        # Chunk-specific metadata
+        "chunk_type": chunk.chunk_type,
+        "chunk_index": chunk.chunk_index,
+        "parent_job_id": chunk.parent_job_id,
+        "word_count": chunk.word_count,
+        "confidence_score": chunk.confidence_score,
+        "section_header": chunk.section_header,
+        
+        # NER extracted metadata (from original job)
+        "skills": meta.get('skills', []),
+        "experience_years": meta.get('experience', {}).get('years'),
+        "experience_level": meta.get('experience', {}).get('level'),
+        "salary_min": meta.get('salary', {}).get('min'),
+        "salary_max": meta.get('salary', {}).get('max'),
+        "salary_amount": meta.get('salary', {}).get('amount'),
+        "remote_work": meta.get('remote_work', False),
+        "extracted_locations": meta.get('locations', []),
+        "education": meta.get('education', []),
+        "benefits": meta.get('benefits', []),
+        
+        # Processing metadata
+        "is_chunk": True,
+        "chunking_strategy": chunking_strategy,
+        "metadata_extracted": True,
+        "skills_count": len(meta.get('skills', [])),
+        "has_salary_info": bool(meta.get('salary')),
+        "has_experience_info": bool(meta.get('experience')),
+        "processing_quality": chunk.confidence_score
+    }
+    
+    # Create unique ID for chunk
+    chunk_id = f"{chunk.parent_job_id}_chunk_{chunk.chunk_index}"
+    
+    return {
+        "id": chunk_id,
+        "values": embedding,
+        "metadata": chunk_metadata
+    }
+
+
+def embed_and_index(jobs: list[dict], batch_size: int = 16, chunking_strategy: str = 'hybrid') -> list[str]:
     """
     Advanced job processing pipeline with text cleaning, chunking, NER, and embedding.
     
@@ -89,10 +200,15 @@ def embed_and_index(jobs: list[dict], batch_size: int = 16, chunking_strategy: s
         jobs: List of job dictionaries with 'text' and 'id' fields
         batch_size: Number of job chunks to process per batch (reduced for chunking)
         chunking_strategy: Text chunking strategy ('sections', 'overlapping', 'hybrid')
+        
+    Returns:
+        IDs of the jobs that were fully indexed: processing succeeded and every
+        chunk was embedded and upserted. Jobs whose text yields no chunks count
+        as indexed, since retrying them cannot produce anything new.
     """
     if not jobs:
         logger.warning("⚠️ No jobs to index.")
-        return
+        return []
 
     logger.info(f"🚀 Starting advanced processing pipeline for {len(jobs)} jobs...")
     logger.info(f"📝 Using '{chunking_strategy}' chunking strategy with batch size {batch_size}")
@@ -108,6 +224,9 @@ def embed_and_index(jobs: list[dict], batch_size: int = 16, chunking_strategy: s
         'metadata_extracted': 0
     }
     
+    chunked_jobs = []
+    processed_job_ids = []
+    
     for job in jobs:
         try:
             logger.debug(f"🔄 Processing job {job.get('id', 'unknown')}")
@@ -116,17 +235,12 @@ def embed_and_index(jobs: list[dict], batch_size: int = 16, chunking_strategy: s
             chunks = process_job_text(job, chunking_strategy)
             
             if chunks:
-                # Extract NER metadata for each chunk (or reuse for all chunks from same job)
-                logger.debug(f"🔍 Extracting NER metadata for {len(chunks)} chunks")
-                base_metadata = extract_job_metadata(job.get('text', ''))
-                
-                for chunk in chunks:
-                    chunk.ner_metadata = base_metadata
-                
+                chunked_jobs.append((job, chunks))
                 all_chunks.extend(chunks)
                 total_chunks += len(chunks)
                 processing_stats['sections_identified'] += len(set(c.chunk_type for c in chunks))
             
+            processed_job_ids.append(job.get('id'))
             processing_stats['jobs_processed'] += 1
             processing_stats['chunks_created'] += len(chunks) if chunks else 0
             processing_stats['text_cleaned'] += 1
@@ -138,96 +252,69 @@ def embed_and_index(jobs: list[dict], batch_size: int = 16, chunking_strategy: s
     
     if not all_chunks:
         logger.warning("⚠️ No chunks created from jobs. Check job text content.")
-        return
+        return processed_job_ids
+    
+    # Extract NER metadata for all jobs in one batch and reuse it for every chunk of a job
+    logger.debug(f"🔍 Extracting NER metadata for {len(chunked_jobs)} jobs")
+    job_metadata = extract_job_metadata_batch([job.get('text', '') for job, _ in chunked_jobs])
+    for (_, chunks), base_metadata in zip(chunked_jobs, job_metadata):
+        for chunk in chunks:
+            chunk.ner_metadata = base_metadata
     
     logger.info(f"📊 Processing completed: {processing_stats}")
     logger.info(f"📄 Created {total_chunks} chunks from {len(jobs)} jobs (avg: {total_chunks/len(jobs):.1f} chunks/job)")
     
     # Step 2: Generate embeddings and index chunks in batches
     processed_chunks = 0
-    vectors_batch = []
+    pending_upserts = []
+    failed_job_ids = set()
     
-    for i, chunk in enumerate(all_chunks):
+    for batch_start in range(0, len(all_chunks), batch_size):
+        chunk_batch = all_chunks[batch_start:batch_start + batch_size]
+        logger.debug(f"🔄 Generating embeddings for chunks {batch_start + 1}-{batch_start + len(chunk_batch)}/{len(all_chunks)}")
+        
         try:
-            # Generate embedding for the cleaned chunk text
-            logger.debug(f"🔄 Generating embedding for chunk {i+1}/{len(all_chunks)}")
-            embedding = get_embedding(chunk.text)
-            
-            # Create comprehensive metadata for the chunk
-            chunk_metadata = {
-                # Original job information
-                "text": chunk.text,
-                "title": getattr(chunk, 'original_title', ''),
-                "company": getattr(chunk, 'original_company', ''),
-                "location": getattr(chunk, 'original_location', ''),
-                "url": getattr(chunk, 'original_url', ''),
-                "source": getattr(chunk, 'original_source', ''),
-                
-                # Chunk-specific metadata
-                "chunk_type": chunk.chunk_type,
-                "chunk_index": chunk.chunk_index,
-                "parent_job_id": chunk.parent_job_id,
-                "word_count": chunk.word_count,
-                "confidence_score": chunk.confidence_score,
-                "section_header": chunk.section_header,
-                
-                # NER extracted metadata (from original job)
-                "skills": getattr(chunk, 'ner_metadata', {}).get('skills', []),
-                "experience_years": getattr(chunk, 'ner_metadata', {}).get('experience', {}).get('years'),
-                "experience_level": getattr(chunk, 'ner_metadata', {}).get('experience', {}).get('level'),
-                "salary_min": getattr(chunk, 'ner_metadata', {}).get('salary', {}).get('min'),
-                "salary_max": getattr(chunk, 'ner_metadata', {}).get('salary', {}).get('max'),
-                "salary_amount": getattr(chunk, 'ner_metadata', {}).get('salary', {}).get('amount'),
-                "remote_work": getattr(chunk, 'ner_metadata', {}).get('remote_work', False),
-                "extracted_locations": getattr(chunk, 'ner_metadata', {}).get('locations', []),
-                "education": getattr(chunk, 'ner_metadata', {}).get('education', []),
-                "benefits": getattr(chunk, 'ner_metadata', {}).get('benefits', []),
-                
-                # Processing metadata
-                "is_chunk": True,
-                "chunking_strategy": chunking_strategy,
-                "metadata_extracted": True,
-                "skills_count": len(getattr(chunk, 'ner_metadata', {}).get('skills', [])),
-                "has_salary_info": bool(getattr(chunk, 'ner_metadata', {}).get('salary')),
-                "has_experience_info": bool(getattr(chunk, 'ner_metadata', {}).get('experience')),
-                "processing_quality": chunk.confidence_score
-            }
-            
-            # Create unique ID for chunk
-            chunk_id = f"{chunk.parent_job_id}_chunk_{chunk.chunk_index}"
-            
-            vector_data = {
-                "id": chunk_id,
-                "values": embedding,
-                "metadata": chunk_metadata
-            }
-            
-            vectors_batch.append(vector_data)
-            processed_chunks += 1
-            
-            # Upsert batch when it reaches batch_size
-            if len(vectors_batch) >= batch_size:
-                try:
-                    index.upsert(vectors=vectors_batch)
-                    logger.info(f"📦 Upserted batch of {len(vectors_batch)} chunks "
-                               f"({processed_chunks}/{len(all_chunks)} total)")
-                    vectors_batch = []
-                except Exception as e:
-                    logger.error(f"❌ Failed to upsert chunk batch: {e}")
-                    raise
-            
+            # One embedding call per batch so the model amortizes tokenization
+            embeddings = get_embeddings_batch([chunk.text for chunk in chunk_batch])
         except Exception as e:
-            logger.error(f"❌ Failed to process chunk {i+1}: {e}")
+            # Retry chunk by chunk so one bad chunk does not drop the whole batch; the
+            # local model's encode errors (RuntimeError, OOM) are not EmbeddingServiceError
+            logger.warning(f"⚠️ Batch embedding failed, embedding chunks individually: {e}")
+            embeddings = []
+            for offset, chunk in enumerate(chunk_batch):
+                try:
+                    embeddings.append(get_embedding(chunk.text))
+                except Exception as chunk_error:
+                    logger.error(f"❌ Failed to process chunk {batch_start + offset + 1}: {chunk_error}")
+                    embeddings.append(None)
+                    failed_job_ids.add(chunk.parent_job_id)
+        
+        vectors_batch = [
+            _chunk_vector(chunk, embedding, chunking_strategy)
+            for chunk, embedding in zip(chunk_batch, embeddings)
+            if embedding is not None
+        ]
+        if not vectors_batch:
             continue
+        
+        try:
+            # Sent in the background so the next batch embeds while this one uploads
+            pending_upserts.append((len(vectors_batch), _upsert_async(vectors_batch)))
+        except Exception as e:
+            logger.error(f"❌ Failed to upsert chunk batch: {e}")
+            raise
     
-    # Upsert final batch
-    if vectors_batch:
+    # Wait for the in-flight upserts; errors from the background requests surface here
+    for batch_count, pending in pending_upserts:
         try:
-            index.upsert(vectors=vectors_batch)
-            logger.info(f"📦 Upserted final batch of {len(vectors_batch)} chunks")
+            if pending is not None:
+                pending.get()
         except Exception as e:
-            logger.error(f"❌ Failed to upsert final batch: {e}")
+            logger.error(f"❌ Failed to upsert chunk batch: {e}")
             raise
+        processed_chunks += batch_count
+        logger.info(f"📦 Upserted batch of {batch_count} chunks "
+                   f"({processed_chunks}/{len(all_chunks)} total)")
     
     # Final statistics
     avg_quality = sum(c.confidence_score for c in all_chunks) / len(all_chunks)
@@ -237,4 +324,8 @@ def embed_and_index(jobs: list[dict], batch_size: int = 16, chunking_strategy: s
     logger.info(f"   🧹 Cleaned text (removed boilerplate and HTML)")
     logger.info(f"   📄 Intelligent chunking ({chunking_strategy} strategy)")
     logger.info(f"   🔍 NER metadata extraction")
-    logger.info(f"   🎯 High-precision semantic search")
\ No newline at end of file
+    logger.info(f"   🎯 High-precision semantic search")
+    
+    if failed_job_ids:
+        logger.warning(f"⚠️ {len(failed_job_ids)} jobs only partially indexed - they will be retried")
+    return [job_id for job_id in processed_job_ids if job_id not in failed_job_ids]
\ No newline at end of file
@@ -14,27 +14,149 @@ Uses spaCy for NLP processing with custom patterns and rules.
 
 import re
 import os
+import threading
+import importlib.util
+from collections import OrderedDict
+from copy import deepcopy
 from typing import Dict, List, Set, Optional, Any
+import ahocorasick
+import xxhash
 from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-# Try to import spaCy, handle graceful fallback
-try:
-    import spacy
-    from spacy.matcher import Matcher
-    from spacy.lang.en import English
-    SPACY_AVAILABLE = True
-    logger.info("✅ spaCy NLP library loaded successfully")
-except ImportError:
-    SPACY_AVAILABLE = False
+# spaCy takes about a second to import, so only check that it is installed here
+# and import it when the first extractor is built (see _load_model). Importing
+# this module - and the indexing code that uses it - stays cheap.
+SPACY_AVAILABLE = importlib.util.find_spec("spacy") is not None
+if not SPACY_AVAILABLE:
     logger.warning("⚠️ spaCy not available - NER extraction will be limited to regex patterns")
 
+# Skills found by the regex fallback, grouped by category
+_FALLBACK_SKILLS = (
+    # Programming languages
+    ('Python', 'JavaScript', 'TypeScript', 'Java', 'C++', 'C#', 'Go', 'Rust', 'Ruby', 'PHP', 'Swift', 'Kotlin'),
+    ('React', 'Angular', 'Vue', 'Django', 'Flask', 'FastAPI', 'Express', 'Node.js', 'Spring'),
+    ('PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch', 'SQLite'),
+    ('AWS', 'Azure', 'GCP', 'Google Cloud', 'Docker', 'Kubernetes'),
+    ('Git', 'GitHub', 'GitLab', 'Jira', 'VS Code', 'Postman'),
+)
+
+# Texts shorter than this cannot hold useful metadata and skip extraction entirely
+MIN_METADATA_TEXT_LENGTH = 8
+
+_EMPTY_METADATA = {
+    'skills': [],
+    'experience': {},
+    'salary': {},
+    'locations': [],
+    'education': [],
+    'benefits': [],
+    'company_size': None,
+    'remote_work': False
+}
+
+def _build_skill_automaton(skills):
+    """Build an Aho-Corasick automaton over lowercased skills, storing each skill's length."""
+    automaton = ahocorasick.Automaton()
+    for skill in skills:
+        automaton.add_word(skill.lower(), len(skill))
+    automaton.make_automaton()
+    return automaton
+
+def _build_keyword_automaton(**keywords_by_kind):
+    """Build an Aho-Corasick automaton mapping each keyword to (kind, keyword)."""
+    automaton = ahocorasick.Automaton()
+    for kind, keywords in keywords_by_kind.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (kind, keyword))
+    automaton.make_automaton()
+    return automaton
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Whether `index` sits on a regex \\b boundary in `text`."""
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == '_')
+    after = index < len(text) and (text[index].isalnum() or text[index] == '_')
+    return before != after
+
 class JobMetadataExtractor:
     """
     Extracts structured metadata from job descriptions using NER and pattern matching.
     """
     
+    # Regex fallbacks, compiled once for the class rather than on every call
+    _SKILL_RES = tuple(
+        re.compile(r'\b(?:' + '|'.join(map(re.escape, skills)) + r')\b', re.IGNORECASE)
+        for skills in _FALLBACK_SKILLS
+    )
+    
+    # All fallback skills in one automaton, so the text is scanned once
+    _SKILL_AUTOMATON = _build_skill_automaton(
+        skill for skills in _FALLBACK_SKILLS for skill in skills
+    )
+    
+    # Years of experience
+    _YEARS_RE = re.compile(r'(\d+)[\+]?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)', re.IGNORECASE)
+    
+    # Experience levels in priority order, fused into one alternation so the
+    # text is scanned once; each level is a named group
+    _LEVEL_ORDER = ('entry', 'mid', 'senior', 'executive')
+    _LEVEL_RE = re.compile('|'.join(f'(?P<{level}>{pattern})' for level, pattern in (
+        ('entry', r'\b(?:entry[\-\s]*level|junior|intern|graduate|trainee)\b'),
+        ('mid', r'\b(?:mid[\-\s]*level|intermediate|regular)\b'),
+        ('senior', r'\b(?:senior|lead|principal|staff)\b'),
+        ('executive', r'\b(?:manager|director|head|vp|cto|ceo)\b'),
+    )), re.IGNORECASE)
+    
+    # Salary patterns with context to avoid false positives, checked in order;
+    # each is paired with whether its numbers are in thousands ("k" suffix)
+    _SALARY_RES = tuple((re.compile(pattern, re.IGNORECASE), 'k' in pattern.lower()) for pattern in (
+        # Salary ranges with $ signs (most common format)
+        r'\$(\d{1,3}(?:,\d{3})*)\s*[-–—]\s*\$(\d{1,3}(?:,\d{3})*)',
+        r'salary[:\s]*\$(\d{1,3}(?:,\d{3})*)\s*[-–—]\s*\$(\d{1,3}(?:,\d{3})*)',
+        
+        # K format ranges
+        r'(\d{2,3})k\s*[-–—]\s*(\d{2,3})k',
+        
+        # Single salary amounts with context
+        r'salary[:\s]*\$(\d{1,3}(?:,\d{3})*)',
+        r'compensation[:\s]*\$(\d{1,3}(?:,\d{3})*)',
+        r'pay[:\s]*\$(\d{1,3}(?:,\d{3})*)',
+        
+        # Salary with 'k' suffix (avoiding 401k)
+        r'salary[:\s]*(\d{2,3})k',
+        r'(?<!401\s)(\d{2,3})k(?:\s|$)',  # Not preceded by "401 "
+    ))
+    
+    _REMOTE_KEYWORDS = (
+        'remote', 'work from home', 'wfh', 'telecommute', 'distributed',
+        'anywhere', 'location independent', 'home office', 'virtual'
+    )
+    
+    _BENEFIT_KEYWORDS = (
+        'health insurance', 'dental', 'vision', '401k', 'retirement',
+        'vacation', 'pto', 'paid time off', 'flexible hours', 'gym',
+        'stock options', 'equity', 'bonus', 'commission', 'healthcare',
+        'life insurance', 'disability insurance', 'tuition reimbursement',
+        'professional development', 'conference', 'training'
+    )
+    
+    # Remote and benefit keywords share one automaton; values are (kind, keyword)
+    _KEYWORD_AUTOMATON = _build_keyword_automaton(remote=_REMOTE_KEYWORDS, benefit=_BENEFIT_KEYWORDS)
+    
+    # Common location patterns
+    _LOCATION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\b(?:New York|NYC|San Francisco|SF|Los Angeles|LA|Chicago|Boston|Seattle|Austin|Denver|Miami|Atlanta|Dallas|Phoenix|Portland|San Diego|Washington DC|DC)\b',
+        r'\b(?:California|CA|New York|NY|Texas|TX|Florida|FL|Washington|WA|Illinois|IL|Massachusetts|MA|Colorado|CO|Oregon|OR)\b',
+        r'\b(?:United States|USA|US|Canada|UK|United Kingdom|Germany|France|Netherlands|Australia|Singapore|India)\b',
+    ))
+    
+    _EDUCATION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\b(?:Bachelor|BA|BS|Master|MS|MA|PhD|Doctorate|Associate|AA|AS)\b',
+        r'\b(?:degree|diploma|certification|certificate)\b',
+        r'\b(?:Computer Science|CS|Engineering|Mathematics|Physics|Business|MBA)\b',
+    ))
+    
     def __init__(self):
         """Initialize the metadata extractor with spaCy model and custom patterns."""
         self.nlp = None
@@ -50,6 +172,15 @@ class JobMetadataExtractor:
             logger.warning("🚫 spaCy not available - using regex-only extraction")
             return
             
+        try:
+            import spacy
+            from spacy.matcher import Matcher
+            from spacy.lang.en import English
+            logger.info("✅ spaCy NLP library loaded successfully")
+        except ImportError as e:
+            logger.warning(f"⚠️ spaCy failed to import ({e}) - using regex-only extraction")
+            return
+            
         try:
             # Try to load the English model
             self.nlp = spacy.load("en_core_web_sm")
@@ -175,20 +306,20 @@ class JobMetadataExtractor:
     def extract_skills_regex(self, text: str) -> List[str]:
         """Extract skills using regex patterns as fallback."""
         skills = set()
+        text_lower = text.lower()
         
-        # Common programming languages and technologies
-        skill_patterns = {
-            # Programming languages
-            r'\b(?:Python|JavaScript|TypeScript|Java|C\+\+|C#|Go|Rust|Ruby|PHP|Swift|Kotlin)\b': 'programming',
-            r'\b(?:React|Angular|Vue|Django|Flask|FastAPI|Express|Node\.js|Spring)\b': 'framework',
-            r'\b(?:PostgreSQL|MySQL|MongoDB|Redis|Elasticsearch|SQLite)\b': 'database',
-            r'\b(?:AWS|Azure|GCP|Google Cloud|Docker|Kubernetes)\b': 'cloud',
-            r'\b(?:Git|GitHub|GitLab|Jira|VS Code|Postman)\b': 'tool',
-        }
+        if len(text_lower) != len(text):
+            # A few characters lowercase to a different length, so automaton
+            # offsets would not line up with the original text
+            for pattern in self._SKILL_RES:
+                skills.update(pattern.findall(text))
+            return list(skills)
         
-        for pattern, category in skill_patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            skills.update(matches)
+        # One pass finds every skill; keep those on word boundaries, as \b did
+        for end, length in self._SKILL_AUTOMATON.iter(text_lower):
+            start = end - length + 1
+            if _is_word_boundary(text, start) and _is_word_boundary(text, end + 1):
+                skills.add(text[start:end + 1])
         
         return list(skills)
     
@@ -197,21 +328,18 @@ class JobMetadataExtractor:
         experience_info = {}
         
         # Years of experience
-        years_pattern = r'(\d+)[\+]?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)'
-        years_matches = re.findall(years_pattern, text, re.IGNORECASE)
-        if years_matches:
-            experience_info['years'] = int(years_matches[0])
-        
-        # Experience levels
-        level_patterns = {
-            'entry': r'\b(?:entry[\-\s]*level|junior|intern|graduate|trainee)\b',
-            'mid': r'\b(?:mid[\-\s]*level|intermediate|regular)\b', 
-            'senior': r'\b(?:senior|lead|principal|staff)\b',
-            'executive': r'\b(?:manager|director|head|vp|cto|ceo)\b'
-        }
-        
-        for level, pattern in level_patterns.items():
-            if re.search(pattern, text, re.IGNORECASE):
+        years_match = self._YEARS_RE.search(text)
+        if years_match:
+            experience_info['years'] = int(years_match.group(1))
+        
+        # Experience levels: the highest-priority level mentioned anywhere wins
+        levels_found = set()
+        for match in self._LEVEL_RE.finditer(text):
+            levels_found.add(match.lastgroup)
+            if match.lastgroup == self._LEVEL_ORDER[0]:
+                break
+        for level in self._LEVEL_ORDER:
+            if level in levels_found:
                 experience_info['level'] = level
                 break
         
@@ -221,31 +349,13 @@ class JobMetadataExtractor:
         """Extract salary information using regex."""
         salary_info = {}
         
-        # Salary patterns with context to avoid false positives
-        salary_patterns = [
-            # Salary ranges with $ signs (most common format)
-            r'\$(\d{1,3}(?:,\d{3})*)\s*[-–—]\s*\$(\d{1,3}(?:,\d{3})*)',
-            r'salary[:\s]*\$(\d{1,3}(?:,\d{3})*)\s*[-–—]\s*\$(\d{1,3}(?:,\d{3})*)',
-            
-            # K format ranges
-            r'(\d{2,3})k\s*[-–—]\s*(\d{2,3})k',
-            
-            # Single salary amounts with context
-            r'salary[:\s]*\$(\d{1,3}(?:,\d{3})*)',
-            r'compensation[:\s]*\$(\d{1,3}(?:,\d{3})*)',
-            r'pay[:\s]*\$(\d{1,3}(?:,\d{3})*)',
-            
-            # Salary with 'k' suffix (avoiding 401k)
-            r'salary[:\s]*(\d{2,3})k',
-            r'(?<!401\s)(\d{2,3})k(?:\s|$)',  # Not preceded by "401 "
-        ]
-        
-        for pattern in salary_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                match = matches[0]
+        for pattern, in_thousands in self._SALARY_RES:
+            # Only the first match is used, so stop scanning once it is found
+            found = pattern.search(text)
+            if found:
+                match = found.groups() if pattern.groups == 2 else found.group(1)
                 if isinstance(match, tuple) and len(match) == 2:  # Range
-                    if 'k' in pattern.lower():
+                    if in_thousands:
                         salary_info['min'] = int(match[0]) * 1000
                         salary_info['max'] = int(match[1]) * 1000
                     else:
@@ -254,7 +364,7 @@ class JobMetadataExtractor:
                 else:  # Single value
                     amount_str = match if isinstance(match, str) else match[0]
                     amount = int(amount_str.replace(',', ''))
-                    if 'k' in pattern.lower():
+                    if in_thousands:
                         amount *= 1000
                     # Only consider reasonable salary amounts (20k - 1M)
                     if 20000 <= amount <= 1000000:
@@ -263,12 +373,13 @@ class JobMetadataExtractor:
         
         return salary_info
     
-    def extract_metadata(self, job_text: str) -> Dict[str, Any]:
+    def extract_metadata(self, job_text: str, doc=None) -> Dict[str, Any]:
         """
         Extract comprehensive metadata from job description text.
         
         Args:
             job_text: The job description text to analyze
+            doc: Optional spaCy Doc already parsed from job_text
             
         Returns:
             Dictionary containing extracted metadata
@@ -290,7 +401,7 @@ class JobMetadataExtractor:
         try:
             # Use spaCy if available, otherwise fall back to regex
             if self.nlp and self.matcher:
-                metadata.update(self._extract_with_spacy(job_text))
+                metadata.update(self._extract_with_spacy(job_text, doc))
             else:
                 metadata.update(self._extract_with_regex(job_text))
                 
@@ -303,10 +414,11 @@ class JobMetadataExtractor:
             metadata['skills'] = list(set(metadata['skills']))
             
             # Extract additional metadata
-            metadata['remote_work'] = self._detect_remote_work(job_text)
+            remote_work, benefits = self._scan_keywords(job_text)
+            metadata['remote_work'] = remote_work
             metadata['locations'].extend(self._extract_locations(job_text))
             metadata['education'].extend(self._extract_education(job_text))
-            metadata['benefits'].extend(self._extract_benefits(job_text))
+            metadata['benefits'].extend(benefits)
             
             logger.debug(f"🔍 Extracted metadata: {len(metadata['skills'])} skills, "
                         f"experience: {metadata['experience']}, remote: {metadata['remote_work']}")
@@ -316,12 +428,38 @@ class JobMetadataExtractor:
             
         return metadata
     
-    def _extract_with_spacy(self, text: str) -> Dict[str, Any]:
-        """Extract metadata using spaCy NLP model."""
+    def extract_batch(self, texts: List[str], batch_size: int = 64) -> List[Dict[str, Any]]:
+        """
+        Extract metadata from many job descriptions, parsing them with nlp.pipe.
+        
+        Args:
+            texts: Job description texts to analyze
+            batch_size: Number of texts spaCy processes per batch
+            
+        Returns:
+            List of metadata dictionaries, one per input text
+        """
+        docs = [None] * len(texts)
+        
+        if self.nlp and self.matcher:
+            indices = [i for i, text in enumerate(texts) if text]
+            try:
+                parsed = self.nlp.pipe((texts[i] for i in indices), batch_size=batch_size, n_process=1)
+                for i, doc in zip(indices, parsed):
+                    docs[i] = doc
+            except Exception as e:
+                # Unparsed texts fall back to per-document parsing in extract_metadata
+                logger.error(f"❌ Error in spaCy batch parsing: {e}")
+        
+        return [self.extract_metadata(text, doc) for text, doc in zip(texts, docs)]
+    
+    def _extract_with_spacy(self, text: str, doc=None) -> Dict[str, Any]:
+        """Extract metadata using spaCy NLP model, reusing `doc` when already parsed."""
         metadata = {'skills': [], 'experience': {}, 'salary': {}}
         
         try:
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(text)
             matches = self.matcher(doc)
             
             for match_id, start, end in matches:
@@ -364,28 +502,14 @@ class JobMetadataExtractor:
     
     def _detect_remote_work(self, text: str) -> bool:
         """Detect if job supports remote work."""
-        remote_keywords = [
-            'remote', 'work from home', 'wfh', 'telecommute', 'distributed',
-            'anywhere', 'location independent', 'home office', 'virtual'
-        ]
-        
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in remote_keywords)
+        return self._scan_keywords(text)[0]
     
     def _extract_locations(self, text: str) -> List[str]:
         """Extract location information."""
         locations = []
         
-        # Common location patterns
-        location_patterns = [
-            r'\b(?:New York|NYC|San Francisco|SF|Los Angeles|LA|Chicago|Boston|Seattle|Austin|Denver|Miami|Atlanta|Dallas|Phoenix|Portland|San Diego|Washington DC|DC)\b',
-            r'\b(?:California|CA|New York|NY|Texas|TX|Florida|FL|Washington|WA|Illinois|IL|Massachusetts|MA|Colorado|CO|Oregon|OR)\b',
-            r'\b(?:United States|USA|US|Canada|UK|United Kingdom|Germany|France|Netherlands|Australia|Singapore|India)\b'
-        ]
-        
-        for pattern in location_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            locations.extend(matches)
+        for pattern in self._LOCATION_RES:
+            locations.extend(pattern.findall(text))
         
         return list(set(locations))
     
@@ -393,40 +517,63 @@ class JobMetadataExtractor:
         """Extract education requirements."""
         education = []
         
-        education_patterns = [
-            r'\b(?:Bachelor|BA|BS|Master|MS|MA|PhD|Doctorate|Associate|AA|AS)\b',
-            r'\b(?:degree|diploma|certification|certificate)\b',
-            r'\b(?:Computer Science|CS|Engineering|Mathematics|Physics|Business|MBA)\b'
-        ]
-        
-        for pattern in education_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            education.extend(matches)
+        for pattern in self._EDUCATION_RES:
+            education.extend(pattern.findall(text))
         
         return list(set(education))
     
     def _extract_benefits(self, text: str) -> List[str]:
         """Extract job benefits and perks."""
-        benefits = []
-        
-        benefit_keywords = [
-            'health insurance', 'dental', 'vision', '401k', 'retirement',
-            'vacation', 'pto', 'paid time off', 'flexible hours', 'gym',
-            'stock options', 'equity', 'bonus', 'commission', 'healthcare',
-            'life insurance', 'disability insurance', 'tuition reimbursement',
-            'professional development', 'conference', 'training'
-        ]
+        return self._scan_keywords(text)[1]
+    
+    def _scan_keywords(self, text: str) -> tuple:
+        """Find remote-work and benefit keywords in one pass over the lowercased text.
         
-        text_lower = text.lower()
-        for benefit in benefit_keywords:
-            if benefit in text_lower:
-                benefits.append(benefit)
+        Returns:
+            (remote_work, benefits) with benefits in _BENEFIT_KEYWORDS order
+        """
+        remote = False
+        found_benefits = set()
+        for _, (kind, keyword) in self._KEYWORD_AUTOMATON.iter(text.lower()):
+            if kind == 'remote':
+                remote = True
+            else:
+                found_benefits.add(keyword)
         
-        return benefits
+        benefits = [benefit for benefit in self._BENEFIT_KEYWORDS if benefit in found_benefits]
+        return remote, benefits
 
 # Global extractor instance
 _extractor = None
 
+# Metadata for recently seen job texts, keyed by content hash; re-scraped
+# postings and shared boilerplate skip extraction entirely
+METADATA_CACHE_SIZE = 10_000
+_metadata_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_metadata_cache_lock = threading.Lock()
+
+def _metadata_cache_key(job_text: str) -> bytes:
+    """Content hash identifying a job text in the metadata cache."""
+    return xxhash.xxh3_128_digest(job_text.encode())
+
+def _get_cached_metadata(key: bytes) -> Optional[Dict[str, Any]]:
+    """Return a copy of the cached metadata for `key`, or None on a miss."""
+    with _metadata_cache_lock:
+        metadata = _metadata_cache.get(key)
+        if metadata is None:
+            return None
+        _metadata_cache.move_to_end(key)
+    return deepcopy(metadata)
+
+def _cache_metadata(key: bytes, metadata: Dict[str, Any]):
+    """Store a copy of `metadata`, evicting the least recently used entry when full."""
+    metadata = deepcopy(metadata)
+    with _metadata_cache_lock:
+        _metadata_cache[key] = metadata
+        _metadata_cache.move_to_end(key)
+        if len(_metadata_cache) > METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
+
 def get_metadata_extractor() -> JobMetadataExtractor:
     """Get or create the global metadata extractor instance."""
     global _extractor
@@ -444,8 +591,52 @@ def extract_job_metadata(job_text: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing extracted metadata
     """
-    extractor = get_metadata_extractor()
-    return extractor.extract_metadata(job_text)
+    # Skip loading the extractor for inputs too short to carry metadata
+    if not job_text or len(job_text) < MIN_METADATA_TEXT_LENGTH:
+        return deepcopy(_EMPTY_METADATA)
+    
+    key = _metadata_cache_key(job_text)
+    metadata = _get_cached_metadata(key)
+    if metadata is None:
+        metadata = get_metadata_extractor().extract_metadata(job_text)
+        _cache_metadata(key, metadata)
+    return metadata
+
+def extract_job_metadata_batch(job_texts: List[str]) -> List[Dict[str, Any]]:
+    """
+    Convenience function to extract metadata from many job texts at once.
+    
+    Args:
+        job_texts: Job description texts
+        
+    Returns:
+        List of metadata dictionaries, one per input text
+    """
+    results = [None] * len(job_texts)
+    # Positions of each distinct uncached text, so duplicates are extracted once
+    pending: Dict[bytes, List[int]] = {}
+    
+    for i, text in enumerate(job_texts):
+        if not text or len(text) < MIN_METADATA_TEXT_LENGTH:
+            continue
+        key = _metadata_cache_key(text)
+        if key in pending:
+            pending[key].append(i)
+            continue
+        results[i] = _get_cached_metadata(key)
+        if results[i] is None:
+            pending[key] = [i]
+    
+    if pending:
+        extractor = get_metadata_extractor()
+        extracted = extractor.extract_batch([job_texts[positions[0]] for positions in pending.values()])
+        for (key, positions), metadata in zip(pending.items(), extracted):
+            _cache_metadata(key, metadata)
+            results[positions[0]] = metadata
+            for i in positions[1:]:
+                results[i] = deepcopy(metadata)
+    
+    return [deepcopy(_EMPTY_METADATA) if metadata is None else metadata for metadata in results]
 
 # For testing the module
 if __name__ == "__main__":
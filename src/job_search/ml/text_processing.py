@@ -11,15 +11,21 @@ The goal is to extract the core signal from job descriptions while removing
 marketing jargon, legal boilerplate, and other noise that can dilute embeddings.
 """
 
+import os
 import re
+import sys
 import html
+import bisect
+import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class TextChunk:
     """Represents a processed text chunk from a job description."""
     text: str
@@ -31,16 +37,116 @@ class TextChunk:
     overlap_end: int = 0
     confidence_score: float = 1.0  # Quality score for the chunk
     section_header: Optional[str] = None
+    char_start: int = 0  # Character span of the chunk in the text it was sliced from
+    char_end: int = 0
+    boilerplate_ratio: float = 0.0  # Fraction of the chunk's span covered by boilerplate
+    # Original job metadata carried along with the chunk
+    original_title: str = ''
+    original_company: str = ''
+    original_location: str = ''
+    original_url: str = ''
+    original_source: str = ''
+    ner_metadata: Dict[str, Any] = field(default_factory=dict)  # Filled in during indexing
+
+# Boilerplate removal patterns (more conservative)
+_BOILERPLATE_SOURCES = (
+    # Equal opportunity statements (full sentences)
+    r'\b.*equal\s+opportunity\s+employer.*?\.',
+    r'\b.*we\s+do\s+not\s+discriminate.*?\.',
+    r'\b.*committed\s+to\s+diversity.*?\.',
+    
+    # Application instructions (full sentences)
+    r'\b.*to\s+apply.*?\.',
+    r'\b.*send\s+your\s+resume.*?\.',
+    r'\b.*please\s+submit.*?\.',
+    r'\b.*apply\s+online.*?\.',
+    
+    # Legal and compliance (full sentences)
+    r'\b.*drug[-\s]free\s+workplace.*?\.',
+    r'\b.*background\s+check.*?\.',
+    r'\b.*right\s+to\s+work.*?\.',
+    
+    # Only remove very specific generic phrases
+    r'\b.*great\s+opportunity\s+to\s+join.*?\.',
+    r'\b.*excellent\s+opportunity\s+to\s+join.*?\.',
+)
+
+# Section header vocabulary
+_SECTION_HEADER_TERMS = {
+    'responsibilities': ('responsibilities', 'duties', "what you'll do", 'your role', 'job description'),
+    'requirements': ('requirements', 'qualifications', "what we're looking for", 'must have', 'preferred', 'skills'),
+    'benefits': ('benefits', 'perks', 'what we offer', 'compensation', 'package'),
+    'about': ('about us', 'about the company', 'company', 'overview'),
+    'location': ('location', 'where', 'office'),
+}
 
 class AdvancedTextProcessor:
     """
     Advanced text processor for cleaning and chunking job descriptions.
     """
     
+    # Regex patterns, compiled once for the class rather than per instance
+    
+    # HTML and formatting patterns
+    html_pattern = re.compile(r'<[^>]+>')
+    html_entities = re.compile(r'&[a-zA-Z0-9#]+;')
+    
+    # Punctuation and formatting artifact patterns
+    multiple_exclamations = re.compile(r'!{2,}')
+    multiple_questions = re.compile(r'\?{2,}')
+    multiple_dots = re.compile(r'\.{3,}')
+    
+    # Single alternation so one scan finds every boilerplate span
+    boilerplate_combined = re.compile(
+        '|'.join(f'(?:{source})' for source in _BOILERPLATE_SOURCES),
+        re.IGNORECASE | re.MULTILINE
+    )
+    # One literal word from each boilerplate pattern; text containing none
+    # of them cannot match any pattern, so the regex scan can be skipped
+    boilerplate_anchors = (
+        'opportunity', 'discriminate', 'diversity', 'apply', 'resume',
+        'submit', 'workplace', 'background', 'right',
+    )
+    word_pattern = re.compile(r'\S+')
+    
+    # Exact lookup of normalized header lines (lowercased, single-spaced,
+    # trailing colon stripped) — one dict probe per line
+    section_header_lookup = {
+        term: section_type
+        for section_type, terms in _SECTION_HEADER_TERMS.items()
+        for term in terms
+    }
+    section_header_max_length = max(len(term) for term in section_header_lookup)
+    
+    # Section header fallback (apostrophes match any character): one pattern
+    # with a named group per section type, tried in vocabulary order
+    section_header_pattern = re.compile(
+        r'(?i)^(?:' + '|'.join(
+            f'(?P<{section_type}>' + '|'.join(
+                re.escape(term).replace(r'\ ', r'\s+').replace("'", '.') for term in terms
+            ) + ')'
+            for section_type, terms in _SECTION_HEADER_TERMS.items()
+        ) + r')[\s\:]*$'
+    )
+    
+    # Content quality patterns
+    low_quality_patterns = (
+        re.compile(r'^.{0,20}$'),  # Very short lines
+        re.compile(r'^\s*[-•\*]\s*$'),  # Empty bullet points
+        re.compile(r'^\s*\d+\.\s*$'),  # Empty numbered lists
+        re.compile(r'^\s*[:\-\=]{3,}\s*$'),  # Separator lines
+    )
+    list_item_pattern = re.compile(r'[•\-\*]\s+|\d+\.\s+')  # Bullets or numbered items
+    
+    # Keywords that reward technical content, matched against whole words
+    technical_keywords = frozenset({'experience', 'required', 'skills', 'responsibilities', 'qualifications'})
+    keyword_strip_chars = '.,;:!?()[]{}"\'*-•'
+    
     def __init__(self, 
                  max_chunk_size: int = 512,
-                 overlap_size: int = 50,
-                 min_chunk_size: int = 100):
+                 overlap_size: Optional[int] = None,
+                 min_chunk_size: int = 100,
+                 stride: Optional[int] = None):
         """
         Initialize the text processor.
         
@@ -48,65 +154,22 @@ class AdvancedTextProcessor:
             max_chunk_size: Maximum words per chunk
             overlap_size: Number of words to overlap between chunks
             min_chunk_size: Minimum words for a valid chunk
+            stride: Words to advance between chunk starts. Defaults to
+                max_chunk_size - overlap_size, or 0.75 * max_chunk_size when
+                neither is given. A stride above max_chunk_size skips words.
         """
+        if stride is None:
+            stride = max_chunk_size - overlap_size if overlap_size is not None else int(0.75 * max_chunk_size)
+        if stride <= 0:
+            raise ValueError(f"stride must be positive, got {stride}")
+        
         self.max_chunk_size = max_chunk_size
-        self.overlap_size = overlap_size
+        self.stride = stride
+        self.overlap_size = overlap_size if overlap_size is not None else max(0, max_chunk_size - stride)
         self.min_chunk_size = min_chunk_size
         
-        # Compile regex patterns for better performance
-        self._compile_patterns()
-        
         logger.info(f"✅ Text processor initialized - max_chunk: {max_chunk_size}, "
-                   f"overlap: {overlap_size}, min_chunk: {min_chunk_size}")
-    
-    def _compile_patterns(self):
-        """Compile regex patterns for text cleaning."""
-        
-        # HTML and formatting patterns
-        self.html_pattern = re.compile(r'<[^>]+>')
-        self.html_entities = re.compile(r'&[a-zA-Z0-9#]+;')
-        self.multiple_spaces = re.compile(r'\s+')
-        self.line_breaks = re.compile(r'\n+')
-        
-        # Boilerplate removal patterns (more conservative)
-        self.boilerplate_patterns = [
-            # Equal opportunity statements (full sentences)
-            re.compile(r'(?i)\b.*equal\s+opportunity\s+employer.*?\.', re.MULTILINE),
-            re.compile(r'(?i)\b.*we\s+do\s+not\s+discriminate.*?\.', re.MULTILINE),
-            re.compile(r'(?i)\b.*committed\s+to\s+diversity.*?\.', re.MULTILINE),
-            
-            # Application instructions (full sentences)
-            re.compile(r'(?i)\b.*to\s+apply.*?\.', re.MULTILINE),
-            re.compile(r'(?i)\b.*send\s+your\s+resume.*?\.', re.MULTILINE),
-            re.compile(r'(?i)\b.*please\s+submit.*?\.', re.MULTILINE),
-            re.compile(r'(?i)\b.*apply\s+online.*?\.', re.MULTILINE),
-            
-            # Legal and compliance (full sentences)
-            re.compile(r'(?i)\b.*drug[-\s]free\s+workplace.*?\.', re.MULTILINE),
-            re.compile(r'(?i)\b.*background\s+check.*?\.', re.MULTILINE),
-            re.compile(r'(?i)\b.*right\s+to\s+work.*?\.', re.MULTILINE),
-            
-            # Only remove very specific generic phrases
-            re.compile(r'(?i)\b.*great\s+opportunity\s+to\s+join.*?\.', re.MULTILINE),
-            re.compile(r'(?i)\b.*excellent\s+opportunity\s+to\s+join.*?\.', re.MULTILINE),
-        ]
-        
-        # Section header patterns
-        self.section_headers = {
-            'responsibilities': re.compile(r'(?i)^(responsibilities|duties|what\s+you.ll\s+do|your\s+role|job\s+description)[\s\:]*$', re.MULTILINE),
-            'requirements': re.compile(r'(?i)^(requirements|qualifications|what\s+we.re\s+looking\s+for|must\s+have|preferred|skills)[\s\:]*$', re.MULTILINE),
-            'benefits': re.compile(r'(?i)^(benefits|perks|what\s+we\s+offer|compensation|package)[\s\:]*$', re.MULTILINE),
-            'about': re.compile(r'(?i)^(about\s+us|about\s+the\s+company|company|overview)[\s\:]*$', re.MULTILINE),
-            'location': re.compile(r'(?i)^(location|where|office)[\s\:]*$', re.MULTILINE)
-        }
-        
-        # Content quality patterns
-        self.low_quality_patterns = [
-            re.compile(r'^.{0,20}$'),  # Very short lines
-            re.compile(r'^\s*[-•\*]\s*$'),  # Empty bullet points
-            re.compile(r'^\s*\d+\.\s*$'),  # Empty numbered lists
-            re.compile(r'^\s*[:\-\=]{3,}\s*$'),  # Separator lines
-        ]
+                   f"overlap: {self.overlap_size}, stride: {stride}, min_chunk: {min_chunk_size}")
     
     def clean_text(self, text: str) -> str:
         """
@@ -122,32 +185,29 @@ class AdvancedTextProcessor:
             return ""
         
         original_length = len(text)
+        removed_patterns = 0
         
-        # 1. HTML cleaning
-        text = self.html_pattern.sub(' ', text)
-        text = html.unescape(text)  # Convert HTML entities
-        text = self.html_entities.sub(' ', text)
+        # 1. HTML cleaning (only when markup or entities are present)
+        if '<' in text or '&' in text:
+            # No tag can close past the last '>', so leave that tail out of the
+            # scan; otherwise each stray '<' there rescans to the end of the text
+            tags_end = text.rfind('>') + 1
+            text = self.html_pattern.sub(' ', text[:tags_end]) + text[tags_end:]
+            text = html.unescape(text)  # Convert HTML entities
+            text = self.html_entities.sub(' ', text)
         
-        # 2. Remove boilerplate text
-        removed_patterns = 0
-        for pattern in self.boilerplate_patterns:
-            matches = pattern.findall(text)
-            if matches:
-                text = pattern.sub('', text)
-                removed_patterns += len(matches)
+        # 2. Remove boilerplate text (only when a pattern could match)
+        if self._may_contain_boilerplate(text):
+            text, removed_patterns = self.boilerplate_combined.subn('', text)
         
-        # 3. Normalize whitespace
-        text = self.line_breaks.sub('\n', text)
-        text = self.multiple_spaces.sub(' ', text)
+        # 3. Normalize whitespace: collapse every run (newlines included) to one
+        # space and trim the ends
+        text = ' '.join(text.split())
         
         # 4. Remove excessive punctuation
-        text = re.sub(r'[!]{2,}', '!', text)  # Multiple exclamations
-        text = re.sub(r'[?]{2,}', '?', text)  # Multiple questions
-        text = re.sub(r'[\.]{3,}', '...', text)  # Multiple dots
-        
-        # 5. Clean up formatting artifacts
-        text = re.sub(r'\s*\n\s*\n\s*', '\n\n', text)  # Multiple newlines
-        text = re.sub(r'^\s+|\s+$', '', text)  # Leading/trailing whitespace
+        text = self.multiple_exclamations.sub('!', text)
+        text = self.multiple_questions.sub('?', text)
+        text = self.multiple_dots.sub('...', text)
         
         cleaned_length = len(text)
         reduction_pct = ((original_length - cleaned_length) / original_length) * 100 if original_length > 0 else 0
@@ -178,11 +238,13 @@ class AdvancedTextProcessor:
                 continue
             
             # Check if this line is a section header
-            section_found = None
-            for section_type, pattern in self.section_headers.items():
-                if pattern.search(line):
-                    section_found = section_type
-                    break
+            header_key = ' '.join(line.lower().split()).rstrip(' :')
+            section_found = self.section_header_lookup.get(header_key)
+            if section_found is None and len(header_key) <= self.section_header_max_length:
+                # Short lines may still be headers with apostrophe variants
+                match = self.section_header_pattern.match(line)
+                if match:
+                    section_found = match.lastgroup
             
             if section_found:
                 # Save previous section if it has content
@@ -220,14 +282,14 @@ class AdvancedTextProcessor:
         if strategy == 'sections':
             chunks = self._create_section_chunks(text, job_id)
         elif strategy == 'overlapping':
-            chunks = self._create_overlapping_chunks(text, job_id)
+            chunks = self._create_overlapping_chunks(text, job_id, self._find_boilerplate_spans(text))
         elif strategy == 'hybrid':
             # Use section-based chunking if sections found, otherwise overlapping
-            sections = self.identify_sections(text)
+            sections = self.identify_sections(text) if self._may_have_sections(text) else {}
             if len(sections) > 1:
-                chunks = self._create_section_chunks(text, job_id)
+                chunks = self._create_section_chunks(text, job_id, sections)
             else:
-                chunks = self._create_overlapping_chunks(text, job_id)
+                chunks = self._create_overlapping_chunks(text, job_id, self._find_boilerplate_spans(text))
         
         # Filter out low-quality chunks
         chunks = self._filter_chunks(chunks)
@@ -235,10 +297,12 @@ class AdvancedTextProcessor:
         logger.info(f"📄 Created {len(chunks)} chunks for job {job_id} using {strategy} strategy")
         return chunks
     
-    def _create_section_chunks(self, text: str, job_id: str) -> List[TextChunk]:
-        """Create chunks based on identified sections."""
+    def _create_section_chunks(self, text: str, job_id: str,
+                               sections: Optional[Dict[str, str]] = None) -> List[TextChunk]:
+        """Create chunks based on identified sections, reusing `sections` when already identified."""
         chunks = []
-        sections = self.identify_sections(text)
+        if sections is None:
+            sections = self.identify_sections(text)
         
         for i, (section_type, section_content) in enumerate(sections.items()):
             if not section_content:
@@ -251,6 +315,8 @@ class AdvancedTextProcessor:
                 # Merge small sections with the next one
                 continue
             
+            section_spans = self._find_boilerplate_spans(section_content)
+            
             if word_count <= self.max_chunk_size:
                 # Section fits in one chunk
                 chunk = TextChunk(
@@ -260,12 +326,15 @@ class AdvancedTextProcessor:
                     parent_job_id=job_id,
                     word_count=word_count,
                     section_header=section_type.title(),
-                    confidence_score=self._calculate_chunk_quality(section_content)
+                    confidence_score=self._calculate_chunk_quality(section_content, words),
+                    char_start=0,
+                    char_end=len(section_content),
+                    boilerplate_ratio=self._boilerplate_ratio(section_spans, 0, len(section_content))
                 )
                 chunks.append(chunk)
             else:
                 # Split large section into overlapping chunks
-                sub_chunks = self._split_long_section(section_content, section_type, job_id, i)
+                sub_chunks = self._split_long_section(section_content, section_type, job_id, i, section_spans)
                 chunks.extend(sub_chunks)
         
         # Always create a full-text chunk for fallback
@@ -277,16 +346,20 @@ class AdvancedTextProcessor:
                 chunk_index=len(chunks),
                 parent_job_id=job_id,
                 word_count=len(full_text_words),
-                confidence_score=0.8  # Lower score for full text
+                confidence_score=0.8,  # Lower score for full text
+                char_start=0,
+                char_end=len(text),
+                boilerplate_ratio=self._boilerplate_ratio(self._find_boilerplate_spans(text), 0, len(text))
             )
             chunks.append(full_chunk)
         
         return chunks
     
-    def _create_overlapping_chunks(self, text: str, job_id: str) -> List[TextChunk]:
+    def _create_overlapping_chunks(self, text: str, job_id: str,
+                                   removed_spans: List[Tuple[int, int]]) -> List[TextChunk]:
         """Create overlapping chunks from text."""
         chunks = []
-        words = text.split()
+        words, starts, ends = self._compute_chunk_spans(text)
         
         if len(words) <= self.max_chunk_size:
             # Single chunk
@@ -296,24 +369,29 @@ class AdvancedTextProcessor:
                 chunk_index=0,
                 parent_job_id=job_id,
                 word_count=len(words),
-                confidence_score=self._calculate_chunk_quality(text)
+                confidence_score=self._calculate_chunk_quality(text, words),
+                char_start=0,
+                char_end=len(text),
+                boilerplate_ratio=self._boilerplate_ratio(removed_spans, 0, len(text))
             )
             return [chunk]
         
         # Create overlapping chunks
-        start = 0
-        chunk_index = 0
+        n = len(words)
+        windows = self._chunk_windows(n)
+        chunks: List[TextChunk] = [None] * len(windows)
         
-        while start < len(words):
-            end = min(start + self.max_chunk_size, len(words))
+        for chunk_index, (start, end) in enumerate(windows):
             chunk_words = words[start:end]
-            chunk_text = ' '.join(chunk_words)
+            char_start, char_end = starts[start], ends[end - 1]
+            # Slice the source text rather than rejoining the words
+            chunk_text = text[char_start:char_end]
             
             # Calculate overlap
             overlap_start = max(0, start - self.overlap_size) if start > 0 else 0
-            overlap_end = min(end + self.overlap_size, len(words)) if end < len(words) else end
+            overlap_end = min(end + self.overlap_size, n) if end < n else end
             
-            chunk = TextChunk(
+            chunks[chunk_index] = TextChunk(
                 text=chunk_text,
                 chunk_type='segment',
                 chunk_index=chunk_index,
@@ -321,45 +399,68 @@ class AdvancedTextProcessor:
                 word_count=len(chunk_words),
                 overlap_start=overlap_start,
                 overlap_end=overlap_end,
-                confidence_score=self._calculate_chunk_quality(chunk_text)
+                confidence_score=self._calculate_chunk_quality(chunk_text, chunk_words),
+                char_start=char_start,
+                char_end=char_end,
+                boilerplate_ratio=self._boilerplate_ratio(removed_spans, char_start, char_end)
             )
-            chunks.append(chunk)
-            
-            # Move to next chunk with overlap
-            start += self.max_chunk_size - self.overlap_size
-            chunk_index += 1
         
         return chunks
     
-    def _split_long_section(self, text: str, section_type: str, job_id: str, base_index: int) -> List[TextChunk]:
+    def _split_long_section(self, text: str, section_type: str, job_id: str, base_index: int,
+                            removed_spans: List[Tuple[int, int]]) -> List[TextChunk]:
         """Split a long section into overlapping chunks."""
-        chunks = []
-        words = text.split()
-        start = 0
-        sub_index = 0
-        
-        while start < len(words):
-            end = min(start + self.max_chunk_size, len(words))
+        words, starts, ends = self._compute_chunk_spans(text)
+        windows = self._chunk_windows(len(words))
+        chunks: List[TextChunk] = [None] * len(windows)
+        # Every part shares one interned type string and header rather than a copy each
+        chunk_type = sys.intern(f"{section_type}_part")
+        section_header = section_type.title()
+        
+        for sub_index, (start, end) in enumerate(windows):
             chunk_words = words[start:end]
-            chunk_text = ' '.join(chunk_words)
+            char_start, char_end = starts[start], ends[end - 1]
+            # Slice the source text rather than rejoining the words
+            chunk_text = text[char_start:char_end]
             
-            chunk = TextChunk(
+            chunks[sub_index] = TextChunk(
                 text=chunk_text,
-                chunk_type=f"{section_type}_part",
+                chunk_type=chunk_type,
                 chunk_index=base_index * 100 + sub_index,  # Unique indexing
                 parent_job_id=job_id,
                 word_count=len(chunk_words),
-                section_header=section_type.title(),
-                confidence_score=self._calculate_chunk_quality(chunk_text)
+                section_header=section_header,
+                confidence_score=self._calculate_chunk_quality(chunk_text, chunk_words),
+                char_start=char_start,
+                char_end=char_end,
+                boilerplate_ratio=self._boilerplate_ratio(removed_spans, char_start, char_end)
             )
-            chunks.append(chunk)
-            
-            start += self.max_chunk_size - self.overlap_size
-            sub_index += 1
         
         return chunks
     
-    def _calculate_chunk_quality(self, text: str) -> float:
+    def _chunk_windows(self, n_words: int) -> List[Tuple[int, int]]:
+        """Compute the [start, end) word ranges of the sliding windows over n_words words."""
+        max_chunk_size = self.max_chunk_size
+        stride = self.stride
+        # The last window is the first to reach the end; with a stride above
+        # max_chunk_size the next start may already be past the last word
+        n_windows = max(1, min((n_words - max_chunk_size + stride - 1) // stride + 1,
+                               (n_words + stride - 1) // stride))
+        return [(start, min(start + max_chunk_size, n_words))
+                for start in range(0, n_windows * stride, stride)]
+    
+    def _compute_chunk_spans(self, text: str) -> Tuple[List[str], List[int], List[int]]:
+        """Split text into words along with each word's start/end character offsets."""
+        words = []
+        starts = []
+        ends = []
+        for match in self.word_pattern.finditer(text):
+            words.append(match.group())
+            starts.append(match.start())
+            ends.append(match.end())
+        return words, starts, ends
+    
+    def _calculate_chunk_quality(self, text: str, words: Optional[List[str]] = None) -> float:
         """Calculate quality score for a chunk (0.0 to 1.0)."""
         if not text:
             return 0.0
@@ -367,7 +468,8 @@ class AdvancedTextProcessor:
         score = 1.0
         
         # Penalize very short text
-        words = text.split()
+        if words is None:
+            words = text.split()
         if len(words) < 20:
             score *= 0.5
         
@@ -378,12 +480,13 @@ class AdvancedTextProcessor:
                 break
         
         # Reward technical content
-        technical_keywords = ['experience', 'required', 'skills', 'responsibilities', 'qualifications']
-        tech_count = sum(1 for keyword in technical_keywords if keyword.lower() in text.lower())
+        strip_chars = self.keyword_strip_chars
+        word_set = {word.strip(strip_chars).casefold() for word in words}
+        tech_count = len(self.technical_keywords & word_set)
         score += tech_count * 0.1
         
         # Reward structured content (bullet points, lists)
-        if re.search(r'[•\-\*]\s+', text) or re.search(r'\d+\.\s+', text):
+        if self.list_item_pattern.search(text):
             score += 0.1
         
         return min(1.0, score)
@@ -402,8 +505,7 @@ class AdvancedTextProcessor:
                 continue
             
             # Skip chunks with mostly boilerplate
-            boilerplate_ratio = self._calculate_boilerplate_ratio(chunk.text)
-            if boilerplate_ratio > 0.7:
+            if chunk.boilerplate_ratio > 0.7:
                 continue
             
             filtered.append(chunk)
@@ -411,20 +513,39 @@ class AdvancedTextProcessor:
         logger.debug(f"🔍 Filtered {len(chunks)} → {len(filtered)} chunks")
         return filtered
     
-    def _calculate_boilerplate_ratio(self, text: str) -> float:
-        """Calculate ratio of boilerplate content in text."""
-        if not text:
+    def _may_have_sections(self, text: str) -> bool:
+        """Cheap prefilter: False when identify_sections cannot find more than one section."""
+        # Headers are whole lines, so a second section needs a line break
+        return '\n' in text
+    
+    def _may_contain_boilerplate(self, text: str) -> bool:
+        """Cheap prefilter: False when no boilerplate pattern can match text."""
+        lower = text.lower()
+        return any(anchor in lower for anchor in self.boilerplate_anchors)
+    
+    def _find_boilerplate_spans(self, text: str) -> List[Tuple[int, int]]:
+        """Find sorted, non-overlapping character spans of boilerplate in text."""
+        if not self._may_contain_boilerplate(text):
+            return []
+        return [match.span() for match in self.boilerplate_combined.finditer(text)]
+    
+    def _boilerplate_ratio(self, spans: List[Tuple[int, int]], start: int, end: int) -> float:
+        """Calculate ratio of boilerplate content within the [start, end) character span."""
+        if end <= start:
             return 1.0
+        if not spans:
+            return 0.0
         
-        original_length = len(text)
-        cleaned = text
-        
-        # Remove matches from boilerplate patterns
-        for pattern in self.boilerplate_patterns:
-            cleaned = pattern.sub('', cleaned)
+        # Spans are sorted and disjoint, so only the span before the insertion
+        # point can straddle `start`
+        i = max(0, bisect.bisect_left(spans, (start, start)) - 1)
+        covered = 0
+        while i < len(spans) and spans[i][0] < end:
+            span_start, span_end = spans[i]
+            covered += max(0, min(span_end, end) - max(span_start, start))
+            i += 1
         
-        removed_length = original_length - len(cleaned)
-        return removed_length / original_length if original_length > 0 else 0.0
+        return covered / (end - start)
     
     def process_job_description(self, job_data: Dict[str, Any], 
                               chunking_strategy: str = 'hybrid') -> List[TextChunk]:
@@ -445,6 +566,12 @@ class AdvancedTextProcessor:
             logger.warning(f"⚠️ No text found for job {job_id}")
             return []
         
+        # Every kept chunk has min_chunk_size words and cleaning never lengthens
+        # text, so shorter input cannot produce a chunk
+        if len(raw_text) < 2 * self.min_chunk_size - 1:
+            logger.debug(f"⏭️ Job {job_id} too short to chunk ({len(raw_text)} chars)")
+            return []
+        
         logger.info(f"🔄 Processing job {job_id} - {len(raw_text)} chars, strategy: {chunking_strategy}")
         
         # 1. Clean the text
@@ -458,13 +585,18 @@ class AdvancedTextProcessor:
         chunks = self.create_chunks(cleaned_text, job_id, chunking_strategy)
         
         # 3. Add original job metadata to chunks
+        original_title = job_data.get('title', '')
+        original_company = job_data.get('company', '')
+        original_location = job_data.get('location', '')
+        original_url = job_data.get('url', '')
+        original_source = job_data.get('source', '')
         for chunk in chunks:
             # Preserve original job metadata in chunk
-            chunk.original_title = job_data.get('title', '')
-            chunk.original_company = job_data.get('company', '')
-            chunk.original_location = job_data.get('location', '')
-            chunk.original_url = job_data.get('url', '')
-            chunk.original_source = job_data.get('source', '')
+            chunk.original_title = original_title
+            chunk.original_company = original_company
+            chunk.original_location = original_location
+            chunk.original_url = original_url
+            chunk.original_source = original_source
         
         logger.info(f"✅ Processed job {job_id} → {len(chunks)} chunks")
         return chunks
@@ -475,33 +607,28 @@ class AdvancedTextProcessor:
             return {}
         
         chunk_types = {}
-        word_counts = []
-        quality_scores = []
-        
         for chunk in chunks:
             chunk_types[chunk.chunk_type] = chunk_types.get(chunk.chunk_type, 0) + 1
-            word_counts.append(chunk.word_count)
-            quality_scores.append(chunk.confidence_score)
+        
+        # Column arrays so the reductions run in NumPy rather than Python loops
+        word_counts = np.fromiter((chunk.word_count for chunk in chunks), dtype=np.int32, count=len(chunks))
+        quality_scores = np.fromiter((chunk.confidence_score for chunk in chunks), dtype=np.float64, count=len(chunks))
         
         return {
             'total_chunks': len(chunks),
             'chunk_types': chunk_types,
-            'avg_words_per_chunk': sum(word_counts) / len(word_counts),
-            'avg_quality_score': sum(quality_scores) / len(quality_scores),
-            'min_words': min(word_counts),
-            'max_words': max(word_counts),
-            'total_words': sum(word_counts)
+            'avg_words_per_chunk': float(word_counts.mean()),
+            'avg_quality_score': float(quality_scores.mean()),
+            'min_words': int(word_counts.min()),
+            'max_words': int(word_counts.max()),
+            'total_words': int(word_counts.sum())
         }
 
 # Global processor instance
-_processor = None
-
+@lru_cache(maxsize=1)
 def get_text_processor() -> AdvancedTextProcessor:
     """Get or create the global text processor instance."""
-    global _processor
-    if _processor is None:
-        _processor = AdvancedTextProcessor()
-    return _processor
+    return AdvancedTextProcessor()
 
 def process_job_text(job_data: Dict[str, Any], 
                     chunking_strategy: str = 'hybrid') -> List[TextChunk]:
@@ -518,6 +645,33 @@ def process_job_text(job_data: Dict[str, Any],
     processor = get_text_processor()
     return processor.process_job_description(job_data, chunking_strategy)
 
+def process_jobs_batch(jobs: List[Dict[str, Any]],
+                       chunking_strategy: str = 'hybrid',
+                       n_workers: Optional[int] = None) -> List[List[TextChunk]]:
+    """
+    Process many job descriptions in parallel worker processes.
+    
+    Each worker builds its own text processor once through get_text_processor.
+    Must not be called from a daemonic process (e.g. a Celery prefork worker),
+    which cannot start children; pass n_workers=1 there to run inline.
+    
+    Args:
+        jobs: Job data dictionaries
+        chunking_strategy: Chunking strategy to use
+        n_workers: Worker processes to use (defaults to the CPU count)
+        
+    Returns:
+        List of TextChunk lists, one per job in input order
+    """
+    n_workers = min(n_workers or os.cpu_count() or 1, len(jobs))
+    process_one = partial(process_job_text, chunking_strategy=chunking_strategy)
+    
+    if n_workers <= 1:
+        return [process_one(job) for job in jobs]
+    
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(process_one, jobs, chunksize=max(1, len(jobs) // (n_workers * 4))))
+
 def clean_job_text(text: str) -> str:
     """
     Convenience function to clean job description text.
@@ -16,6 +16,8 @@ result_backend = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 task_serializer = 'json'
 accept_content = ['json']
 result_serializer = 'json'
+task_compression = 'lz4'  # Chunked job text compresses well; decompression is transparent
+result_compression = 'lz4'
 timezone = 'UTC'
 enable_utc = True
 
@@ -96,6 +98,8 @@ task_acks_late = True
 broker_connection_retry = True
 broker_connection_retry_on_startup = True
 broker_connection_max_retries = 10
+# Pool size and Redis keepalive transport options live in the inline
+# configuration in tasks.py, which is what celery_app actually loads
 
 # Advanced settings for production
 worker_pool_restarts = True  # Enable pool restarts for better memory management
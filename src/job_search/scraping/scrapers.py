@@ -1,13 +1,237 @@
+import os
+import html
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+import ahocorasick
+import orjson
+import redis
 import requests
-from bs4 import BeautifulSoup
+from requests_cache import CachedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound
+from lxml.etree import HTMLPullParser
 import re
-import xml.etree.ElementTree as ET
-import hashlib
+import xxhash
 from datetime import datetime
 from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+_REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds
+
+# The Muse pagination limits (polite concurrency and an upper bound on pages)
+_THEMUSE_MAX_PAGES = 10
+_THEMUSE_PAGE_WORKERS = 8
+
+# Hacker News pages are parsed incrementally from chunks of this size
+_HN_CHUNK_SIZE = 65536
+
+# HTML fragment patterns for description cleaning
+_TAG_RE = re.compile(r'<[^>]+>')
+_UNSAFE_MARKUP_RE = re.compile(r'<(?:script|style|!\[CDATA\[)', re.IGNORECASE)
+
+# Job text normalization patterns used for deduplication
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_PREFIX_KEY_WORDS = 64  # Leading words fingerprinted for the cheap dedup pre-check
+
+# Cross-run "already indexed" Bloom filter (~1.8MB in Redis at 1M jobs / 0.1% FPR)
+_SEEN_JOBS_KEY = 'seen_jobs'
+_SEEN_JOBS_ERROR_RATE = 0.001
+_SEEN_JOBS_CAPACITY = 1_000_000
+
+# Fallback for SeenJobFilter when Redis Bloom is unavailable (per worker process)
+_LOCAL_SEEN_JOB_IDS = set()
+
+def _create_session(cached=True):
+    """
+    Create an HTTP session with pooled keep-alive connections and retries.
+    
+    Args:
+        cached (bool): Whether responses go through the on-disk HTTP cache
+    
+    Returns:
+        requests.Session: Session shared by the scrapers
+    """
+    if cached:
+        # On-disk HTTP cache: stores ETag/Last-Modified and revalidates with
+        # conditional GETs, so unchanged feeds come back as 304 with no body
+        session = CachedSession(
+            cache_name=os.getenv('SCRAPE_CACHE_PATH', 'scrape_cache'),
+            backend='sqlite',
+            use_cache_dir=True,  # Relative names resolve to the user cache directory
+            expire_after=3600,
+            cache_control=True
+        )
+    else:
+        session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    # Set once on the session instead of being merged into every request
+    session.headers.update(_DEFAULT_HEADERS)
+    return session
+
+# Sessions by `cached` flag, reused across scrapes so TCP/TLS connections are
+# kept alive between requests. They belong to the process that built them:
+# Celery imports this module before forking its workers, and a forked child must
+# not share the parent's SQLite cache connection or pooled sockets
+_SESSIONS = {}
+_SESSIONS_PID = None
+_SESSIONS_LOCK = threading.Lock()
+_INHERITED_SESSIONS = []
+
+def _get_session(cached=True):
+    """
+    Return this process's shared session, creating it on first use.
+    
+    Args:
+        cached (bool): Whether responses go through the on-disk HTTP cache.
+            CachedSession reads and stores the whole body before iter_content
+            yields anything, so streamed downloads use the uncached session
+    
+    Returns:
+        requests.Session: Session shared by the scrapers in this process
+    """
+    global _SESSIONS_PID
+    with _SESSIONS_LOCK:
+        if _SESSIONS_PID != os.getpid():
+            # Sessions inherited from the parent are set aside but kept referenced:
+            # closing the inherited SQLite connection here would release the
+            # parent's file locks, which is as unsafe as using it
+            _INHERITED_SESSIONS.extend(_SESSIONS.values())
+            _SESSIONS.clear()
+            _SESSIONS_PID = os.getpid()
+        session = _SESSIONS.get(cached)
+        if session is None:
+            session = _SESSIONS[cached] = _create_session(cached)
+        return session
+
+# Parsed postings per URL, keyed by the response validators they were parsed from
+_PARSED_CACHE = {}
+
+def _response_validators(response):
+    """Return the (ETag, Last-Modified) pair identifying a response body, or None."""
+    validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+    return validators if any(validators) else None
+
+def _get_cached_postings(url, response):
+    """
+    Return previously parsed postings when the response was served unchanged from cache.
+    
+    Args:
+        url (str): Requested URL
+        response (requests.Response): Response from the shared session
+        
+    Returns:
+        list | None: Copies of the cached postings, or None if the body must be parsed
+    """
+    if not getattr(response, 'from_cache', False):
+        return None
+    validators = _response_validators(response)
+    cached = _PARSED_CACHE.get(url)
+    if validators is None or cached is None or cached[0] != validators:
+        return None
+    # Callers annotate job dicts in place, so hand out copies the cache never shares
+    return [dict(job) for job in cached[1]]
+
+def _remember_postings(url, response, job_postings):
+    """Remember parsed postings for a URL so an unchanged response can skip parsing."""
+    validators = _response_validators(response)
+    if validators is not None:
+        _PARSED_CACHE[url] = (validators, [dict(job) for job in job_postings])
+
+def _make_soup(markup):
+    """
+    Parse HTML with the C-backed lxml parser, falling back to html.parser.
+    
+    Args:
+        markup (str | bytes): HTML document or fragment
+        
+    Returns:
+        BeautifulSoup: Parsed document
+    """
+    try:
+        return BeautifulSoup(markup, 'lxml')
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser')
+
+def _strip_html(markup):
+    """
+    Convert an HTML fragment to text, one stripped text run per line.
+    
+    Simple fragments (<p>, <br>, <li>...) are handled with a tag regex and
+    html.unescape; BeautifulSoup is only used when the fragment contains
+    script, style or CDATA content that a regex cannot strip safely.
+    
+    Args:
+        markup (str): HTML fragment
+        
+    Returns:
+        str: Newline-separated text, matching BeautifulSoup's stripped get_text
+    """
+    if _UNSAFE_MARKUP_RE.search(markup):
+        return _make_soup(markup).get_text(separator='\n', strip=True)
+    
+    text = html.unescape(_TAG_RE.sub('\n', markup))
+    return '\n'.join(line.strip() for line in text.split('\n') if line and not line.isspace())
+
+def _is_comment_row(row):
+    """Return True for a Hacker News comment row (<tr class="athing comtr">)."""
+    classes = row.get('class', '').split()
+    return 'athing' in classes and 'comtr' in classes
+
+def _iter_top_level_comments(chunks):
+    """
+    Incrementally parse a Hacker News thread and yield its top-level comments.
+    
+    Each comment row is cleared once read and earlier siblings are dropped,
+    so peak memory stays around one chunk plus one comment, not the full tree.
+    
+    Args:
+        chunks (Iterable[bytes]): HTML body chunks, e.g. from response.iter_content
+        
+    Yields:
+        tuple: (comment_id, text) with one stripped text run per line
+    """
+    parser = HTMLPullParser(events=('end',), tag='tr')
+    
+    def read_comments():
+        for _, row in parser.read_events():
+            # Comment bodies contain nested layout rows; only whole comment rows are handled
+            if not _is_comment_row(row):
+                continue
+            
+            # Top-level comments have an indentation width of 0
+            comment_id = row.get('id')
+            if comment_id and row.find('.//img[@width="0"]') is not None:
+                text_divs = row.xpath('.//div[contains(concat(" ", normalize-space(@class), " "), " commtext ")]')
+                if text_divs:
+                    text = '\n'.join(piece.strip() for piece in text_divs[0].itertext() if piece.strip())
+                    yield comment_id, text
+            
+            row.clear()
+            parent = row.getparent()
+            if parent is not None:
+                while row.getprevious() is not None:
+                    del parent[0]
+    
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from read_comments()
+    parser.close()
+    yield from read_comments()
+
 def get_job_postings(url):
     """
     Scrapes the first page of a Hacker News "Who is Hiring?" thread for job postings.
@@ -19,32 +243,15 @@ def get_job_postings(url):
         list: A list of dictionaries, where each dictionary represents a job
               and has 'id' and 'text' keys. Returns an empty list on failure.
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
     job_postings = []
 
     try:
         logger.info(f"📰 Fetching job postings from: {url}")
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # Raise an exception for bad status codes
-
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        # Find all top-level comments
-        comments = soup.find_all('tr', class_='athing comtr')
-        for comment in comments:
-            # Top-level comments have an indentation width of 0
-            indent_img = comment.find('img', width='0')
-            if not indent_img:
-                continue
-
-            comment_id = comment.get('id')
-            comment_text_div = comment.find('div', class_='commtext')
+        with _get_session(cached=False).get(url, timeout=_REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()  # Raise an exception for bad status codes
 
-            if comment_id and comment_text_div:
-                # Get clean text, stripping extra newlines
-                text = comment_text_div.get_text(separator='\n', strip=True)
+            # Parse chunks as they arrive instead of building the whole page tree
+            for comment_id, text in _iter_top_level_comments(response.iter_content(chunk_size=_HN_CHUNK_SIZE)):
                 # Filter out very short or deleted comments
                 if text and len(text) > 50 and "[dead]" not in text:
                     job_postings.append({
@@ -62,6 +269,84 @@ def get_job_postings(url):
         logger.error(f"💥 An unexpected error occurred during scraping: {e}")
         return []
 
+def _clean_description(description):
+    """Strip HTML from a description only when it looks like markup."""
+    if description and '<' in description and '>' in description:
+        return _strip_html(description)
+    return description
+
+def _names(items):
+    """Join the 'name' of each dict in an API list field (locations, categories...)."""
+    return ', '.join(item['name'] for item in items if item.get('name'))
+
+# Per-source (label, getter) specs for the job text; the first field is required
+_REMOTEOK_FIELDS = (
+    ('Position', lambda job: job.get('position', '')),
+    ('Company', lambda job: job.get('company', '')),
+    ('Location', lambda job: job.get('location', 'Remote')),
+    ('Skills', lambda job: ', '.join(job.get('tags') or ())),
+    ('Description', lambda job: _clean_description(job.get('description', ''))),
+)
+_ARBEITNOW_FIELDS = (
+    ('Position', lambda job: job.get('title', '')),
+    ('Company', lambda job: job.get('company_name', '')),
+    ('Location', lambda job: job.get('location', '')),
+    ('Type', lambda job: ', '.join(job.get('job_types') or ())),
+    ('Skills', lambda job: ', '.join(job.get('tags') or ())),
+    ('Description', lambda job: _clean_description(job.get('description', ''))),
+)
+_THEMUSE_FIELDS = (
+    ('Position', lambda job: job.get('name', '')),
+    ('Company', lambda job: job.get('company', {}).get('name', '')),
+    ('Location', lambda job: _names(job.get('locations', []))),
+    ('Categories', lambda job: _names(job.get('categories', []))),
+    ('Levels', lambda job: _names(job.get('levels', []))),
+    ('Description', lambda job: _clean_description(job.get('contents', ''))),
+)
+
+def _extract_postings(jobs, id_key, id_prefix, fields):
+    """
+    Build job postings from API job dictionaries using a per-source field spec.
+    
+    Args:
+        jobs (iterable): Job dictionaries from the API response
+        id_key (str): Key holding the source's job ID
+        id_prefix (str): Source prefix that keeps IDs unique across sources
+        fields (tuple): (label, getter) pairs; the first one must be non-empty
+        
+    Returns:
+        list: Job postings with 'id' and 'text' keys
+    """
+    job_postings = []
+    (title_label, get_title), other_fields = fields[0], fields[1:]
+    
+    for job in jobs:
+        if not isinstance(job, dict):
+            continue
+        
+        # Skip if essential fields are missing
+        job_id = job.get(id_key, '')
+        title = get_title(job)
+        if not job_id or not title:
+            continue
+        
+        # Create comprehensive job text from the non-empty fields
+        parts = [f"{title_label}: {title}"]
+        for label, get_value in other_fields:
+            value = get_value(job)
+            if value:
+                parts.append(f"{label}: {value}")
+        job_text = '\n\n'.join(parts)
+        
+        # Filter out very short postings
+        if len(job_text) > 50:
+            job_postings.append({
+                'id': f"{id_prefix}_{job_id}",
+                'text': job_text
+            })
+    
+    return job_postings
+
 def scrape_remoteok_api(url):
     """
     Scrapes job postings from Remote OK API.
@@ -73,67 +358,25 @@ def scrape_remoteok_api(url):
         list: A list of dictionaries, where each dictionary represents a job
               and has 'id' and 'text' keys. Returns an empty list on failure.
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    job_postings = []
-    
     try:
         logger.info(f"🌍 Fetching Remote OK jobs from: {url}")
-        response = requests.get(url, headers=headers)
+        response = _get_session().get(url, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()
+
+        cached_postings = _get_cached_postings(url, response)
+        if cached_postings is not None:
+            logger.info(f"♻️ Remote OK response unchanged, reusing {len(cached_postings)} parsed jobs")
+            return cached_postings
         
-        jobs_data = response.json()
+        jobs_data = orjson.loads(response.content)
         
         # Skip the first item as it's metadata
         if jobs_data and len(jobs_data) > 1:
             jobs_data = jobs_data[1:]
         
-        for job in jobs_data:
-            if not isinstance(job, dict):
-                continue
-                
-            # Extract job information
-            job_id = job.get('id', '')
-            position = job.get('position', '')
-            company = job.get('company', '')
-            description = job.get('description', '')
-            location = job.get('location', 'Remote')
-            tags = job.get('tags', [])
-            
-            # Skip if essential fields are missing
-            if not job_id or not position:
-                continue
-                
-            # Create comprehensive job text
-            job_text_parts = []
-            
-            if position:
-                job_text_parts.append(f"Position: {position}")
-            if company:
-                job_text_parts.append(f"Company: {company}")
-            if location:
-                job_text_parts.append(f"Location: {location}")
-            if tags:
-                job_text_parts.append(f"Skills: {', '.join(tags)}")
-            if description:
-                # Clean HTML tags from description
-                if '<' in description and '>' in description:
-                    soup = BeautifulSoup(description, 'html.parser')
-                    clean_description = soup.get_text(separator='\n', strip=True)
-                else:
-                    clean_description = description
-                job_text_parts.append(f"Description: {clean_description}")
-            
-            job_text = '\n\n'.join(job_text_parts)
-            
-            # Filter out very short postings
-            if len(job_text) > 50:
-                job_postings.append({
-                    'id': f"ro_{job_id}",  # Add remoteok prefix
-                    'text': job_text
-                })
+        job_postings = _extract_postings(jobs_data, 'id', 'ro', _REMOTEOK_FIELDS)
         
+        _remember_postings(url, response, job_postings)
         logger.info(f"✅ Successfully found {len(job_postings)} Remote OK job postings.")
         return job_postings
         
@@ -158,69 +401,24 @@ def scrape_arbeitnow_api(url):
         list: A list of dictionaries, where each dictionary represents a job
               and has 'id' and 'text' keys. Returns an empty list on failure.
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    job_postings = []
-    
     try:
         logger.info(f"💼 Fetching Arbeit Now jobs from: {url}")
-        response = requests.get(url, headers=headers)
+        response = _get_session().get(url, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()
+
+        cached_postings = _get_cached_postings(url, response)
+        if cached_postings is not None:
+            logger.info(f"♻️ Arbeit Now response unchanged, reusing {len(cached_postings)} parsed jobs")
+            return cached_postings
         
-        jobs_data = response.json()
+        jobs_data = orjson.loads(response.content)
         
         # Extract jobs from the API response
         jobs_list = jobs_data.get('data', [])
         
-        for job in jobs_list:
-            if not isinstance(job, dict):
-                continue
-                
-            # Extract job information
-            job_id = job.get('slug', '')
-            title = job.get('title', '')
-            company = job.get('company_name', '')
-            location = job.get('location', '')
-            job_types = job.get('job_types', [])
-            tags = job.get('tags', [])
-            description = job.get('description', '')
-            
-            # Skip if essential fields are missing
-            if not job_id or not title:
-                continue
-                
-            # Create comprehensive job text
-            job_text_parts = []
-            
-            if title:
-                job_text_parts.append(f"Position: {title}")
-            if company:
-                job_text_parts.append(f"Company: {company}")
-            if location:
-                job_text_parts.append(f"Location: {location}")
-            if job_types:
-                job_text_parts.append(f"Type: {', '.join(job_types)}")
-            if tags:
-                job_text_parts.append(f"Skills: {', '.join(tags)}")
-            if description:
-                # Clean HTML tags from description
-                if '<' in description and '>' in description:
-                    soup = BeautifulSoup(description, 'html.parser')
-                    clean_description = soup.get_text(separator='\n', strip=True)
-                else:
-                    clean_description = description
-                job_text_parts.append(f"Description: {clean_description}")
-            
-            job_text = '\n\n'.join(job_text_parts)
-            
-            # Filter out very short postings
-            if len(job_text) > 50:
-                job_postings.append({
-                    'id': f"an_{job_id}",  # Add arbeit now prefix
-                    'text': job_text
-                })
+        job_postings = _extract_postings(jobs_list, 'slug', 'an', _ARBEITNOW_FIELDS)
         
+        _remember_postings(url, response, job_postings)
         logger.info(f"✅ Successfully found {len(job_postings)} Arbeit Now job postings.")
         return job_postings
         
@@ -234,85 +432,73 @@ def scrape_arbeitnow_api(url):
         logger.error(f"💥 An unexpected error occurred during Arbeit Now scraping: {e}")
         return []
 
-def scrape_themusedev_api(url):
+def _fetch_themuse_page(url, page=None):
+    """
+    Fetch one page of The Muse API results.
+    
+    Args:
+        url (str): The Muse API URL
+        page (int): Page number, or None for the API's default first page
+        
+    Returns:
+        dict: Decoded JSON page with 'results', 'page' and 'page_count'
+    """
+    params = {'page': page} if page is not None else None
+    response = _get_session().get(url, params=params, timeout=_REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def _parse_themuse_jobs(jobs_list):
+    """
+    Build job postings from The Muse API results.
+    
+    Args:
+        jobs_list (iterable): Job dictionaries from one or more result pages
+        
+    Returns:
+        list: Job postings with 'id' and 'text' keys
+    """
+    return _extract_postings(jobs_list, 'id', 'tm', _THEMUSE_FIELDS)
+
+def scrape_themusedev_api(url, max_pages=_THEMUSE_MAX_PAGES):
     """
     Scrapes job postings from The Muse API (free tier available).
     
+    The first page reports the page count; the remaining pages are then
+    fetched concurrently over the shared session.
+    
     Args:
         url (str): The Muse API URL (e.g., https://www.themuse.com/api/public/jobs?category=Software%20Engineer)
+        max_pages (int): Maximum number of result pages to fetch
     
     Returns:
         list: A list of dictionaries, where each dictionary represents a job
               and has 'id' and 'text' keys. Returns an empty list on failure.
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    job_postings = []
+    def fetch_results(page):
+        # A failed page only loses its own results
+        try:
+            return _fetch_themuse_page(url, page).get('results', [])
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"⚠️ Skipping The Muse page {page}: {e}")
+            return []
     
     try:
         logger.info(f"🎯 Fetching The Muse jobs from: {url}")
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        first_page = _fetch_themuse_page(url)
+        pages = [first_page.get('results', [])]
         
-        jobs_data = response.json()
+        # Page numbering starts wherever the API's default page does
+        first_index = first_page.get('page', 0)
+        page_count = min(first_page.get('page_count', 1), max_pages)
+        remaining_pages = range(first_index + 1, first_index + page_count)
         
-        # Extract jobs from the API response
-        jobs_list = jobs_data.get('results', [])
+        if remaining_pages:
+            logger.info(f"📄 Fetching {len(remaining_pages)} more The Muse pages concurrently")
+            with ThreadPoolExecutor(max_workers=min(_THEMUSE_PAGE_WORKERS, len(remaining_pages))) as executor:
+                pages.extend(executor.map(fetch_results, remaining_pages))
         
-        for job in jobs_list:
-            if not isinstance(job, dict):
-                continue
-                
-            # Extract job information
-            job_id = str(job.get('id', ''))
-            title = job.get('name', '')
-            company = job.get('company', {}).get('name', '')
-            locations = job.get('locations', [])
-            categories = job.get('categories', [])
-            levels = job.get('levels', [])
-            contents = job.get('contents', '')
-            
-            # Skip if essential fields are missing
-            if not job_id or not title:
-                continue
-                
-            # Create comprehensive job text
-            job_text_parts = []
-            
-            if title:
-                job_text_parts.append(f"Position: {title}")
-            if company:
-                job_text_parts.append(f"Company: {company}")
-            if locations:
-                location_names = [loc.get('name', '') for loc in locations if loc.get('name')]
-                if location_names:
-                    job_text_parts.append(f"Location: {', '.join(location_names)}")
-            if categories:
-                category_names = [cat.get('name', '') for cat in categories if cat.get('name')]
-                if category_names:
-                    job_text_parts.append(f"Categories: {', '.join(category_names)}")
-            if levels:
-                level_names = [lvl.get('name', '') for lvl in levels if lvl.get('name')]
-                if level_names:
-                    job_text_parts.append(f"Levels: {', '.join(level_names)}")
-            if contents:
-                # Clean HTML tags from contents
-                if '<' in contents and '>' in contents:
-                    soup = BeautifulSoup(contents, 'html.parser')
-                    clean_contents = soup.get_text(separator='\n', strip=True)
-                else:
-                    clean_contents = contents
-                job_text_parts.append(f"Description: {clean_contents}")
-            
-            job_text = '\n\n'.join(job_text_parts)
-            
-            # Filter out very short postings
-            if len(job_text) > 50:
-                job_postings.append({
-                    'id': f"tm_{job_id}",  # Add the muse prefix
-                    'text': job_text
-                })
+        job_postings = _parse_themuse_jobs(chain.from_iterable(pages))
         
         logger.info(f"✅ Successfully found {len(job_postings)} The Muse job postings.")
         return job_postings
@@ -327,53 +513,248 @@ def scrape_themusedev_api(url):
         logger.error(f"💥 An unexpected error occurred during The Muse scraping: {e}")
         return []
 
-def generate_job_hash(job_text):
+def scrape_sources_concurrently(sources, max_workers=None):
+    """
+    Run several scrapers concurrently over the shared HTTP session.
+    
+    Fetches are I/O-bound, so threads keep every request in flight at once
+    while still going through the pooled, caching session.
+    
+    Args:
+        sources (list): (name, scraper, url) tuples
+        max_workers (int): Number of threads, defaults to one per source
+        
+    Returns:
+        dict: Source name -> list of job postings, or the exception the
+              scraper raised, in the order the sources were given
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(sources)) as executor:
+        futures = {
+            executor.submit(scraper, url): source_name
+            for source_name, scraper, url in sources
+        }
+        for future in as_completed(futures):
+            source_name = futures[future]
+            try:
+                results[source_name] = future.result()
+            except Exception as e:
+                results[source_name] = e
+    
+    # Source order, so callers see the same job order regardless of finish order
+    return {source_name: results[source_name] for source_name, _, _ in sources}
+
+def _normalize_job_text(job_text_lower):
+    """Collapse whitespace and remove special characters from lowercased job text."""
+    return _PUNCT_RE.sub('', _WHITESPACE_RE.sub(' ', job_text_lower.strip()))
+
+def _job_digest(job_text_lower):
+    """
+    Raw 16-byte xxh3 digest of normalized job text, as stored in the dedup sets.
+    
+    Args:
+        job_text_lower (str): Lowercased job text
+        
+    Returns:
+        bytes: Same digest as generate_job_hash, without the hex encoding
+    """
+    # Non-cryptographic: the hash only keys an in-memory dedup set for one task
+    return xxhash.xxh3_128_digest(_normalize_job_text(job_text_lower).encode())
+
+def generate_job_hash(job_text, job_text_lower=None):
     """
     Generate a hash for job content to identify duplicates.
     
     Args:
         job_text (str): The job posting text
+        job_text_lower (str): Already-lowercased job text, if the caller has it
+        
+    Returns:
+        str: 128-bit xxh3 hex digest of normalized job text
+    """
+    if job_text_lower is None:
+        job_text_lower = job_text.lower()
+    return _job_digest(job_text_lower).hex()
+
+def _job_prefix_key(job_text_lower):
+    """
+    Cheap 64-bit fingerprint of the first words of the normalized job text.
+    
+    Built from the same whitespace splitting and punctuation removal as
+    _job_digest, so jobs with equal normalized text always share a
+    key and only prefix collisions need the full-text hash.
+    
+    Args:
+        job_text_lower (str): The lowercased job posting text
         
     Returns:
-        str: SHA256 hash of normalized job text
+        int: xxh64 digest of the normalized leading words
     """
-    # Normalize text for better deduplication
-    normalized_text = re.sub(r'\s+', ' ', job_text.lower().strip())
-    normalized_text = re.sub(r'[^\w\s]', '', normalized_text)  # Remove special characters
-    return hashlib.sha256(normalized_text.encode()).hexdigest()
+    leading_words = job_text_lower.split(None, _PREFIX_KEY_WORDS)[:_PREFIX_KEY_WORDS]
+    return xxhash.xxh64_intdigest(_PUNCT_RE.sub('', ' '.join(leading_words)).encode())
 
-def deduplicate_jobs(all_jobs):
+class SeenJobFilter:
+    """
+    Remembers the IDs of jobs indexed by earlier crawls.
+    
+    Backed by a RedisBloom filter shared by all workers, with a per-process
+    set as fallback when Redis or the Bloom module is unavailable. A Bloom
+    filter has no false negatives, so a new job is never reported as seen;
+    about 0.1% of new jobs may be skipped as false positives.
+    """
+    
+    def __init__(self, redis_url, key=_SEEN_JOBS_KEY):
+        """
+        Connect to Redis and make sure the Bloom filter exists.
+        
+        Args:
+            redis_url (str): Redis connection URL
+            key (str): Redis key of the Bloom filter
+        """
+        self.key = key
+        self._bloom = None
+        
+        try:
+            bloom = redis.from_url(redis_url).bf()
+            try:
+                bloom.create(key, _SEEN_JOBS_ERROR_RATE, _SEEN_JOBS_CAPACITY)
+            except redis.exceptions.ResponseError as e:
+                # Created by an earlier run; anything else (e.g. unknown command) means no Bloom module
+                if 'exists' not in str(e).lower():
+                    raise
+            self._bloom = bloom
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"⚠️ Redis Bloom filter unavailable, tracking seen jobs in memory: {e}")
+    
+    def _disable_bloom(self, error):
+        logger.warning(f"⚠️ Redis Bloom filter error, tracking seen jobs in memory: {error}")
+        self._bloom = None
+    
+    def contains_many(self, job_ids):
+        """
+        Check which job IDs were added by earlier crawls.
+        
+        Args:
+            job_ids (list): Job IDs to check
+            
+        Returns:
+            list: One bool per job ID, True if the job was (probably) seen before
+        """
+        if not job_ids:
+            return []
+        
+        if self._bloom is not None:
+            try:
+                return [bool(found) for found in self._bloom.mexists(self.key, *job_ids)]
+            except redis.exceptions.RedisError as e:
+                self._disable_bloom(e)
+        return [job_id in _LOCAL_SEEN_JOB_IDS for job_id in job_ids]
+    
+    def add_many(self, job_ids):
+        """
+        Record job IDs as seen so later crawls skip them.
+        
+        Args:
+            job_ids (list): Job IDs to add
+        """
+        if not job_ids:
+            return
+        
+        if self._bloom is not None:
+            try:
+                self._bloom.madd(self.key, *job_ids)
+                return
+            except redis.exceptions.RedisError as e:
+                self._disable_bloom(e)
+        _LOCAL_SEEN_JOB_IDS.update(job_ids)
+
+def deduplicate_jobs(all_jobs, seen_filter=None, return_seen_count=False):
     """
     Remove duplicate jobs based on content similarity.
     
     Args:
-        all_jobs (list): List of job dictionaries with 'id' and 'text' keys
+        all_jobs (list): List of job dictionaries with 'id' and 'text' keys, and
+            optionally '_text_lower' holding the precomputed lowercased text
+        seen_filter (SeenJobFilter, optional): Jobs whose IDs it reports as seen
+            are dropped before any hashing
+        return_seen_count (bool): Also return how many jobs the seen filter
+            dropped, kept apart from content duplicates
         
     Returns:
-        list: Deduplicated list of jobs
+        list: Deduplicated list of jobs, or a (jobs, previously_seen) tuple
+            when return_seen_count is True
     """
-    seen_hashes = set()
+    previously_seen = 0
+    if seen_filter is not None:
+        # One batched membership check for the whole crawl
+        seen_flags = seen_filter.contains_many([job['id'] for job in all_jobs])
+        previously_seen = sum(seen_flags)
+        if previously_seen:
+            all_jobs = [job for job, seen in zip(all_jobs, seen_flags) if not seen]
+            logger.info(f"⏭️ Skipping {previously_seen} jobs already indexed by earlier crawls")
+    
+    # Prefix key -> [first kept text awaiting a full hash, set of 16-byte digests]
+    prefix_buckets = {}
     deduplicated_jobs = []
     duplicates_removed = 0
     
     for job in all_jobs:
-        job_hash = generate_job_hash(job['text'])
+        job_text_lower = job.get('_text_lower') or job['text'].lower()
+        prefix_key = _job_prefix_key(job_text_lower)
+        bucket = prefix_buckets.get(prefix_key)
+        
+        if bucket is None:
+            # Common case: no earlier job starts the same way, so it cannot be a duplicate
+            prefix_buckets[prefix_key] = [job_text_lower, None]
+            deduplicated_jobs.append(job)
+            continue
+        
+        # Prefix collision: fall back to full-text hashes, computed lazily
+        if bucket[1] is None:
+            bucket[1] = {_job_digest(bucket[0])}
+            bucket[0] = None
+        job_hash = _job_digest(job_text_lower)
         
-        if job_hash not in seen_hashes:
-            seen_hashes.add(job_hash)
+        if job_hash not in bucket[1]:
+            bucket[1].add(job_hash)
             deduplicated_jobs.append(job)
         else:
             duplicates_removed += 1
     
     logger.info(f"🗑️ Deduplication complete: Removed {duplicates_removed} duplicates, kept {len(deduplicated_jobs)} unique jobs")
+    if return_seen_count:
+        return deduplicated_jobs, previously_seen
     return deduplicated_jobs
 
+def _build_term_matcher(terms):
+    """
+    Build a case-insensitive "contains any of these terms" check.
+    
+    Args:
+        terms (list): Substrings to look for
+        
+    Returns:
+        callable: Takes lowercased text and returns True if any term occurs in it
+    """
+    terms_lower = {term.lower() for term in terms}
+    if '' in terms_lower:
+        # An empty term is a substring of every text
+        return lambda text_lower: True
+    
+    automaton = ahocorasick.Automaton()
+    for term in terms_lower:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    
+    # Stop at the first hit; no need to enumerate every match
+    return lambda text_lower: next(automaton.iter(text_lower), None) is not None
+
 def filter_jobs(jobs, keywords=None, locations=None, exclude_keywords=None):
     """
     Filter jobs based on keywords, locations, and exclusion criteria.
     
     Args:
-        jobs (list): List of job dictionaries
+        jobs (list): List of job dictionaries (a precomputed '_text_lower' is reused)
         keywords (list): Keywords that must be present (OR logic)
         locations (list): Locations to include (OR logic)
         exclude_keywords (list): Keywords to exclude (ANY present = exclude)
@@ -384,41 +765,28 @@ def filter_jobs(jobs, keywords=None, locations=None, exclude_keywords=None):
     if not any([keywords, locations, exclude_keywords]):
         return jobs
     
+    # One automaton per criterion: each job text is scanned once per criterion
+    # for all of its terms instead of once per term
+    is_excluded = _build_term_matcher(exclude_keywords) if exclude_keywords else None
+    has_keyword = _build_term_matcher(keywords) if keywords else None
+    has_location = _build_term_matcher(locations) if locations else None
+    
     filtered_jobs = []
     
     for job in jobs:
-        job_text_lower = job['text'].lower()
-        should_include = True
+        job_text_lower = job.get('_text_lower') or job['text'].lower()
         
         # Exclude jobs with blacklisted keywords
-        if exclude_keywords:
-            for exclude_keyword in exclude_keywords:
-                if exclude_keyword.lower() in job_text_lower:
-                    should_include = False
-                    break
-        
-        if not should_include:
+        if is_excluded and is_excluded(job_text_lower):
             continue
         
         # Check keyword requirements
-        if keywords:
-            keyword_found = False
-            for keyword in keywords:
-                if keyword.lower() in job_text_lower:
-                    keyword_found = True
-                    break
-            if not keyword_found:
-                continue
+        if has_keyword and not has_keyword(job_text_lower):
+            continue
         
         # Check location requirements
-        if locations:
-            location_found = False
-            for location in locations:
-                if location.lower() in job_text_lower:
-                    location_found = True
-                    break
-            if not location_found:
-                continue
+        if has_location and not has_location(job_text_lower):
+            continue
         
         filtered_jobs.append(job)
     
@@ -12,6 +12,7 @@ Uses structured logging instead of print statements.
 import os
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 from typing import List, Dict, Any
 from .scrapers import (
     get_job_postings as scrape_hackernews_jobs,
@@ -19,7 +20,9 @@ from .scrapers import (
     scrape_arbeitnow_api as scrape_arbeitnow_jobs, 
     scrape_themusedev_api as scrape_themuse_jobs, 
     deduplicate_jobs, 
-    filter_jobs
+    filter_jobs,
+    SeenJobFilter,
+    scrape_sources_concurrently
 )
 from ..core.logging_config import get_logger
 
@@ -28,6 +31,13 @@ logger = get_logger(__name__)
 
 # Redis URL from environment
 REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+REDIS_TRANSPORT_OPTIONS = {
+    'socket_keepalive': True,
+    'socket_timeout': 30,
+    'socket_connect_timeout': 10,
+    'retry_on_timeout': True,
+    'health_check_interval': 60,
+}
 
 # Initialize Celery
 celery_app = Celery(
@@ -42,6 +52,8 @@ celery_app.conf.update(
     task_serializer='json',
     accept_content=['json'],
     result_serializer='json',
+    task_compression='lz4',
+    result_compression='lz4',
     timezone='UTC',
     enable_utc=True,
     
@@ -64,8 +76,48 @@ celery_app.conf.update(
     # Monitoring
     worker_send_task_events=True,
     task_send_sent_event=True,
+    
+    # Broker connections (keep Redis sockets alive through long crawls)
+    broker_pool_limit=10,
+    broker_transport_options=REDIS_TRANSPORT_OPTIONS,
+    result_backend_transport_options=REDIS_TRANSPORT_OPTIONS,
 )
 
+@worker_process_init.connect
+def warm_up_worker_process(**kwargs):
+    """Build the text processor (and its compiled regexes) and container singletons before the first task arrives."""
+    try:
+        from ..ml.text_processing import get_text_processor
+        get_text_processor()
+        logger.info("🔥 Text processor warmed up for worker process")
+    except ImportError:
+        # Lightweight images do not install the ML dependencies (numpy)
+        logger.info("ℹ️ Text processing not available - skipping warm-up")
+    
+    from ..shared.core.container import container
+    try:
+        warmed = container.warmup()
+        if warmed:
+            logger.info(f"🔥 Resolved {warmed} container singletons for worker process")
+    except Exception as e:
+        # The first task will resolve (and report) whatever failed here
+        logger.warning(f"⚠️ Container warm-up failed: {e}")
+
+def _env_list(name):
+    """
+    Read a comma-separated list from an environment variable.
+    
+    Args:
+        name (str): Environment variable name
+        
+    Returns:
+        list: Stripped, non-empty items; empty when the variable is unset or blank
+    """
+    value = os.getenv(name)
+    if not value:
+        return []
+    return [item.strip() for item in value.split(',') if item.strip()]
+
 @celery_app.task(bind=True, max_retries=3)
 def crawl_and_index(self):
     """
@@ -93,57 +145,26 @@ def crawl_and_index(self):
         ARBEITNOW_URL = "https://www.arbeitnow.com/api/job-board-api"
         THEMUSE_URL = "https://www.themuse.com/api/public/jobs"
         
-        # Scrape Hacker News
-        try:
-            logger.info("📰 Scraping Hacker News jobs")
-            hn_jobs = scrape_hackernews_jobs(HN_URL)
-            if hn_jobs:
-                all_jobs.extend(hn_jobs)
-                sources_scraped += 1
-                logger.info(f"✅ Added {len(hn_jobs)} jobs from Hacker News")
-            else:
-                logger.warning("⚠️ No jobs found from Hacker News")
-        except Exception as e:
-            logger.error(f"❌ Error scraping Hacker News: {e}")
+        sources = [
+            ("Hacker News", scrape_hackernews_jobs, HN_URL),
+            ("Remote OK", scrape_remoteok_jobs, REMOTEOK_URL),
+            ("Arbeit Now", scrape_arbeitnow_jobs, ARBEITNOW_URL),
+            ("The Muse", scrape_themuse_jobs, THEMUSE_URL),
+        ]
         
-        # Scrape Remote OK
-        try:
-            logger.info("🌍 Scraping Remote OK jobs")
-            ro_jobs = scrape_remoteok_jobs(REMOTEOK_URL)
-            if ro_jobs:
-                all_jobs.extend(ro_jobs)
-                sources_scraped += 1
-                logger.info(f"✅ Added {len(ro_jobs)} jobs from Remote OK")
-            else:
-                logger.warning("⚠️ No jobs found from Remote OK")
-        except Exception as e:
-            logger.error(f"❌ Error scraping Remote OK: {e}")
+        # Sources are independent I/O-bound fetches, so scrape them concurrently
+        logger.info(f"🌐 Scraping {len(sources)} job sources concurrently")
+        results = scrape_sources_concurrently(sources)
         
-        # Scrape Arbeit Now
-        try:
-            logger.info("💼 Scraping Arbeit Now jobs")
-            an_jobs = scrape_arbeitnow_jobs(ARBEITNOW_URL)
-            if an_jobs:
-                all_jobs.extend(an_jobs)
+        for source_name, source_jobs in results.items():
+            if isinstance(source_jobs, Exception):
+                logger.error(f"❌ Error scraping {source_name}: {source_jobs}")
+            elif source_jobs:
+                all_jobs.extend(source_jobs)
                 sources_scraped += 1
-                logger.info(f"✅ Added {len(an_jobs)} jobs from Arbeit Now")
+                logger.info(f"✅ Added {len(source_jobs)} jobs from {source_name}")
             else:
-                logger.warning("⚠️ No jobs found from Arbeit Now")
-        except Exception as e:
-            logger.error(f"❌ Error scraping Arbeit Now: {e}")
-        
-        # Scrape The Muse
-        try:
-            logger.info("🎯 Scraping The Muse jobs")
-            tm_jobs = scrape_themuse_jobs(THEMUSE_URL)  
-            if tm_jobs:
-                all_jobs.extend(tm_jobs)
-                sources_scraped += 1
-                logger.info(f"✅ Added {len(tm_jobs)} jobs from The Muse")
-            else:
-                logger.warning("⚠️ No jobs found from The Muse")
-        except Exception as e:
-            logger.error(f"❌ Error scraping The Muse: {e}")
+                logger.warning(f"⚠️ No jobs found from {source_name}")
         
         if not all_jobs:
             logger.error("❌ No jobs found from any source")
@@ -155,22 +176,23 @@ def crawl_and_index(self):
         
         logger.info(f"📊 Total jobs collected: {len(all_jobs)} from {sources_scraped} sources")
         
+        # Lowercase each job once; deduplication and filtering both reuse it
+        for job in all_jobs:
+            job['_text_lower'] = job['text'].lower()
+        
         # Apply deduplication
         logger.info("🔄 Deduplicating jobs")
-        unique_jobs = deduplicate_jobs(all_jobs)
-        duplicates_removed = len(all_jobs) - len(unique_jobs)
+        seen_filter = SeenJobFilter(REDIS_URL)
+        unique_jobs, previously_seen = deduplicate_jobs(all_jobs, seen_filter=seen_filter, return_seen_count=True)
+        # Jobs indexed by earlier crawls are not duplicates within this crawl
+        duplicates_removed = len(all_jobs) - len(unique_jobs) - previously_seen
         if duplicates_removed > 0:
             logger.info(f"🗑️ Removed {duplicates_removed} duplicate jobs")
         
         # Apply filtering (get from environment)
-        filter_keywords = os.getenv('JOB_FILTER_KEYWORDS', '').split(',') if os.getenv('JOB_FILTER_KEYWORDS') else []
-        filter_locations = os.getenv('JOB_FILTER_LOCATIONS', '').split(',') if os.getenv('JOB_FILTER_LOCATIONS') else []
-        exclude_keywords = os.getenv('JOB_EXCLUDE_KEYWORDS', '').split(',') if os.getenv('JOB_EXCLUDE_KEYWORDS') else []
-        
-        # Clean up empty strings
-        filter_keywords = [k.strip() for k in filter_keywords if k.strip()]
-        filter_locations = [l.strip() for l in filter_locations if l.strip()]
-        exclude_keywords = [e.strip() for e in exclude_keywords if e.strip()]
+        filter_keywords = _env_list('JOB_FILTER_KEYWORDS')
+        filter_locations = _env_list('JOB_FILTER_LOCATIONS')
+        exclude_keywords = _env_list('JOB_EXCLUDE_KEYWORDS')
         
         if filter_keywords or filter_locations or exclude_keywords:
             logger.info("🔍 Applying job filters")
@@ -187,6 +209,10 @@ def crawl_and_index(self):
             filtered_jobs = unique_jobs
             logger.info("ℹ️ No filtering applied - using all unique jobs")
         
+        # Drop the lowercased text before the jobs leave the scraping stage
+        for job in all_jobs:
+            job.pop('_text_lower', None)
+        
         # Index the final processed jobs
         if filtered_jobs:
             logger.info(f"📥 Indexing {len(filtered_jobs)} jobs")
@@ -194,7 +220,10 @@ def crawl_and_index(self):
             try:
                 # Try to import and use the indexing function
                 from ..ml.indexing import embed_and_index
-                embed_and_index(filtered_jobs)
+                indexed_job_ids = embed_and_index(filtered_jobs)
+                # Only mark jobs as seen once all their chunks are indexed, so jobs
+                # hit by embedding failures are retried next crawl
+                seen_filter.add_many(indexed_job_ids)
                 logger.info("✅ Jobs successfully indexed")
             except ImportError:
                 logger.warning("⚠️ ML indexing not available - jobs collected but not indexed")
@@ -212,6 +241,7 @@ def crawl_and_index(self):
             "jobs_unique": len(unique_jobs),
             "jobs_final": len(filtered_jobs),
             "duplicates_removed": duplicates_removed,
+            "previously_seen": previously_seen,
             "sources_scraped": sources_scraped
         }
         
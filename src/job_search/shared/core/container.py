@@ -5,13 +5,35 @@ This container manages all service dependencies and their lifecycles,
 enabling easy testing, configuration, and service swapping.
 """
 
-from typing import Dict, Any, Type, TypeVar, Callable, Optional
-from functools import lru_cache
+from typing import Dict, Any, Type, TypeVar, Callable, Optional, Tuple
+from functools import lru_cache, wraps
+from importlib import import_module
 import inspect
-from ..core.interfaces import *
 
 T = TypeVar('T')
 
+# Sentinel for singleton lookups, since a registered instance may itself be None
+_MISSING = object()
+
+@lru_cache(maxsize=None)
+def _cached_params(implementation: Type) -> Tuple[Tuple[str, Any, Any], ...]:
+    """Constructor parameters as (name, annotation, default), excluding self, computed once per class"""
+    constructor = implementation.__init__
+    # No reflection needed for inherited object.__init__ or a bare __init__(self)
+    if constructor is object.__init__:
+        return ()
+    code = getattr(constructor, '__code__', None)
+    if (code is not None and code.co_argcount == 1 and not code.co_kwonlyargcount
+            and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)):
+        return ()
+    
+    signature = inspect.signature(implementation.__init__)
+    return tuple(
+        (param_name, param.annotation, param.default)
+        for param_name, param in signature.parameters.items()
+        if param_name != 'self'
+    )
+
 class ServiceContainer:
     """
     Dependency Injection Container with automatic dependency resolution.
@@ -24,16 +46,21 @@ class ServiceContainer:
     - Configuration-based service resolution
     """
     
+    __slots__ = ('_services', '_singletons', '_factories', '_configurations', '_plans')
+    
     def __init__(self):
-        self._services: Dict[str, Any] = {}
-        self._singletons: Dict[str, Any] = {}
-        self._factories: Dict[str, Callable] = {}
-        self._configurations: Dict[str, Dict[str, Any]] = {}
+        # Keyed by the interface type itself: types are hashable and process-unique
+        self._services: Dict[Type, Any] = {}
+        self._singletons: Dict[Type, Any] = {}
+        self._factories: Dict[Type, Callable] = {}
+        self._configurations: Dict[Type, Dict[str, Any]] = {}
+        # Injection plans built by compile(); dropped whenever registrations change
+        self._plans: Dict[Type, Tuple[Type, Tuple[Tuple[str, Optional[Type], Any], ...]]] = {}
     
     def register_singleton(self, interface: Type[T], implementation: Type[T]) -> 'ServiceContainer':
         """Register a service as singleton (one instance for lifetime)"""
-        key = self._get_key(interface)
-        self._services[key] = {
+        self._plans.clear()
+        self._services[interface] = {
             'type': 'singleton',
             'interface': interface,
             'implementation': implementation,
@@ -43,8 +70,8 @@ class ServiceContainer:
     
     def register_transient(self, interface: Type[T], implementation: Type[T]) -> 'ServiceContainer':
         """Register a service as transient (new instance each time)"""
-        key = self._get_key(interface)
-        self._services[key] = {
+        self._plans.clear()
+        self._services[interface] = {
             'type': 'transient',
             'interface': interface,
             'implementation': implementation
@@ -53,94 +80,188 @@ class ServiceContainer:
     
     def register_factory(self, interface: Type[T], factory: Callable[[], T]) -> 'ServiceContainer':
         """Register a factory function for service creation"""
-        key = self._get_key(interface)
-        self._factories[key] = factory
+        self._plans.clear()
+        self._factories[interface] = factory
         return self
     
     def register_instance(self, interface: Type[T], instance: T) -> 'ServiceContainer':
         """Register an existing instance"""
-        key = self._get_key(interface)
-        self._singletons[key] = instance
+        self._plans.clear()
+        self._singletons[interface] = instance
         return self
     
     def configure(self, service_type: Type[T], **config) -> 'ServiceContainer':
         """Add configuration for a service"""
-        key = self._get_key(service_type)
-        self._configurations[key] = config
+        self._plans.clear()
+        self._configurations[service_type] = config
+        return self
+    
+    def compile(self) -> 'ServiceContainer':
+        """
+        Precompute constructor injection plans for all registered services.
+        
+        Each plan records, per constructor parameter, whether the value comes from
+        configuration, another service or the parameter default, so resolution no
+        longer re-derives it on every creation. Services are ordered topologically,
+        so missing dependencies and cycles fail here instead of on first use.
+        """
+        plans = {}
+        dependencies = {}
+        
+        for interface, service_config in self._services.items():
+            implementation = service_config['implementation']
+            config = self._configurations.get(interface, {})
+            steps = []
+            dependencies[interface] = set()
+            
+            for param_name, annotation, default in _cached_params(implementation):
+                if param_name in config:
+                    steps.append((param_name, None, config[param_name]))
+                elif annotation == inspect.Parameter.empty:
+                    continue
+                elif self._is_registered(annotation):
+                    steps.append((param_name, annotation, default))
+                    if annotation in self._services:
+                        dependencies[interface].add(annotation)
+                elif default != inspect.Parameter.empty:
+                    steps.append((param_name, None, default))
+                else:
+                    raise ValueError(f"Cannot resolve dependency {annotation.__name__} for {implementation.__name__}")
+            
+            plans[interface] = (implementation, tuple(steps))
+        
+        # Kahn's algorithm: anything left unvisited is part of a dependency cycle
+        dependents = {interface: [] for interface in dependencies}
+        remaining = {}
+        for interface, deps in dependencies.items():
+            remaining[interface] = len(deps)
+            for dependency in deps:
+                dependents[dependency].append(interface)
+        ready = [interface for interface, count in remaining.items() if count == 0]
+        while ready:
+            for dependent in dependents[ready.pop()]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        cyclic = [interface.__name__ for interface, count in remaining.items() if count]
+        if cyclic:
+            raise ValueError(f"Circular dependency between services: {', '.join(sorted(cyclic))}")
+        
+        self._plans = plans
         return self
     
+    def is_singleton(self, interface: Type) -> bool:
+        """Check whether a service resolves to one shared instance"""
+        if interface in self._singletons:
+            return True
+        if getattr(self._factories.get(interface), 'singleton', False):
+            return True
+        service_config = self._services.get(interface)
+        return service_config is not None and service_config['type'] == 'singleton'
+    
+    def warmup(self) -> int:
+        """
+        Resolve every singleton up front so heavy imports and construction
+        happen at process start instead of on the first request or task.
+        
+        Returns:
+            Number of singletons resolved
+        """
+        singletons = [
+            interface for interface in {**self._services, **self._factories}
+            if interface not in self._singletons and self.is_singleton(interface)
+        ]
+        for interface in singletons:
+            self.get(interface)
+        return len(singletons)
+    
+    def _is_registered(self, interface: Type) -> bool:
+        """Check whether get() can resolve a type"""
+        return interface in self._singletons or interface in self._factories or interface in self._services
+    
     def get(self, interface: Type[T]) -> T:
         """Get service instance with automatic dependency injection"""
-        key = self._get_key(interface)
         
-        # Check if already cached as singleton
-        if key in self._singletons:
-            return self._singletons[key]
+        # Hot path: already-resolved singletons cost a single dict lookup
+        instance = self._singletons.get(interface, _MISSING)
+        if instance is not _MISSING:
+            return instance
         
         # Check if factory exists
-        if key in self._factories:
-            instance = self._factories[key]()
-            if key in self._services and self._services[key]['type'] == 'singleton':
-                self._singletons[key] = instance
+        if interface in self._factories:
+            instance = self._factories[interface]()
+            if self.is_singleton(interface):
+                self._singletons[interface] = instance
             return instance
         
         # Get service configuration
-        if key not in self._services:
+        if interface not in self._services:
             raise ValueError(f"Service {interface.__name__} not registered")
         
-        service_config = self._services[key]
+        service_config = self._services[interface]
         implementation = service_config['implementation']
         
         # Create instance with dependency injection
-        instance = self._create_instance(implementation, key)
+        instance = self._create_instance(implementation, interface)
         
         # Cache singleton
         if service_config['type'] == 'singleton':
-            self._singletons[key] = instance
+            self._singletons[interface] = instance
         
         return instance
     
-    def _create_instance(self, implementation: Type[T], service_key: str) -> T:
+    def _create_instance(self, implementation: Type[T], service_key: Type) -> T:
         """Create instance with automatic constructor dependency injection"""
-        constructor = implementation.__init__
-        signature = inspect.signature(constructor)
+        plan = self._plans.get(service_key)
+        if plan is not None and plan[0] is implementation:
+            kwargs = {}
+            for param_name, dependency, value in plan[1]:
+                if dependency is None:
+                    kwargs[param_name] = value
+                    continue
+                try:
+                    kwargs[param_name] = self.get(dependency)
+                except ValueError:
+                    # If dependency not found and has default, use default
+                    if value is inspect.Parameter.empty:
+                        raise ValueError(f"Cannot resolve dependency {dependency.__name__} for {implementation.__name__}")
+                    kwargs[param_name] = value
+            return implementation(**kwargs)
+        
+        params = _cached_params(implementation)
+        if not params:
+            return implementation()
         
         kwargs = {}
         config = self._configurations.get(service_key, {})
         
-        for param_name, param in signature.parameters.items():
-            if param_name == 'self':
-                continue
-            
+        for param_name, annotation, default in params:
             # Check if parameter is in configuration
             if param_name in config:
                 kwargs[param_name] = config[param_name]
                 continue
             
             # Try to resolve as service dependency
-            if param.annotation != inspect.Parameter.empty:
+            if annotation != inspect.Parameter.empty:
                 try:
-                    dependency = self.get(param.annotation)
+                    dependency = self.get(annotation)
                     kwargs[param_name] = dependency
                 except ValueError:
                     # If dependency not found and has default, use default
-                    if param.default != inspect.Parameter.empty:
-                        kwargs[param_name] = param.default
+                    if default != inspect.Parameter.empty:
+                        kwargs[param_name] = default
                     else:
-                        raise ValueError(f"Cannot resolve dependency {param.annotation.__name__} for {implementation.__name__}")
+                        raise ValueError(f"Cannot resolve dependency {annotation.__name__} for {implementation.__name__}")
         
         return implementation(**kwargs)
     
-    def _get_key(self, service_type: Type) -> str:
-        """Get unique key for service type"""
-        return f"{service_type.__module__}.{service_type.__name__}"
-    
     def clear(self) -> None:
         """Clear all registrations (useful for testing)"""
         self._services.clear()
         self._singletons.clear()
         self._factories.clear()
         self._configurations.clear()
+        self._plans.clear()
 
 # Global container instance
 container = ServiceContainer()
@@ -152,12 +273,36 @@ def get_service(interface: Type[T]) -> T:
 def inject(interface: Type[T]) -> Callable:
     """Decorator for dependency injection in functions"""
     def decorator(func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            service = get_service(interface)
-            return func(service, *args, **kwargs)
+            # Resolved on every call: a resolved singleton is one dict lookup in the
+            # container, and clear() or a new registration takes effect immediately
+            return func(get_service(interface), *args, **kwargs)
         return wrapper
     return decorator
 
+def lazy_singleton(import_path: str, **config) -> Callable[[], Any]:
+    """
+    Factory that imports and builds an implementation on first resolution only.
+    
+    Lets heavy drivers (pymongo, pinecone, ML models) stay unimported until a
+    service that needs them is actually requested. `import_path` has the form
+    'module.path:ClassName'; relative module paths resolve against this package.
+    """
+    instance = _MISSING
+    
+    def factory():
+        nonlocal instance
+        if instance is _MISSING:
+            module_path, class_name = import_path.split(':')
+            implementation = getattr(import_module(module_path, __package__), class_name)
+            instance = implementation(**config)
+        return instance
+    
+    # Lets is_singleton/warmup treat the factory like a singleton registration
+    factory.singleton = True
+    return factory
+
 # Example usage and configuration
 def configure_container() -> ServiceContainer:
     """Configure the dependency injection container with default services"""
@@ -165,24 +310,20 @@ def configure_container() -> ServiceContainer:
     # This would be called at application startup
     # Container configuration would be driven by environment/config
     
-    from ...infrastructure.database.mongodb_impl import MongoDBService
-    from ...infrastructure.database.redis_impl import RedisService
-    from ...infrastructure.database.pinecone_impl import PineconeService
-    from ...ml.embeddings import EmbeddingService
-    
     container.clear()
     
-    # Register database services
-    # container.register_singleton(DocumentDatabaseInterface, MongoDBService)
-    # container.register_singleton(CacheInterface, RedisService)  
-    # container.register_singleton(VectorDatabaseInterface, PineconeService)
+    # Register database services (imported on first use, not at startup)
+    # container.register_factory(DocumentDatabaseInterface, lazy_singleton(
+    #     '...infrastructure.database.mongodb_impl:MongoDBService',
+    #     connection_string=settings.MONGODB_CONNECTION_STRING,
+    #     database_name=settings.MONGODB_DATABASE_NAME))
+    # container.register_factory(CacheInterface, lazy_singleton('...infrastructure.database.redis_impl:RedisService'))
+    # container.register_factory(VectorDatabaseInterface, lazy_singleton('...infrastructure.database.pinecone_impl:PineconeService'))
     
     # Register ML services
-    # container.register_singleton(EmbeddingServiceInterface, EmbeddingService)
+    # container.register_factory(EmbeddingServiceInterface, lazy_singleton('...ml.embeddings:EmbeddingService'))
     
-    # Add configurations
-    # container.configure(MongoDBService, 
-    #                    connection_string=settings.MONGODB_CONNECTION_STRING,
-    #                    database_name=settings.MONGODB_DATABASE_NAME)
+    # Validate the dependency graph and precompute injection plans once at startup
+    container.compile()
     
-    return container
\ No newline at end of file
+    return container
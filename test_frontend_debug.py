@@ -4,6 +4,14 @@ Debug script to test frontend-backend communication
 """
 import requests
 import json
+from pathlib import Path
+
+FRONTEND_CONTAINER = "job-search-frontend-dev"
+NETWORK_PROBE = Path(__file__).parent / "scripts" / "network_probe.py"
+CONTAINER_PROBE_PATH = "/tmp/network_probe.py"
+
+# One keep-alive connection pool for all backend calls
+session = requests.Session()
 
 def test_backend_direct():
     """Test backend API directly"""
@@ -11,7 +19,7 @@ def test_backend_direct():
     
     try:
         # Test health endpoint
-        health_response = requests.get("http://localhost:8000/health", timeout=5)
+        health_response = session.get("http://localhost:8000/health", timeout=5)
         print(f"Health Status: {health_response.status_code}")
         print(f"Health Response: {health_response.text}")
         
@@ -21,7 +29,7 @@ def test_backend_direct():
             "max_results": 5
         }
         
-        search_response = requests.post(
+        search_response = session.post(
             "http://localhost:8000/search/",
             json=search_data,
             headers={"Content-Type": "application/json"},
@@ -52,33 +60,15 @@ def test_docker_network():
     import subprocess
     
     try:
+        # Copy the probe script in once and run it as a file
+        subprocess.run([
+            "docker", "cp", str(NETWORK_PROBE), f"{FRONTEND_CONTAINER}:{CONTAINER_PROBE_PATH}"
+        ], check=True, capture_output=True, text=True, timeout=30)
+        
         # Test backend connectivity from frontend container
         result = subprocess.run([
-            "docker", "exec", "job-search-frontend-dev",
-            "python", "-c", """
-import requests
-import json
-
-try:
-    # Test backend connection
-    response = requests.post(
-        'http://backend:8000/search/',
-        json={'query': 'python developer', 'max_results': 3},
-        headers={'Content-Type': 'application/json'},
-        timeout=10
-    )
-    
-    print(f'Status: {response.status_code}')
-    if response.status_code == 200:
-        data = response.json()
-        print(f'Jobs: {len(data.get("jobs", []))}')
-        print('Frontend can reach backend!')
-    else:
-        print(f'Error: {response.text}')
-        
-except Exception as e:
-    print(f'Error: {e}')
-"""
+            "docker", "exec", FRONTEND_CONTAINER,
+            "python", CONTAINER_PROBE_PATH
         ], capture_output=True, text=True, timeout=30)
         
         print("Docker exec output:")
@@ -0,0 +1,12 @@
+"""
+Shared pytest setup.
+
+Settings are validated when src.job_search.core.config is imported, and the
+default full-ml mode requires a Pinecone key. Tests mock every external
+service, so a placeholder key lets the modules under test import without a
+configured environment. A key already set in the environment is kept.
+"""
+
+import os
+
+os.environ.setdefault("PINECONE_API_KEY", "test-key")
@@ -1,161 +1,231 @@
 #!/usr/bin/env python3
 """
-Test script for MongoDB user tracking API endpoints
+Tests for the MongoDB user tracking API endpoints.
+
+These run against a live API on BASE_URL and are skipped when it is not
+reachable. Every test gets its own user, and fixtures save (and update)
+the job it needs, so the cases are independent: they can be selected with
+-k or spread across pytest -n auto workers in any order. The API has no
+user-delete endpoint, so the user documents are removed through the MongoDB
+the API is configured with.
 """
 
-import requests
-import json
-import time
+import uuid
 import sys
-from datetime import datetime
+
+import pytest
+import requests
+from pymongo import MongoClient
+from requests.adapters import HTTPAdapter
 
 # API base URL
 BASE_URL = "http://localhost:8000"
 
-def test_api_endpoints():
-    """Test all user tracking API endpoints"""
+# requests waits forever by default; a dead server should fail fast instead
+PROBE_TIMEOUT = 1
+REQUEST_TIMEOUT = 10
+
+JOB_DATA = {
+    "text": "Senior Python Developer at API Test Corp - Remote position with great benefits...",
+    "score": 0.92,
+    "vector_score": 0.85,
+    "cross_score": 0.92,
+    "source": "api_test"
+}
+
+
+@pytest.fixture(scope="session")
+def api_session():
+    """One keep-alive connection pool shared by every API call"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    try:
+        session.get(f"{BASE_URL}/health", timeout=PROBE_TIMEOUT).raise_for_status()
+    except requests.exceptions.RequestException:
+        session.close()
+        pytest.skip(f"API is not ready on {BASE_URL}")
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def users_collection():
+    """The users collection behind the API, or None when MongoDB is not configured here"""
+    try:
+        from src.job_search.core.config import settings
+    except Exception:  # settings validation raises when the environment is incomplete
+        yield None
+        return
+    if not settings.MONGODB_CONNECTION_STRING:
+        yield None
+        return
+    client = MongoClient(settings.MONGODB_CONNECTION_STRING, serverSelectionTimeoutMS=5000)
+    yield client[settings.MONGODB_DATABASE_NAME].users
+    client.close()
+
+
+@pytest.fixture
+def user_id(users_collection):
+    """Unique per test so cases never share MongoDB documents, deleted afterwards"""
+    test_user_id = f"test_user_api_{uuid.uuid4().hex}"
+    yield test_user_id
+    if users_collection is not None:
+        users_collection.delete_one({"user_id": test_user_id})
+
+
+@pytest.fixture
+def job_id(api_session, user_id):
+    """A job ID for the test's user, removed again afterwards if a test saved it"""
+    job_id = f"job_api_test_{uuid.uuid4().hex}"
+    yield job_id
+    # 404 when the test already removed it or never saved it
+    api_session.delete(f"{BASE_URL}/users/{user_id}/saved-jobs/{job_id}", timeout=REQUEST_TIMEOUT)
+
+
+@pytest.fixture
+def saved_job(api_session, user_id, job_id):
+    """Save job_id for the test's user and return it"""
+    save_data = {
+        "job_id": job_id,
+        "job_data": JOB_DATA
+    }
+    response = api_session.post(f"{BASE_URL}/users/{user_id}/saved-jobs", json=save_data, timeout=REQUEST_TIMEOUT)
+    assert response.status_code == 201, response.text
+    return job_id
+
+
+@pytest.fixture
+def applied_job(api_session, user_id, saved_job):
+    """Move the saved job to the applied status and return it"""
+    update_data = {"status": "applied", "notes": "Applied through API test"}
+    response = api_session.put(f"{BASE_URL}/users/{user_id}/saved-jobs/{saved_job}", json=update_data, timeout=REQUEST_TIMEOUT)
+    assert response.status_code == 200, response.text
+    return saved_job
+
+
+def test_health(api_session):
+    """Test the API and MongoDB report healthy"""
+    response = api_session.get(f"{BASE_URL}/health", timeout=REQUEST_TIMEOUT)
     
-    print("Testing MongoDB User Tracking API Endpoints\n")
+    assert response.status_code == 200
+    mongodb_status = response.json().get('components', {}).get('mongodb', {}).get('status', 'unknown')
+    assert mongodb_status == 'healthy', f"MongoDB not healthy: {mongodb_status}"
+
+
+def test_required_indexes(api_session):
+    """Test the users collection has every index the user endpoints query by"""
+    response = api_session.get(f"{BASE_URL}/health/mongodb/indexes", timeout=REQUEST_TIMEOUT)
     
-    # Test data
-    user_id = "test_user_api_123"
-    job_id = "job_api_test_456"
-    job_data = {
-        "text": "Senior Python Developer at API Test Corp - Remote position with great benefits...",
-        "score": 0.92,
-        "vector_score": 0.85,
-        "cross_score": 0.92,
-        "source": "api_test"
+    assert response.status_code == 200, response.text
+    assert response.json()['missing'] == [], "Missing MongoDB indexes would turn lookups into collection scans"
+
+
+def test_save_job(api_session, user_id, job_id):
+    """Test POST /users/{user_id}/saved-jobs"""
+    save_data = {
+        "job_id": job_id,
+        "job_data": JOB_DATA
     }
+    response = api_session.post(f"{BASE_URL}/users/{user_id}/saved-jobs", json=save_data, timeout=REQUEST_TIMEOUT)
     
-    try:
-        # 1. Test API health check
-        print("1. Testing API health check...")
-        response = requests.get(f"{BASE_URL}/health")
-        if response.status_code == 200:
-            health_data = response.json()
-            print(f"   API Status: {health_data.get('status', 'unknown')}")
-            mongodb_status = health_data.get('components', {}).get('mongodb', {}).get('status', 'unknown')
-            print(f"   MongoDB Status: {mongodb_status}")
-            if mongodb_status != 'healthy':
-                print("   ERROR: MongoDB not healthy")
-                return False
-            print("   SUCCESS: API and MongoDB healthy\n")
-        else:
-            print(f"   ERROR: Health check failed with status {response.status_code}")
-            return False
-        
-        # 2. Test saving a job (POST /users/{user_id}/saved-jobs)
-        print("2. Testing POST /users/{user_id}/saved-jobs...")
-        save_data = {
-            "job_id": job_id,
-            "job_data": job_data
-        }
-        response = requests.post(f"{BASE_URL}/users/{user_id}/saved-jobs", json=save_data)
-        if response.status_code == 201:
-            result = response.json()
-            print(f"   SUCCESS: Job saved - {result['message']}")
-        else:
-            print(f"   ERROR: Failed to save job - Status: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
-        print()
-        
-        # 3. Test getting saved jobs (GET /users/{user_id}/saved-jobs)
-        print("3. Testing GET /users/{user_id}/saved-jobs...")
-        response = requests.get(f"{BASE_URL}/users/{user_id}/saved-jobs")
-        if response.status_code == 200:
-            result = response.json()
-            print(f"   SUCCESS: Retrieved {result['total_saved']} saved jobs")
-            if result['jobs']:
-                job = result['jobs'][0]
-                print(f"   Job ID: {job['job_id']}")
-                print(f"   Status: {job['status']}")
-                print(f"   Job Text: {job['job_data']['text'][:50]}...")
-            print(f"   Statistics: {result['statistics']}")
-        else:
-            print(f"   ERROR: Failed to get saved jobs - Status: {response.status_code}")
-            return False
-        print()
-        
-        # 4. Test updating job status (PUT /users/{user_id}/saved-jobs/{job_id})
-        print("4. Testing PUT /users/{user_id}/saved-jobs/{job_id}...")
-        update_data = {
-            "status": "applied",
-            "notes": "Applied through API test - looks promising!"
-        }
-        response = requests.put(f"{BASE_URL}/users/{user_id}/saved-jobs/{job_id}", json=update_data)
-        if response.status_code == 200:
-            result = response.json()
-            print(f"   SUCCESS: Status updated - {result['message']}")
-            print(f"   New status: {result['new_status']}")
-            print(f"   Notes: {result['notes']}")
-        else:
-            print(f"   ERROR: Failed to update job status - Status: {response.status_code}")
-            return False
-        print()
-        
-        # 5. Test filtering by status
-        print("5. Testing status filtering...")
-        response = requests.get(f"{BASE_URL}/users/{user_id}/saved-jobs?status=applied")
-        if response.status_code == 200:
-            result = response.json()
-            print(f"   SUCCESS: Found {result['total_saved']} applied jobs")
-        else:
-            print(f"   ERROR: Failed to filter jobs - Status: {response.status_code}")
-            return False
-        print()
-        
-        # 6. Test user statistics (GET /users/{user_id}/stats)
-        print("6. Testing GET /users/{user_id}/stats...")
-        response = requests.get(f"{BASE_URL}/users/{user_id}/stats")
-        if response.status_code == 200:
-            result = response.json()
-            print(f"   SUCCESS: Retrieved user statistics")
-            print(f"   Total jobs: {result['total_jobs']}")
-            print(f"   By status: {result['by_status']}")
-            print(f"   Recent activity: {result['recent_activity']}")
-        else:
-            print(f"   ERROR: Failed to get user stats - Status: {response.status_code}")
-            return False
-        print()
-        
-        # 7. Test removing a job (DELETE /users/{user_id}/saved-jobs/{job_id})
-        print("7. Testing DELETE /users/{user_id}/saved-jobs/{job_id}...")
-        response = requests.delete(f"{BASE_URL}/users/{user_id}/saved-jobs/{job_id}")
-        if response.status_code == 200:
-            result = response.json()
-            print(f"   SUCCESS: Job removed - {result['message']}")
-        else:
-            print(f"   ERROR: Failed to remove job - Status: {response.status_code}")
-            return False
-        print()
-        
-        # 8. Verify job was removed
-        print("8. Verifying job removal...")
-        response = requests.get(f"{BASE_URL}/users/{user_id}/saved-jobs")
-        if response.status_code == 200:
-            result = response.json()
-            if result['total_saved'] == 0:
-                print("   SUCCESS: Job successfully removed from database")
-            else:
-                print(f"   ERROR: Job still exists: {result['total_saved']} jobs remaining")
-                return False
-        else:
-            print(f"   ERROR: Failed to verify removal - Status: {response.status_code}")
-            return False
-        print()
-        
-        print("SUCCESS: All API endpoint tests passed!")
-        return True
-        
-    except requests.exceptions.ConnectionError:
-        print("ERROR: Could not connect to API. Make sure the server is running on http://localhost:8000")
-        return False
-    except Exception as e:
-        print(f"ERROR: Unexpected error: {e}")
-        return False
+    assert response.status_code == 201, response.text
+    assert response.json()['message']
+
+
+def test_list_saved_jobs(api_session, user_id, saved_job):
+    """Test GET /users/{user_id}/saved-jobs"""
+    response = api_session.get(f"{BASE_URL}/users/{user_id}/saved-jobs", timeout=REQUEST_TIMEOUT)
+    
+    assert response.status_code == 200
+    result = response.json()
+    assert result['total_saved'] == 1
+    job = result['jobs'][0]
+    assert job['job_id'] == saved_job
+    assert job['job_data']['text'] == JOB_DATA['text']
+    assert 'statistics' in result
+
+
+def test_get_saved_job(api_session, user_id, saved_job):
+    """Test GET /users/{user_id}/saved-jobs/{job_id} returns the complete job data"""
+    response = api_session.get(f"{BASE_URL}/users/{user_id}/saved-jobs/{saved_job}", timeout=REQUEST_TIMEOUT)
+    
+    assert response.status_code == 200
+    assert response.json()['job_data'] == JOB_DATA
+
+
+def test_list_saved_jobs_paged(api_session, user_id, saved_job):
+    """Test skip/limit page the saved jobs without changing total_saved"""
+    response = api_session.get(f"{BASE_URL}/users/{user_id}/saved-jobs", params={"skip": 1, "limit": 1}, timeout=REQUEST_TIMEOUT)
+    
+    assert response.status_code == 200
+    result = response.json()
+    assert result['total_saved'] == 1
+    assert result['jobs'] == []
+
+
+def test_update_job_status(api_session, user_id, saved_job):
+    """Test PUT /users/{user_id}/saved-jobs/{job_id}"""
+    update_data = {
+        "status": "applied",
+        "notes": "Applied through API test - looks promising!"
+    }
+    response = api_session.put(f"{BASE_URL}/users/{user_id}/saved-jobs/{saved_job}", json=update_data, timeout=REQUEST_TIMEOUT)
+    
+    assert response.status_code == 200
+    result = response.json()
+    assert result['new_status'] == "applied"
+    assert result['notes'] == update_data['notes']
+
+
+@pytest.mark.parametrize("status, expected", [("applied", 1), ("saved", 0)])
+def test_filter_by_status(api_session, user_id, applied_job, status, expected):
+    """Test status filtering on GET /users/{user_id}/saved-jobs"""
+    response = api_session.get(f"{BASE_URL}/users/{user_id}/saved-jobs", params={"status": status}, timeout=REQUEST_TIMEOUT)
+    
+    assert response.status_code == 200
+    assert response.json()['total_saved'] == expected
+
+
+def test_user_stats(api_session, user_id, saved_job):
+    """Test GET /users/{user_id}/stats"""
+    response = api_session.get(f"{BASE_URL}/users/{user_id}/stats", timeout=REQUEST_TIMEOUT)
+    
+    assert response.status_code == 200
+    result = response.json()
+    assert result['total_jobs'] == 1
+    assert 'by_status' in result
+    assert 'recent_activity' in result
+
+
+def test_remove_job(api_session, user_id, saved_job):
+    """Test DELETE /users/{user_id}/saved-jobs/{job_id}"""
+    response = api_session.delete(f"{BASE_URL}/users/{user_id}/saved-jobs/{saved_job}", timeout=REQUEST_TIMEOUT)
+    
+    assert response.status_code == 200
+    assert response.json()['message']
+    
+    # GET /users/{user_id}/saved-jobs/count no longer counts the removed job
+    response = api_session.get(f"{BASE_URL}/users/{user_id}/saved-jobs/count", timeout=REQUEST_TIMEOUT)
+    
+    assert response.status_code == 200
+    assert response.json()['count'] == 0
+
+
+def test_bulk_operations(api_session, user_id):
+    """Test POST /users/{user_id}/saved-jobs/bulk applies a whole workflow in one call"""
+    bulk_job_id = f"job_api_bulk_{uuid.uuid4().hex}"
+    ops = [
+        {"action": "save", "job_id": bulk_job_id, "job_data": JOB_DATA},
+        {"action": "update", "job_id": bulk_job_id, "status": "applied", "notes": "Bulk test"},
+        {"action": "remove", "job_id": bulk_job_id},
+    ]
+    response = api_session.post(f"{BASE_URL}/users/{user_id}/saved-jobs/bulk", json={"ops": ops}, timeout=REQUEST_TIMEOUT)
+    
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result['operations'] == 3
+    assert result['modified'] == 3
+
 
 if __name__ == "__main__":
-    success = test_api_endpoints()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,153 @@
+"""
+Tests for the dependency injection container.
+
+This module tests service registration, constructor injection and the
+precompiled injection plans.
+"""
+
+import pytest
+from src.job_search.shared.core import container as container_module
+from src.job_search.shared.core.container import ServiceContainer, inject, lazy_singleton, _cached_params
+
+
+class Repository:
+    pass
+
+
+class Service:
+    def __init__(self, repository: Repository, retries: int = 3, name='default'):
+        self.repository = repository
+        self.retries = retries
+        self.name = name
+
+
+class Client:
+    def __init__(self, service: Service):
+        self.service = service
+
+
+class Loop:
+    def __init__(self, other: Client):
+        self.other = other
+
+
+class TestServiceContainer:
+    """Test cases for service resolution"""
+    
+    def setup_method(self):
+        self.container = ServiceContainer()
+        self.container.register_singleton(Repository, Repository)
+        self.container.register_transient(Service, Service)
+        self.container.register_singleton(Client, Client)
+        self.container.configure(Service, name='configured')
+    
+    def test_constructor_injection(self):
+        """Test singletons are shared and transients are recreated"""
+        client = self.container.get(Client)
+        
+        assert client is self.container.get(Client)
+        assert client.service.repository is self.container.get(Repository)
+        assert client.service.retries == 3
+        assert client.service.name == 'configured'
+        assert self.container.get(Service) is not self.container.get(Service)
+    
+    def test_registered_none_instance(self):
+        """Test an instance registered as None is returned as is"""
+        self.container.register_instance(Repository, None)
+        
+        assert self.container.get(Repository) is None
+    
+    def test_unregistered_service(self):
+        """Test resolving an unregistered service fails"""
+        self.container.clear()
+        
+        with pytest.raises(ValueError):
+            self.container.get(Client)
+    
+    def test_compiled_resolution_matches(self):
+        """Test compiled plans resolve the same graph"""
+        self.container.compile()
+        client = self.container.get(Client)
+        
+        assert client.service.repository is self.container.get(Repository)
+        assert client.service.name == 'configured'
+    
+    def test_compile_missing_dependency(self):
+        """Test compile reports dependencies that cannot be resolved"""
+        container = ServiceContainer().register_singleton(Client, Client)
+        
+        with pytest.raises(ValueError, match="Cannot resolve dependency Service"):
+            container.compile()
+    
+    def test_compile_detects_cycles(self):
+        """Test compile rejects circular dependencies"""
+        self.container.register_singleton(Service, Loop)
+        
+        with pytest.raises(ValueError, match="Circular dependency"):
+            self.container.compile()
+    
+    def test_lazy_singleton_factory(self):
+        """Test lazy factories import once and return the same instance"""
+        self.container.register_factory(Repository, lazy_singleton('collections:OrderedDict', a=1))
+        
+        repository = self.container.get(Repository)
+        
+        assert repository == {'a': 1}
+        assert self.container.get(Repository) is repository
+    
+    def test_constructor_without_parameters(self):
+        """Test classes without constructor parameters skip signature inspection"""
+        class Bare:
+            def __init__(self):
+                self.ready = True
+        
+        self.container.register_transient(Bare, Bare)
+        
+        assert _cached_params(Repository) == ()
+        assert _cached_params(Bare) == ()
+        assert self.container.get(Bare).ready
+        assert _cached_params(Service)[0][0] == 'repository'
+    
+    def test_inject_returns_shared_singletons(self, monkeypatch):
+        """Test inject returns the shared singleton and a new transient on each call"""
+        monkeypatch.setattr(container_module, 'container', self.container)
+        
+        @inject(Repository)
+        def use_repository(repository):
+            return repository
+        
+        @inject(Service)
+        def use_service(service):
+            return service
+        
+        assert use_repository() is use_repository()
+        assert self.container.is_singleton(Repository)
+        assert not self.container.is_singleton(Service)
+        assert use_service() is not use_service()
+        assert use_repository.__name__ == 'use_repository'
+    
+    def test_inject_follows_registration_changes(self, monkeypatch):
+        """Test inject picks up re-registered and cleared services"""
+        monkeypatch.setattr(container_module, 'container', self.container)
+        
+        @inject(Repository)
+        def use_repository(repository):
+            return repository
+        
+        original = use_repository()
+        replacement = Repository()
+        self.container.register_instance(Repository, replacement)
+        assert use_repository() is replacement is not original
+        
+        self.container.clear()
+        with pytest.raises(ValueError):
+            use_repository()
+    
+    def test_warmup_resolves_singletons(self):
+        """Test warmup builds singletons, including lazy factories, but not transients"""
+        self.container.register_factory(dict, lazy_singleton('collections:OrderedDict'))
+        
+        assert self.container.warmup() == 3
+        assert Client in self.container._singletons
+        assert Service not in self.container._singletons
+        assert self.container.warmup() == 0
@@ -1,172 +1,285 @@
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from indexing import get_embedding, embed_and_index, get_pinecone_index
-from embedding_service import EmbeddingServiceError
-from config import AppMode
+from types import SimpleNamespace
+import numpy as np
+from unittest.mock import Mock
+
+pytest.importorskip("pinecone")
+
+from src.job_search.ml import indexing
+from src.job_search.ml.indexing import get_embedding, embed_and_index, get_pinecone_index, PINECONE_POOL_THREADS
+from src.job_search.ml.embeddings import EmbeddingServiceError
+from src.job_search.core.config import AppMode
+
+# Built once and shared by every test instead of rebuilding 768-float lists
+FAKE_EMB = np.full(768, 0.1, dtype=np.float32).tolist()
+FAKE_EMB_2 = np.full(768, 0.2, dtype=np.float32).tolist()
+
+# Long enough (110 words) for the text processor to keep it as one chunk
+JOB_TEXT = (
+    "Acme is hiring a senior Python developer to build data pipelines with Django and PostgreSQL. "
+    "You will design APIs, review code, mentor engineers and own services in production. "
+    "We need five years of experience, strong testing habits and comfort with Docker and AWS. "
+    "The role is remote with a salary of 150k and generous equity. "
+) * 2
+
+# list_indexes() results; get_pinecone_index only reads .name from each entry
+NO_INDEXES = ()
+EXISTING_INDEXES = (SimpleNamespace(name='test-index'),)
 
 
 class TestIndexing:
     
+    @pytest.fixture(scope="module")
+    def _service_mock(self):
+        """Embedding service stand-in built once per module"""
+        mock_service = Mock()
+        mock_service.get_embedding.return_value = FAKE_EMB
+        return mock_service
+    
     @pytest.fixture
-    def mock_embedding_service(self):
+    def mock_embedding_service(self, monkeypatch, _service_mock):
         """Mock embedding service"""
-        with patch('indexing.embedding_service') as mock_service:
-            mock_service.get_embedding.return_value = [0.1] * 768
-            yield mock_service
+        _service_mock.reset_mock(side_effect=True)
+        monkeypatch.setattr(indexing, 'embedding_service', _service_mock)
+        return _service_mock
+    
+    @pytest.fixture(scope="module")
+    def _pinecone_mocks(self):
+        """Pinecone client hierarchy built once per module"""
+        mock_pinecone_class = Mock()
+        mock_pc_instance = Mock()
+        mock_pinecone_class.return_value = mock_pc_instance
+        
+        # Mock index creation
+        mock_pc_instance.create_index.return_value = None
+        
+        # Mock index object
+        mock_index = Mock()
+        mock_pc_instance.Index.return_value = mock_index
+        
+        return {
+            'pc_class': mock_pinecone_class,
+            'pc_instance': mock_pc_instance,
+            'index': mock_index
+        }
     
     @pytest.fixture
-    def mock_pinecone(self):
+    def mock_pinecone(self, monkeypatch, _pinecone_mocks):
         """Mock Pinecone components"""
-        with patch('indexing.Pinecone') as mock_pinecone_class, \
-             patch('indexing.PINECONE_API_KEY', 'test-key'), \
-             patch('indexing.PINECONE_INDEX_NAME', 'test-index'):
-            
-            mock_pc_instance = Mock()
-            mock_pinecone_class.return_value = mock_pc_instance
-            
-            # Mock index list and creation
-            mock_pc_instance.list_indexes.return_value = []
-            mock_pc_instance.create_index.return_value = None
-            
-            # Mock index object
-            mock_index = Mock()
-            mock_pc_instance.Index.return_value = mock_index
-            
-            yield {
-                'pc_class': mock_pinecone_class,
-                'pc_instance': mock_pc_instance,
-                'index': mock_index
-            }
-    
-    def test_get_embedding_full_ml_mode(self, mock_embedding_service):
+        # Clear calls and side effects left by the previous test
+        for mock in _pinecone_mocks.values():
+            mock.reset_mock(side_effect=True)
+        _pinecone_mocks['pc_instance'].list_indexes.return_value = NO_INDEXES
+        
+        monkeypatch.setattr(indexing, 'Pinecone', _pinecone_mocks['pc_class'])
+        monkeypatch.setattr(indexing, 'PINECONE_API_KEY', 'test-key')
+        monkeypatch.setattr(indexing, 'PINECONE_INDEX_NAME', 'test-index')
+        
+        # get_pinecone_index caches its handle; each test needs a fresh lookup,
+        # and embed_and_index upserts into whatever it returns
+        get_pinecone_index.cache_clear()
+        yield _pinecone_mocks
+        get_pinecone_index.cache_clear()
+    
+    def test_get_embedding_full_ml_mode(self, monkeypatch, mock_embedding_service):
         """Test get_embedding function in full-ml mode"""
-        with patch('indexing.APP_MODE', AppMode.FULL_ML):
-            result = get_embedding("test text")
-            
-            assert result == [0.1] * 768
-            mock_embedding_service.get_embedding.assert_called_once_with("test text", fallback=False)
+        monkeypatch.setattr(indexing, 'APP_MODE', AppMode.FULL_ML)
+        
+        result = get_embedding("test text")
+        
+        assert result == FAKE_EMB
+        mock_embedding_service.get_embedding.assert_called_once_with("test text", fallback=False)
     
-    def test_get_embedding_cloud_ml_mode(self, mock_embedding_service):
+    def test_get_embedding_cloud_ml_mode(self, monkeypatch, mock_embedding_service):
         """Test get_embedding function in cloud-ml mode with fallback"""
-        with patch('indexing.APP_MODE', AppMode.CLOUD_ML):
-            result = get_embedding("test text")
-            
-            assert result == [0.1] * 768
-            mock_embedding_service.get_embedding.assert_called_once_with("test text", fallback=True)
+        monkeypatch.setattr(indexing, 'APP_MODE', AppMode.CLOUD_ML)
+        
+        result = get_embedding("test text")
+        
+        assert result == FAKE_EMB
+        mock_embedding_service.get_embedding.assert_called_once_with("test text", fallback=True)
     
-    def test_get_embedding_lightweight_mode(self, mock_embedding_service):
+    def test_get_embedding_lightweight_mode(self, monkeypatch, mock_embedding_service):
         """Test get_embedding function raises error in lightweight mode"""
-        with patch('indexing.APP_MODE', AppMode.LIGHTWEIGHT):
-            with pytest.raises(EmbeddingServiceError, match="not supported in lightweight mode"):
-                get_embedding("test text")
+        monkeypatch.setattr(indexing, 'APP_MODE', AppMode.LIGHTWEIGHT)
+        
+        with pytest.raises(EmbeddingServiceError, match="not supported in lightweight mode"):
+            get_embedding("test text")
     
-    def test_get_embedding_service_failure(self, mock_embedding_service):
+    def test_get_embedding_service_failure(self, monkeypatch, mock_embedding_service):
         """Test get_embedding function when embedding service fails"""
-        with patch('indexing.APP_MODE', AppMode.FULL_ML):
-            mock_embedding_service.get_embedding.side_effect = EmbeddingServiceError("Service down")
-            
-            with pytest.raises(EmbeddingServiceError, match="Service down"):
-                get_embedding("test text")
+        monkeypatch.setattr(indexing, 'APP_MODE', AppMode.FULL_ML)
+        mock_embedding_service.get_embedding.side_effect = EmbeddingServiceError("Service down")
+        
+        with pytest.raises(EmbeddingServiceError, match="Service down"):
+            get_embedding("test text")
     
     def test_get_pinecone_index_existing(self, mock_pinecone):
         """Test get_pinecone_index when index already exists"""
-        # Mock existing index
-        mock_index_obj = Mock()
-        mock_index_obj.name = 'test-index'
-        mock_pinecone['pc_instance'].list_indexes.return_value = [mock_index_obj]
+        mock_pinecone['pc_instance'].list_indexes.return_value = EXISTING_INDEXES
         
         index = get_pinecone_index()
         
         assert index is not None
         mock_pinecone['pc_instance'].create_index.assert_not_called()
-        mock_pinecone['pc_instance'].Index.assert_called_once_with('test-index')
+        mock_pinecone['pc_instance'].Index.assert_called_once_with('test-index', pool_threads=PINECONE_POOL_THREADS)
     
-    def test_get_pinecone_index_create_new(self, mock_pinecone):
+    def test_get_pinecone_index_create_new(self, monkeypatch, mock_pinecone):
         """Test get_pinecone_index creates new index when it doesn't exist"""
-        # Mock no existing indexes
-        mock_pinecone['pc_instance'].list_indexes.return_value = []
+        # The fixture starts with no existing indexes
+        monkeypatch.setattr('pinecone.ServerlessSpec', Mock())
+        
+        index = get_pinecone_index()
         
-        with patch('indexing.ServerlessSpec') as mock_spec:
-            index = get_pinecone_index()
-            
-            assert index is not None
-            mock_pinecone['pc_instance'].create_index.assert_called_once()
-            mock_pinecone['pc_instance'].Index.assert_called_once_with('test-index')
+        assert index is not None
+        mock_pinecone['pc_instance'].create_index.assert_called_once()
+        mock_pinecone['pc_instance'].Index.assert_called_once_with('test-index', pool_threads=PINECONE_POOL_THREADS)
+    
+    def test_get_pinecone_index_cached(self, mock_pinecone):
+        """Test get_pinecone_index lists indexes only once across calls"""
+        first = get_pinecone_index()
+        second = get_pinecone_index()
+        
+        assert first is second
+        assert mock_pinecone['pc_instance'].list_indexes.call_count == 1
+        mock_pinecone['pc_class'].assert_called_once()
     
-    def test_get_pinecone_index_no_api_key(self):
+    def test_get_pinecone_index_no_api_key(self, monkeypatch):
         """Test get_pinecone_index raises error when API key is missing"""
-        with patch('indexing.PINECONE_API_KEY', None):
-            with pytest.raises(ValueError, match="PINECONE_API_KEY is not set"):
-                get_pinecone_index()
+        monkeypatch.setattr(indexing, 'PINECONE_API_KEY', None)
+        get_pinecone_index.cache_clear()
+        
+        with pytest.raises(ValueError, match="PINECONE_API_KEY is not set"):
+            get_pinecone_index()
     
     def test_embed_and_index_empty_jobs(self, mock_pinecone):
         """Test embed_and_index with empty job list"""
-        with patch('indexing.index', mock_pinecone['index']):
-            embed_and_index([])
-            
-            mock_pinecone['index'].upsert.assert_not_called()
+        assert embed_and_index([]) == []
+        
+        mock_pinecone['index'].upsert.assert_not_called()
     
-    def test_embed_and_index_single_batch(self, mock_embedding_service, mock_pinecone):
+    def test_embed_and_index_single_batch(self, monkeypatch, mock_embedding_service, mock_pinecone):
         """Test embed_and_index with jobs that fit in single batch"""
         jobs = [
-            {'id': 'job1', 'text': 'Python developer position'},
-            {'id': 'job2', 'text': 'Java developer role'}
+            {'id': 'job1', 'text': JOB_TEXT},
+            {'id': 'job2', 'text': JOB_TEXT.replace('Python', 'Java')}
         ]
         
-        with patch('indexing.index', mock_pinecone['index']), \
-             patch('indexing.get_embedding') as mock_get_embedding:
-            
-            mock_get_embedding.side_effect = [[0.1] * 768, [0.2] * 768]
-            
-            embed_and_index(jobs, batch_size=32)
-            
-            # Verify upsert was called once with correct vectors
-            mock_pinecone['index'].upsert.assert_called_once()
-            call_args = mock_pinecone['index'].upsert.call_args[1]['vectors']
-            
-            assert len(call_args) == 2
-            assert call_args[0]['id'] == 'job1'
-            assert call_args[0]['values'] == [0.1] * 768
-            assert call_args[0]['metadata']['text'] == 'Python developer position'
-    
-    def test_embed_and_index_multiple_batches(self, mock_embedding_service, mock_pinecone):
+        mock_get_embeddings = Mock(return_value=[FAKE_EMB, FAKE_EMB_2])
+        monkeypatch.setattr(indexing, 'get_embeddings_batch', mock_get_embeddings)
+        
+        assert embed_and_index(jobs, batch_size=32) == ['job1', 'job2']
+        
+        # One embedding call for the whole batch
+        mock_get_embeddings.assert_called_once()
+        
+        # Verify upsert was called once with correct vectors
+        mock_pinecone['index'].upsert.assert_called_once()
+        call_args = mock_pinecone['index'].upsert.call_args[1]['vectors']
+        
+        assert len(call_args) == 2
+        assert call_args[0]['id'] == 'job1_chunk_0'
+        assert call_args[0]['values'] == FAKE_EMB
+        assert call_args[0]['metadata']['text'] == JOB_TEXT.strip()
+        assert call_args[0]['metadata']['parent_job_id'] == 'job1'
+        assert call_args[1]['values'] == FAKE_EMB_2
+        
+        # NER metadata extracted once per job is attached to its chunks
+        assert 'Python' in call_args[0]['metadata']['skills']
+        assert call_args[0]['metadata']['skills_count'] == len(call_args[0]['metadata']['skills'])
+    
+    def test_embed_and_index_multiple_batches(self, monkeypatch, mock_embedding_service, mock_pinecone):
         """Test embed_and_index with jobs requiring multiple batches"""
         jobs = [
-            {'id': f'job{i}', 'text': f'Job description {i}'}
+            {'id': f'job{i}', 'text': f'Job {i}. {JOB_TEXT}'}
             for i in range(5)
         ]
         
-        with patch('indexing.index', mock_pinecone['index']), \
-             patch('indexing.get_embedding') as mock_get_embedding:
-            
-            mock_get_embedding.side_effect = [[0.1] * 768] * 5
-            
-            embed_and_index(jobs, batch_size=2)
-            
-            # Should be called 3 times (2+2+1)
-            assert mock_pinecone['index'].upsert.call_count == 3
-    
-    def test_embed_and_index_embedding_failure(self, mock_embedding_service, mock_pinecone):
+        mock_get_embeddings = Mock(side_effect=lambda texts: [FAKE_EMB] * len(texts))
+        monkeypatch.setattr(indexing, 'get_embeddings_batch', mock_get_embeddings)
+        
+        embed_and_index(jobs, batch_size=2)
+        
+        # Should be called 3 times (2+2+1), one embedding call per batch
+        assert mock_get_embeddings.call_count == 3
+        assert mock_pinecone['index'].upsert.call_count == 3
+        
+        # Upserts are sent asynchronously and all awaited at the end
+        for call in mock_pinecone['index'].upsert.call_args_list:
+            assert call[1]['async_req'] is True
+        assert mock_pinecone['index'].upsert.return_value.get.call_count == 3
+    
+    def test_embed_and_index_sync_upsert_fallback(self, monkeypatch, mock_embedding_service, mock_pinecone):
+        """Test clients without async_req support are upserted synchronously"""
+        jobs = [{'id': 'job1', 'text': JOB_TEXT}]
+        
+        monkeypatch.setattr(indexing, 'get_embeddings_batch', Mock(side_effect=lambda texts: [FAKE_EMB] * len(texts)))
+        mock_pinecone['index'].upsert.side_effect = [TypeError("unexpected keyword argument 'async_req'"), None]
+        
+        embed_and_index(jobs)
+        
+        # Retried once without async_req; there is no async result to wait for
+        assert mock_pinecone['index'].upsert.call_count == 2
+        assert 'async_req' not in mock_pinecone['index'].upsert.call_args[1]
+        mock_pinecone['index'].upsert.return_value.get.assert_not_called()
+    
+    def test_embed_and_index_embedding_failure(self, monkeypatch, mock_embedding_service, mock_pinecone):
         """Test embed_and_index when embedding generation fails"""
-        jobs = [{'id': 'job1', 'text': 'Test job'}]
+        jobs = [{'id': 'job1', 'text': JOB_TEXT}]
+        
+        mock_get_embedding = Mock(side_effect=EmbeddingServiceError("Service failed"))
+        monkeypatch.setattr(indexing, 'get_embeddings_batch', Mock(side_effect=EmbeddingServiceError("Service failed")))
+        monkeypatch.setattr(indexing, 'get_embedding', mock_get_embedding)
+        
+        # Nothing reached the index, so no job is reported as indexed
+        assert embed_and_index(jobs) == []
         
-        with patch('indexing.index', mock_pinecone['index']), \
-             patch('indexing.get_embedding') as mock_get_embedding:
-            
-            mock_get_embedding.side_effect = EmbeddingServiceError("Service failed")
-            
-            with pytest.raises(EmbeddingServiceError):
-                embed_and_index(jobs)
+        # The batch is retried chunk by chunk; failed chunks are skipped, not upserted
+        assert mock_get_embedding.called
+        mock_pinecone['index'].upsert.assert_not_called()
     
-    def test_embed_and_index_pinecone_failure(self, mock_embedding_service, mock_pinecone):
+    def test_embed_and_index_job_without_chunks(self, monkeypatch, mock_embedding_service, mock_pinecone):
+        """Test jobs too short to chunk count as indexed since a retry cannot add anything"""
+        jobs = [{'id': 'job1', 'text': JOB_TEXT}, {'id': 'job2', 'text': 'Short posting'}]
+        
+        monkeypatch.setattr(indexing, 'get_embeddings_batch', Mock(side_effect=lambda texts: [FAKE_EMB] * len(texts)))
+        
+        assert embed_and_index(jobs) == ['job1', 'job2']
+    
+    def test_embed_and_index_batch_fallback(self, monkeypatch, mock_embedding_service, mock_pinecone):
+        """Test a failed batch is embedded chunk by chunk and only failed chunks are dropped"""
+        jobs = [
+            {'id': 'job1', 'text': JOB_TEXT},
+            {'id': 'job2', 'text': f'Job 2. {JOB_TEXT}'}
+        ]
+        
+        mock_get_embedding = Mock(side_effect=[FAKE_EMB, EmbeddingServiceError("Service failed")])
+        monkeypatch.setattr(indexing, 'get_embeddings_batch', Mock(side_effect=EmbeddingServiceError("Service failed")))
+        monkeypatch.setattr(indexing, 'get_embedding', mock_get_embedding)
+        
+        # job2 lost its chunk, so only job1 may be marked as seen
+        assert embed_and_index(jobs) == ['job1']
+        
+        assert mock_get_embedding.call_count == 2
+        call_args = mock_pinecone['index'].upsert.call_args[1]['vectors']
+        assert [vector['id'] for vector in call_args] == ['job1_chunk_0']
+    
+    def test_embed_and_index_batch_model_error_falls_back(self, monkeypatch, mock_embedding_service, mock_pinecone):
+        """Test errors other than EmbeddingServiceError from the batch call also fall back per chunk"""
+        jobs = [{'id': 'job1', 'text': JOB_TEXT}]
+        
+        monkeypatch.setattr(indexing, 'get_embeddings_batch', Mock(side_effect=RuntimeError("CUDA out of memory")))
+        monkeypatch.setattr(indexing, 'get_embedding', Mock(return_value=FAKE_EMB))
+        
+        assert embed_and_index(jobs) == ['job1']
+        mock_pinecone['index'].upsert.assert_called_once()
+    
+    def test_embed_and_index_pinecone_failure(self, monkeypatch, mock_embedding_service, mock_pinecone):
         """Test embed_and_index when Pinecone upsert fails"""
-        jobs = [{'id': 'job1', 'text': 'Test job'}]
-        
-        with patch('indexing.index', mock_pinecone['index']), \
-             patch('indexing.get_embedding') as mock_get_embedding:
-            
-            mock_get_embedding.return_value = [0.1] * 768
-            mock_pinecone['index'].upsert.side_effect = Exception("Pinecone error")
-            
-            with pytest.raises(Exception, match="Pinecone error"):
-                embed_and_index(jobs)
\ No newline at end of file
+        jobs = [{'id': 'job1', 'text': JOB_TEXT}]
+        
+        monkeypatch.setattr(indexing, 'get_embeddings_batch', Mock(side_effect=lambda texts: [FAKE_EMB] * len(texts)))
+        mock_pinecone['index'].upsert.side_effect = Exception("Pinecone error")
+        
+        with pytest.raises(Exception, match="Pinecone error"):
+            embed_and_index(jobs)
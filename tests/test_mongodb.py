@@ -1,130 +1,107 @@
 #!/usr/bin/env python3
 """
-Simple test script for MongoDB user tracking functionality
+Tests for MongoDB user tracking functionality.
+
+These run against the MongoDB configured for the app and are skipped when it
+is not configured or not reachable. Every test works on its own throwaway
+user, so the cases are independent and can run on parallel workers
+(pytest -n auto); the destructive save -> update -> remove walk stays in a
+single test.
 """
 
-import sys
-import json
-from datetime import datetime
-from mongodb_service import mongodb_service, MongoDBServiceError
+import asyncio
+import uuid
+
+import pytest
+import pytest_asyncio
+
+try:
+    from src.job_search.db.mongodb import mongodb_service, MongoDBServiceError, JobAlreadySavedError
+except Exception as e:  # settings validation raises when the environment is incomplete
+    pytest.skip(f"MongoDB service not importable: {e}", allow_module_level=True)
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-def test_mongodb_functionality():
-    """Test all MongoDB user tracking features"""
-    
+TEST_JOB_DATA = {
+    "text": "Senior Python Developer at Tech Corp - Remote position with competitive salary...",
+    "score": 0.95,
+    "vector_score": 0.88,
+    "cross_score": 0.95,
+    "source": "test"
+}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def service():
+    """The app's MongoDB service, connected once for the whole module"""
     if not mongodb_service:
-        print("ERROR: MongoDB service not initialized")
-        return False
-    
-    print("Testing MongoDB User Tracking Functionality\n")
-    
-    # Test data
-    test_user_id = "test_user_123"
-    test_job_id = "job_test_456"
-    test_job_data = {
-        "text": "Senior Python Developer at Tech Corp - Remote position with competitive salary...",
-        "score": 0.95,
-        "vector_score": 0.88,
-        "cross_score": 0.95,
-        "source": "test"
-    }
-    
+        pytest.skip("MongoDB service not initialized")
     try:
-        # 1. Test health check
-        print("1. Testing MongoDB health check...")
-        health = mongodb_service.health_check()
-        print(f"   Health status: {health['status']}")
-        if health['status'] != 'healthy':
-            print(f"   Error: {health.get('error', 'Unknown error')}")
-            return False
-        print("   SUCCESS: MongoDB connection healthy\n")
-        
-        # 2. Test saving a job
-        print("2. Testing job saving...")
-        success = mongodb_service.save_job(test_user_id, test_job_id, test_job_data)
-        if success:
-            print("   SUCCESS: Job saved successfully")
-        else:
-            print("   ERROR: Failed to save job")
-            return False
-        print()
-        
-        # 3. Test getting saved jobs
-        print("3. Testing job retrieval...")
-        saved_jobs = mongodb_service.get_saved_jobs(test_user_id)
-        if saved_jobs and len(saved_jobs) > 0:
-            print(f"   SUCCESS: Retrieved {len(saved_jobs)} saved jobs")
-            job = saved_jobs[0]
-            print(f"   Job ID: {job['job_id']}")
-            print(f"   Status: {job['status']}")
-            print(f"   Saved at: {job['saved_at']}")
-        else:
-            print("   ERROR: No saved jobs found")
-            return False
-        print()
-        
-        # 4. Test updating job status
-        print("4. Testing job status update...")
-        success = mongodb_service.update_job_status(
-            test_user_id, 
-            test_job_id, 
-            "applied", 
-            "Applied through company website"
-        )
-        if success:
-            print("   SUCCESS: Job status updated successfully")
-        else:
-            print("   ERROR: Failed to update job status")
-            return False
-        print()
-        
-        # 5. Test getting job statistics
-        print("5. Testing job statistics...")
-        stats = mongodb_service.get_job_stats(test_user_id)
-        print(f"   Total jobs: {stats['total']}")
-        print(f"   By status: {stats['by_status']}")
-        print(f"   Recent activity: {stats['recent_activity']}")
-        print("   SUCCESS: Statistics retrieved successfully\n")
-        
-        # 6. Test filtering by status
-        print("6. Testing status filtering...")
-        applied_jobs = mongodb_service.get_saved_jobs(test_user_id, status="applied")
-        if applied_jobs and len(applied_jobs) > 0:
-            print(f"   SUCCESS: Found {len(applied_jobs)} applied jobs")
-        else:
-            print("   ERROR: No applied jobs found after status update")
-            return False
-        print()
-        
-        # 7. Test removing a job
-        print("7. Testing job removal...")
-        success = mongodb_service.remove_saved_job(test_user_id, test_job_id)
-        if success:
-            print("   SUCCESS: Job removed successfully")
-        else:
-            print("   ERROR: Failed to remove job")
-            return False
-        print()
-        
-        # 8. Verify job was removed
-        print("8. Verifying job removal...")
-        remaining_jobs = mongodb_service.get_saved_jobs(test_user_id)
-        if len(remaining_jobs) == 0:
-            print("   SUCCESS: Job successfully removed from database")
-        else:
-            print(f"   ERROR: Job still exists: {len(remaining_jobs)} jobs remaining")
-            return False
-        print()
-        
-        print("SUCCESS: All MongoDB tests passed successfully!")
-        return True
-        
+        await mongodb_service.connect()
     except MongoDBServiceError as e:
-        print(f"ERROR: MongoDB service error: {e}")
-        return False
-    except Exception as e:
-        print(f"ERROR: Unexpected error: {e}")
-        return False
-
-if __name__ == "__main__":
-    success = test_mongodb_functionality()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+        pytest.skip(f"MongoDB not reachable: {e}")
+
+    yield mongodb_service
+    await mongodb_service.close_connection()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def user_id(service):
+    """A unique user for one test, deleted afterwards"""
+    test_user_id = f"test_user_{uuid.uuid4().hex[:8]}"
+    yield test_user_id
+    await service.db.users.delete_one({"user_id": test_user_id})
+
+
+async def test_health_check(service):
+    health = await service.health_check()
+    assert health["status"] == "healthy", health.get("error", "Unknown error")
+
+
+async def test_required_indexes_exist(service):
+    # save_job relies on the unique user_id index to detect already-saved jobs
+    assert await service.missing_indexes() == []
+
+
+async def test_saved_job_lifecycle(service, user_id):
+    job_id = "job_test_456"
+
+    assert await service.save_job(user_id, job_id, TEST_JOB_DATA)
+    with pytest.raises(JobAlreadySavedError):
+        await service.save_job(user_id, job_id, TEST_JOB_DATA)
+
+    saved_jobs = await service.get_saved_jobs(user_id)
+    assert [job["job_id"] for job in saved_jobs] == [job_id]
+    assert saved_jobs[0]["status"] == "saved"
+
+    assert await service.update_job_status(user_id, job_id, "applied", "Applied through company website")
+
+    # Both reads only observe the update, so issue them together
+    stats, applied_jobs = await asyncio.gather(
+        service.get_job_stats(user_id),
+        service.get_saved_jobs(user_id, status="applied")
+    )
+    assert stats["total"] == 1
+    assert stats["by_status"] == {"applied": 1}
+    assert stats["recent_activity"] == 1
+    assert [job["job_id"] for job in applied_jobs] == [job_id]
+
+    assert await service.remove_saved_job(user_id, job_id)
+
+    remaining_jobs, remaining_stats = await asyncio.gather(
+        service.get_saved_jobs(user_id),
+        service.get_job_stats(user_id)
+    )
+    assert remaining_jobs == []
+    assert remaining_stats["total"] == 0
+
+
+async def test_bulk_save_jobs(service, user_id):
+    jobs = [(f"job_bulk_{i}", TEST_JOB_DATA) for i in range(3)]
+
+    # Repeated job IDs within a batch are saved once
+    assert await service.bulk_save_jobs(user_id, jobs + jobs[:1]) == ["job_bulk_0", "job_bulk_1", "job_bulk_2"]
+
+    # Already-saved jobs are skipped instead of failing the batch
+    assert await service.bulk_save_jobs(user_id, [jobs[1], ("job_bulk_3", TEST_JOB_DATA)]) == ["job_bulk_3"]
+    assert await service.count_saved_jobs(user_id) == 4
@@ -6,7 +6,18 @@ from job descriptions including skills, experience, salary, and other entities.
 """
 
 import pytest
-from src.job_search.ml.ner import extract_job_metadata, JobMetadataExtractor
+from src.job_search.ml import ner
+from src.job_search.ml.ner import (
+    extract_job_metadata, extract_job_metadata_batch, get_metadata_extractor, JobMetadataExtractor
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_metadata_cache():
+    """Start every test with an empty metadata cache so results are really extracted"""
+    ner._metadata_cache.clear()
+    yield
+    ner._metadata_cache.clear()
 
 class TestNERExtraction:
     """Test cases for NER metadata extraction"""
@@ -195,6 +206,44 @@ class TestNERExtraction:
         assert metadata.get('remote_work') == True, "Should detect remote work"
         assert len(metadata.get('education', [])) >= 1, "Should extract education requirements"
         assert len(metadata.get('benefits', [])) >= 2, "Should extract multiple benefits"
+    
+    def test_batch_extraction(self):
+        """Test that batch extraction matches per-text extraction"""
+        job_texts = [
+            "Senior Python Developer with 5+ years of experience in Django",
+            "",
+            "Job",
+            "Remote role paying $100,000 - $130,000 with health insurance",
+        ]
+        
+        batch = extract_job_metadata_batch(job_texts)
+        
+        assert len(batch) == len(job_texts)
+        for text, metadata in zip(job_texts, batch):
+            if len(text) < ner.MIN_METADATA_TEXT_LENGTH:
+                # Too short to extract from; both paths return the empty template
+                assert metadata == extract_job_metadata(text)
+                continue
+            # Straight from the extractor, bypassing the cache the batch just filled
+            expected = get_metadata_extractor().extract_metadata(text)
+            assert sorted(metadata['skills']) == sorted(expected['skills'])
+            assert {k: v for k, v in metadata.items() if k != 'skills'} == \
+                {k: v for k, v in expected.items() if k != 'skills'}
+    
+    def test_repeated_text_uses_cache(self, monkeypatch):
+        """Test that a repeated job text is served from the metadata cache"""
+        job_text = "Staff Rust engineer, 7+ years of experience, fully remote"
+        first = extract_job_metadata(job_text)
+        
+        def fail_extraction(*args, **kwargs):
+            raise AssertionError("cached text was extracted again")
+        monkeypatch.setattr(get_metadata_extractor(), "extract_metadata", fail_extraction)
+        monkeypatch.setattr(get_metadata_extractor(), "extract_batch", fail_extraction)
+        
+        second = extract_job_metadata(job_text)
+        assert second == first
+        assert second is not first, "Callers should get their own copy"
+        assert extract_job_metadata_batch([job_text]) == [first]
 
 class TestNERWithoutSpaCy:
     """Test NER functionality when spaCy is not available (regex-only mode)"""
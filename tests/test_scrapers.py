@@ -0,0 +1,234 @@
+"""
+Tests for the job scrapers and the crawl-time deduplication and filtering.
+
+The Hacker News parser is checked against the BeautifulSoup implementation
+it replaced, with the page fed in small byte chunks so tags and entities are
+split across chunk boundaries. Deduplication and filtering are checked
+against straightforward reference versions of the original loops.
+"""
+
+import hashlib
+import random
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from src.job_search.scraping import scrapers
+from src.job_search.scraping.scrapers import (
+    _iter_top_level_comments, get_job_postings, deduplicate_jobs, filter_jobs
+)
+
+HN_URL = "https://news.ycombinator.com/item?id=1"
+
+POSTING = (
+    "Acme Corp | Senior Python Engineer | Remote (US) | $150k-$180k<p>"
+    "We build data pipelines with <i>Django</i> &amp; PostgreSQL. "
+    "Apply at <a href=\"https://acme.example/jobs\">acme.example/jobs</a>"
+)
+
+
+def _comment_row(comment_id, indent, body):
+    """One HN comment row; the body sits in nested layout rows like the real page"""
+    return (
+        f'<tr class="athing comtr" id="{comment_id}"><td><table border="0"><tr>'
+        f'<td class="ind" indent="{indent // 40}"><img src="s.gif" height="1" width="{indent}"></td>'
+        f'<td class="default"><div class="comment"><div class="commtext c00">{body}</div>'
+        f'<div class="reply"><p><font size="1"><u><a href="reply?id={comment_id}">reply</a></u></font></p></div>'
+        f'</div></td></tr></table></td></tr>'
+    )
+
+
+def _thread_page():
+    """A synthetic thread with replies, dead, short and entity-heavy comments"""
+    rows = [
+        _comment_row(101, 0, POSTING),
+        _comment_row(102, 40, "Reply: is this role open to contractors in Canada? " * 2),
+        _comment_row(103, 80, "Nested reply that is long enough to pass the length filter on its own."),
+        _comment_row(104, 0, "[dead]"),
+        _comment_row(105, 0, "Too short"),
+        _comment_row(106, 0, "Globex | Staff Engineer | Berlin &lt;onsite&gt; | Rust, Go, Kubernetes<p>Visa sponsorship.</p>"),
+        _comment_row(107, 0, "[dead] Flagged posting that is long enough but must still be dropped entirely"),
+        _comment_row(108, 0, POSTING.replace("Acme Corp", "Initech")),
+    ]
+    return (
+        '<html><head><title>Ask HN: Who is hiring?</title></head><body><center>'
+        '<table id="hnmain"><tr><td><table class="comment-tree">'
+        + ''.join(rows) +
+        '</table></td></tr></table></center></body></html>'
+    ).encode()
+
+
+def _reference_postings(page):
+    """The original BeautifulSoup scraper's parsing and filtering"""
+    soup = BeautifulSoup(page, 'html.parser')
+    postings = []
+    for comment in soup.find_all('tr', class_='athing comtr'):
+        if not comment.find('img', width='0'):
+            continue
+        comment_id = comment.get('id')
+        comment_text_div = comment.find('div', class_='commtext')
+        if comment_id and comment_text_div:
+            text = comment_text_div.get_text(separator='\n', strip=True)
+            if text and len(text) > 50 and "[dead]" not in text:
+                postings.append({'id': f"hn_{comment_id}", 'text': text})
+    return postings
+
+
+def _chunks(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestHackerNewsParsing:
+    """Test cases for the incremental Hacker News thread parser"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 65536])
+    def test_top_level_comments_across_chunk_boundaries(self, chunk_size):
+        """Test small chunks split tags and entities without changing the parsed comments"""
+        page = _thread_page()
+        
+        comments = list(_iter_top_level_comments(_chunks(page, chunk_size)))
+        
+        expected = _reference_postings(page)
+        kept = [
+            {'id': f"hn_{comment_id}", 'text': text}
+            for comment_id, text in comments
+            if text and len(text) > 50 and "[dead]" not in text
+        ]
+        assert kept == expected
+        # Replies are skipped no matter how deep they are nested
+        assert [comment_id for comment_id, _ in comments] == ['101', '104', '105', '106', '107', '108']
+
+    def test_get_job_postings_streams_response(self, requests_mock, monkeypatch):
+        """Test get_job_postings parses a streamed response into the original postings"""
+        page = _thread_page()
+        monkeypatch.setattr(scrapers, '_HN_CHUNK_SIZE', 5)
+        requests_mock.get(HN_URL, content=page)
+        
+        postings = get_job_postings(HN_URL)
+        
+        assert postings == _reference_postings(page)
+        assert [posting['id'] for posting in postings] == ['hn_101', 'hn_106', 'hn_108']
+        assert postings[0]['text'].splitlines()[1] == "We build data pipelines with"
+        assert "Django" in postings[0]['text'] and "& PostgreSQL" in postings[0]['text']
+
+    def test_get_job_postings_http_error(self, requests_mock):
+        """Test a failed request yields no postings instead of raising"""
+        requests_mock.get(HN_URL, status_code=503)
+        
+        assert get_job_postings(HN_URL) == []
+
+
+def _reference_deduplicate(jobs):
+    """The original SHA-256 based deduplication loop"""
+    seen_hashes = set()
+    kept = []
+    for job in jobs:
+        normalized = re.sub(r'\s+', ' ', job['text'].lower().strip())
+        normalized = re.sub(r'[^\w\s]', '', normalized)
+        job_hash = hashlib.sha256(normalized.encode()).hexdigest()
+        if job_hash not in seen_hashes:
+            seen_hashes.add(job_hash)
+            kept.append(job)
+    return kept
+
+
+def _reference_filter(jobs, keywords=None, locations=None, exclude_keywords=None):
+    """The original per-term substring filtering loop"""
+    if not any([keywords, locations, exclude_keywords]):
+        return jobs
+    kept = []
+    for job in jobs:
+        text = job['text'].lower()
+        if exclude_keywords and any(term.lower() in text for term in exclude_keywords):
+            continue
+        if keywords and not any(term.lower() in text for term in keywords):
+            continue
+        if locations and not any(term.lower() in text for term in locations):
+            continue
+        kept.append(job)
+    return kept
+
+
+class SetSeenFilter:
+    """In-memory stand-in for SeenJobFilter's membership check"""
+
+    def __init__(self, job_ids):
+        self.job_ids = set(job_ids)
+
+    def contains_many(self, job_ids):
+        return [job_id in self.job_ids for job_id in job_ids]
+
+
+def _random_jobs(count, seed):
+    """Jobs with exact, case, whitespace and punctuation duplicates plus long shared prefixes"""
+    rng = random.Random(seed)
+    words = ["python", "Remote", "senior", "engineer", "Berlin", "go", "rust", "data", "team", "salary", "k8s"]
+    shared_prefix = ' '.join(rng.choice(words) for _ in range(80))
+    jobs = []
+    for i in range(count):
+        kind = rng.random()
+        if jobs and kind < 0.25:
+            text = rng.choice(jobs)['text']
+            text = rng.choice([text, text.upper(), f"  {text}\n", text.replace(' ', ' , ', 1)])
+        elif kind < 0.5:
+            # Same first 64+ words, so only the full-text hash can tell them apart
+            text = f"{shared_prefix} {rng.choice(words)} {rng.randint(0, 3)}"
+        else:
+            text = ' '.join(rng.choice(words) for _ in range(rng.randint(1, 30)))
+        jobs.append({'id': f"job_{i}", 'text': text})
+    return jobs
+
+
+class TestDeduplication:
+    """Test cases for crawl-time deduplication"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_reference(self, seed):
+        """Test prefix-bucketed deduplication keeps exactly the jobs the original loop kept"""
+        jobs = _random_jobs(300, seed)
+        
+        assert deduplicate_jobs(jobs) == _reference_deduplicate(jobs)
+
+    def test_uses_precomputed_lowercase_text(self):
+        """Test jobs carrying '_text_lower' deduplicate the same way"""
+        jobs = _random_jobs(200, 42)
+        with_lower = [dict(job, _text_lower=job['text'].lower()) for job in jobs]
+        
+        kept = deduplicate_jobs(with_lower)
+        
+        assert [job['id'] for job in kept] == [job['id'] for job in _reference_deduplicate(jobs)]
+
+    def test_seen_jobs_counted_separately(self):
+        """Test jobs from earlier crawls are skipped and counted apart from duplicates"""
+        jobs = [
+            {'id': 'a', 'text': 'Python engineer, remote'},
+            {'id': 'b', 'text': 'Python  engineer remote!'},
+            {'id': 'c', 'text': 'Rust engineer in Berlin'},
+            {'id': 'd', 'text': 'Go engineer in Austin'},
+        ]
+        
+        kept, previously_seen = deduplicate_jobs(jobs, seen_filter=SetSeenFilter({'c', 'd'}), return_seen_count=True)
+        
+        assert [job['id'] for job in kept] == ['a']
+        assert previously_seen == 2
+        assert deduplicate_jobs(jobs, seen_filter=SetSeenFilter({'c', 'd'})) == kept
+
+
+class TestFiltering:
+    """Test cases for keyword, location and exclusion filtering"""
+
+    @pytest.mark.parametrize("criteria", [
+        {},
+        {'keywords': ['python', 'Rust']},
+        {'locations': ['berlin'], 'exclude_keywords': ['SENIOR']},
+        {'keywords': ['go'], 'locations': ['remote', 'team'], 'exclude_keywords': ['salary', 'k8s']},
+        {'keywords': ['']},
+        {'exclude_keywords': ['']},
+        {'keywords': ['no such term']},
+    ])
+    def test_matches_reference(self, criteria):
+        """Test the automaton-based filters keep exactly the jobs the original loops kept"""
+        jobs = _random_jobs(300, 7)
+        
+        assert filter_jobs(jobs, **criteria) == _reference_filter(jobs, **criteria)
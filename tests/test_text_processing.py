@@ -9,6 +9,7 @@ import pytest
 from src.job_search.ml.text_processing import (
     AdvancedTextProcessor, 
     process_job_text, 
+    process_jobs_batch,
     clean_job_text,
     TextChunk
 )
@@ -207,7 +208,28 @@ class TestTextChunking:
             assert chunk.parent_job_id == job_id
             assert chunk.chunk_type == 'segment'
             assert isinstance(chunk.chunk_index, int)
-    
+
+    def test_overlapping_chunking_stride(self):
+        """Test configurable stride for overlapping chunks"""
+        # Default stride is three quarters of the chunk size
+        processor = AdvancedTextProcessor(max_chunk_size=40)
+        assert processor.stride == 30
+        assert processor.overlap_size == 10
+
+        # A stride larger than the chunk size skips words between chunks
+        processor = AdvancedTextProcessor(max_chunk_size=50, stride=60, min_chunk_size=1)
+        long_text = " ".join([f"Word{i}" for i in range(200)])
+        chunks = processor.create_chunks(long_text, "stride_job", strategy='overlapping')
+
+        assert [chunk.text.split()[0] for chunk in chunks] == ['Word0', 'Word60', 'Word120', 'Word180']
+        assert chunks[-1].word_count == 20
+
+        # No empty trailing window when the next start lies past the last word
+        short_text = " ".join([f"Word{i}" for i in range(55)])
+        chunks = processor.create_chunks(short_text, "stride_job", strategy='overlapping')
+
+        assert [chunk.word_count for chunk in chunks] == [50]
+
     def test_section_based_chunking(self):
         """Test section-based chunking strategy"""
         processor = AdvancedTextProcessor(max_chunk_size=100)
@@ -265,6 +287,10 @@ class TestTextChunking:
         
         # Should fall back to overlapping for unsectioned content
         assert 'segment' in chunk_types2 or 'full' in chunk_types2
+        
+        # Single-line text skips section detection entirely
+        assert processor._may_have_sections(sectioned_text)
+        assert not processor._may_have_sections(unsectioned_text)
 
 class TestChunkQuality:
     """Test cases for chunk quality assessment"""
@@ -315,6 +341,22 @@ class TestChunkQuality:
             assert chunk.confidence_score >= 0.3
             assert chunk.word_count >= processor.min_chunk_size or chunk.word_count >= 8
 
+    def test_boilerplate_ratio_from_spans(self):
+        """Test boilerplate ratio lookup against precomputed spans"""
+        processor = AdvancedTextProcessor()
+
+        text = "Build APIs in Python.\nWe are an equal opportunity employer."
+        spans = processor._find_boilerplate_spans(text)
+
+        # Only the equal opportunity sentence should be matched
+        assert len(spans) == 1
+        assert text[spans[0][0]:spans[0][1]].startswith("We are")
+
+        # Ratio over the whole text, the clean prefix, and the boilerplate alone
+        assert 0.0 < processor._boilerplate_ratio(spans, 0, len(text)) < 1.0
+        assert processor._boilerplate_ratio(spans, 0, 21) == 0.0
+        assert processor._boilerplate_ratio(spans, spans[0][0], spans[0][1]) == 1.0
+
 class TestEndToEndProcessing:
     """End-to-end tests for complete processing pipeline"""
     
@@ -412,6 +454,27 @@ class TestEndToEndProcessing:
         assert stats['total_chunks'] == len(chunks)
         assert stats['avg_quality_score'] >= 0.0
         assert stats['avg_words_per_chunk'] > 0
+    
+    def test_average_quality_precision(self):
+        """Test the average quality score keeps full double precision, like a Python mean"""
+        processor = AdvancedTextProcessor()
+        scores = [0.1, 0.2, 0.7]
+        scored_chunks = [TextChunk(text="x", chunk_type="full", chunk_index=i, parent_job_id="j",
+                                   word_count=1, confidence_score=score) for i, score in enumerate(scores)]
+        avg = processor.get_processing_stats(scored_chunks)['avg_quality_score']
+        assert avg == pytest.approx(sum(scores) / len(scores), rel=1e-12)
+    
+    def test_batch_processing_matches_sequential(self):
+        """Test that parallel batch processing returns the same chunks in job order"""
+        jobs = [
+            {'id': f'batch_{i}', 'text': ' '.join(f'Word{j}' for j in range(150 + 200 * i))}
+            for i in range(4)
+        ]
+        
+        batched = process_jobs_batch(jobs, n_workers=2)
+        
+        assert batched == [process_job_text(job) for job in jobs]
+        assert [chunks[0].parent_job_id for chunks in batched] == [job['id'] for job in jobs]
 
 class TestErrorHandling:
     """Test error handling and edge cases"""
@@ -451,6 +514,15 @@ class TestErrorHandling:
         assert len(cleaned) > 0
         assert 'Job Title' in cleaned
         assert 'Description' in cleaned
+    
+    def test_unclosed_angle_brackets(self):
+        """Test that stray '<' characters without a closing '>' are kept as text"""
+        processor = AdvancedTextProcessor()
+        
+        # Thousands of unclosed '<' used to make tag stripping quadratic
+        cleaned = processor.clean_text("<b>Salary</b> " + "<" * 20000 + " negotiable")
+        
+        assert cleaned == "Salary " + "<" * 20000 + " negotiable"
 
 if __name__ == "__main__":
     # Run a simple test